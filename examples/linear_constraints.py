@@ -0,0 +1,79 @@
+"""Compare two translations of linear constraints to BDDs.
+
+A constraint like `3 * x - 5 * y + 7 * z <= 20` can be
+translated using bitvector adders and multipliers,
+or directly, by dynamic programming over the bits.
+This script reports the time of each translation,
+for increasing numbers of variables, and for
+increasing widths with the bits of the variables
+interleaved, least significant bits first.
+"""
+import time
+
+from omega.logic import bitvector as bv
+from omega.symbolic import fol as _fol
+
+
+def linear_constraint(n):
+    """Return constraint over `n` variables, and context."""
+    ctx = _fol.Context()
+    vrs = {'x{i}'.format(i=i): (-20, 40) for i in range(n)}
+    ctx.declare(**vrs)
+    terms = ' + '.join(
+        '{c} * x{i}'.format(c=(-1)**i * (2 * i + 3), i=i)
+        for i in range(n))
+    e = '{terms} <= {k}'.format(terms=terms, k=7 * n)
+    return e, ctx
+
+
+def interleaved_constraint(width):
+    """Return constraint over interleaved bits, and context."""
+    ctx = _fol.Context()
+    m = 2**(width - 1)
+    ctx.declare(x=(-m, m - 1), y=(-m, m - 1), z=(-m, m - 1))
+    bits = zip(*[ctx.vars[var]['bitnames'] for var in 'xyz'])
+    order = [b for level in bits for b in level]
+    ctx.bdd.configure(reordering=False)
+    ctx.bdd.reorder({b: i for i, b in enumerate(order)})
+    e = '3 * x + 5 * y - 7 * z <= 12345'
+    return e, ctx
+
+
+def compare(e, ctx):
+    """Return BDD and times with and without adders."""
+    results = dict()
+    for linear in (False, True):
+        t0 = time.time()
+        u = bv.bitblast_to_bdd(
+            e, ctx.vars, ctx.bdd, linear=linear)
+        t1 = time.time()
+        results[linear] = (u, t1 - t0)
+    u, t_adders = results[False]
+    v, t_linear = results[True]
+    assert u == v, e
+    return u, t_adders, t_linear
+
+
+def benchmark(n):
+    e, ctx = linear_constraint(n)
+    u, t_adders, t_linear = compare(e, ctx)
+    print((
+        '{n} variables: {nodes} nodes, adders: {ta:.3f} sec, '
+        'linear: {tl:.3f} sec').format(
+            n=n, nodes=len(u), ta=t_adders, tl=t_linear))
+
+
+def benchmark_interleaved(width):
+    e, ctx = interleaved_constraint(width)
+    u, t_adders, t_linear = compare(e, ctx)
+    print((
+        '{w} interleaved bits: {nodes} nodes, adders: {ta:.3f} sec, '
+        'linear: {tl:.3f} sec').format(
+            w=width, nodes=len(u), ta=t_adders, tl=t_linear))
+
+
+if __name__ == '__main__':
+    for n in range(2, 9, 2):
+        benchmark(n)
+    for width in (12, 16, 20, 24):
+        benchmark_interleaved(width)
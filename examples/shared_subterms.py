@@ -0,0 +1,45 @@
+"""Bitblast a formula that repeats arithmetic subterms.
+
+Generated specifications often repeat subterms, like `x + y`
+or `ite(c, x, y)`. With sharing, each distinct subterm is
+flattened once. This script reports the time and the size of
+the bitvector formula in prefix syntax, with and without sharing,
+and the time of translating directly to a BDD.
+"""
+import time
+
+from omega.logic import bitvector as bv
+from omega.symbolic import fol as _fol
+
+
+def repeated_subterms(n):
+    """Return formula with `n` conjuncts, and context."""
+    ctx = _fol.Context()
+    ctx.declare(x=(0, 15), y=(0, 15), z=(-8, 7), c='bool')
+    s = '(x - y) * ite(c, x + y, z)'
+    e = r' /\ '.join(
+        '(({s}) + {i} * ({s}) != z + {i})'.format(s=s, i=i)
+        for i in range(n))
+    return e, ctx
+
+
+def benchmark(n):
+    e, ctx = repeated_subterms(n)
+    for share in (False, True):
+        t0 = time.time()
+        f = bv.bitblast(e, ctx.vars, share=share)
+        t1 = time.time()
+        u = bv.bitblast_to_bdd(e, ctx.vars, ctx.bdd, share=share)
+        t2 = time.time()
+        print((
+            '{n} conjuncts, share={share}: '
+            'prefix: {size} chars in {tp:.3f} sec, '
+            'BDD: {tb:.3f} sec').format(
+                n=n, share=share, size=len(f),
+                tp=t1 - t0, tb=t2 - t1))
+
+
+if __name__ == '__main__':
+    benchmark(1)  # build parser tables
+    for n in (4, 16, 64):
+        benchmark(n)
@@ -0,0 +1,44 @@
+"""Time importing `omega` and parsing a first formula.
+
+Short-lived scripts spend most of their time in startup.
+Each measurement runs in a fresh interpreter, so that
+no modules are cached, and the minimum over a few runs
+is reported.
+"""
+import subprocess
+import sys
+import time
+
+
+STATEMENTS = [
+    ('import dd.cudd', 'import dd.cudd'),
+    ('import omega.symbolic.temporal',
+        'import omega.symbolic.temporal'),
+    ('first `add_expr`',
+        'from omega.symbolic import fol\n'
+        'ctx = fol.Context()\n'
+        'ctx.declare(x=(0, 5))\n'
+        "ctx.add_expr('x + 1 < 3')")]
+
+
+def startup_time(code, repeat=7):
+    """Return seconds to run `code` in a new interpreter."""
+    times = list()
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        subprocess.check_call([sys.executable, '-c', code])
+        t1 = time.perf_counter()
+        times.append(t1 - t0)
+    return min(times)
+
+
+def main():
+    t = startup_time('pass')
+    print('interpreter: {t:.3f} sec'.format(t=t))
+    for name, code in STATEMENTS:
+        t = startup_time(code)
+        print('{name}: {t:.3f} sec'.format(name=name, t=t))
+
+
+if __name__ == '__main__':
+    main()
@@ -16,21 +16,26 @@ try:
     from collections.abc import Sequence
 except ImportError:
     from collections import Sequence
+import array
 import copy
 from itertools import chain
 import logging
-
-import networkx as nx
+import multiprocessing
+import time
 
 from omega.logic import syntax as stx
+from omega.symbolic import enumeration as senum
+from omega.symbolic import partition as prt
 from omega.symbolic import prime as prm
 from omega.symbolic import symbolic
+from omega.symbolic import transfer
 
 
 log = logging.getLogger(__name__)
 
 
-def action_to_steps(aut, env, sys, qinit='\A \A'):
+def action_to_steps(
+        aut, env, sys, qinit='\A \A', bfs=False, workers=1):
     r"""Return enumerated graph with steps as edges.
 
     Enumeration is done based on `qinit`:
@@ -47,7 +52,99 @@ def action_to_steps(aut, env, sys, qinit='\A \A'):
     - `'\E \A'`: pick a system state `y` that satisfies
       `\A x:  aut.init[sys]`,
       and enumerate all environment states `x` that satisfy `aut.init['env']`.
+
+    Actions that are partitions (`omega.symbolic.partition`)
+    are conjoined, because each step cofactors them.
+
+    If `bfs`, then enumerate breadth-first, with the steps
+    from each frontier enumerated from a single BDD.
+
+    If `workers > 1`, then the initial states are partitioned
+    among that many processes. Each process loads `aut` in its
+    own BDD manager (`omega.symbolic.transfer`), and enumerates
+    from its initial states. The partial graphs are merged by
+    state, so a state reached by several processes becomes one
+    node. Processes can respond differently to the same env
+    move, so the merged graph keeps the response with the
+    smallest node number, and the nodes that remain reachable.
+    So the result is a strategy, as for `workers=1`.
+    For deterministic strategies, the result is the same
+    graph as for `workers=1`, up to node numbering.
+    """
+    _aut = _players_automaton(aut, env, sys)
+    if workers > 1:
+        return _parallel_action_to_steps(_aut, qinit, bfs, workers)
+    return _action_to_steps(_aut, qinit, bfs)
+
+
+def iter_action_steps(aut, env, sys, qinit='\A \A', bfs=False):
+    """Yield the steps of `action_to_steps` as they are enumerated.
+
+    Each step is a `tuple`
+    `(source, target, source_state, target_state)`,
+    where `source, target` are integer nodes, and
+    `source_state, target_state` are `dict`s that
+    assign values to variables.
+    Each initial node `v` is yielded first,
+    as the step `(None, v, None, state)`.
+
+    No graph is constructed. The states are stored once,
+    as `tuple`s, to recognize revisited nodes.
+    Sinks are in `omega.symbolic.enumeration`.
+
+    For the arguments, read `action_to_steps`.
+    """
+    _aut = _players_automaton(aut, env, sys)
+    vrs = set(_aut.varlist['env']).union(_aut.varlist['sys'])
+    g = _StateTable(vrs)
+    if bfs:
+        steps = _action_steps_bfs(_aut, qinit, g)
+    else:
+        steps = _action_steps(_aut, qinit, g)
+    return _with_states(steps, g)
+
+
+def enumerate_state_machine(init, action, aut, bfs=False):
+    """Return graph of `action` steps enumerated from `init`.
+
+    If `bfs`, then enumerate breadth-first:
+    the image of each frontier is computed symbolically,
+    and its steps are enumerated from `frontier /\ action`.
+    The result is the same graph, up to node numbering.
+
+    @param action: BDD or `partition.Partition`
+    @rtype: `networkx.DiGraph`
     """
+    import networkx as nx
+    action = prt.conjoin(action)
+    g = nx.DiGraph()
+    if bfs:
+        steps = _state_machine_steps_bfs(init, action, aut, g)
+    else:
+        steps = _state_machine_steps(init, action, aut, g)
+    _add_steps(steps, g)
+    return g
+
+
+def iter_state_machine_steps(init, action, aut, bfs=False):
+    """Yield the steps of `enumerate_state_machine`.
+
+    The steps are yielded as described in `iter_action_steps`.
+    """
+    action = prt.conjoin(action)
+    vrs = (
+        prm.vars_in_support(init, aut) |
+        prm.vars_in_support(action, aut))
+    g = _StateTable(vrs)
+    if bfs:
+        steps = _state_machine_steps_bfs(init, action, aut, g)
+    else:
+        steps = _state_machine_steps(init, action, aut, g)
+    return _with_states(steps, g)
+
+
+def _players_automaton(aut, env, sys):
+    """Return copy of `aut` with players `env` and `sys`."""
     _aut = copy.copy(aut)
     _aut.moore = aut.moore
     _aut.varlist.update(
@@ -56,57 +153,145 @@ def action_to_steps(aut, env, sys, qinit='\A \A'):
     _aut.init.update(
         env=aut.init[env],
         sys=aut.init[sys])
+    # enumeration cofactors the actions as BDDs
     _aut.action.update(
-        env=aut.action[env],
-        sys=aut.action[sys])
+        env=prt.conjoin(aut.action[env]),
+        sys=prt.conjoin(aut.action[sys]))
     _aut.prime_varlists()
-    return _action_to_steps(_aut, qinit)
+    return _aut
 
 
-def enumerate_state_machine(init, action, aut):
-    """Return graph of `action` steps enumerated from `init`.
+def _add_steps(steps, g):
+    """Add to graph `g` the edges from `steps`.
 
-    @rtype: `networkx.DiGraph`
+    @param steps: iterable of pairs `(u, v)`,
+        with `u is None` for initial nodes `v`
+    @return: initial nodes
+    @rtype: `set`
+    """
+    initial_nodes = set()
+    for u, v in steps:
+        if u is None:
+            initial_nodes.add(v)
+        else:
+            g.add_edge(u, v)
+    return initial_nodes
+
+
+def _with_states(steps, g):
+    """Yield `steps` with the states of nodes from `g`."""
+    for u, v in steps:
+        if u is None:
+            yield u, v, None, g.nodes[v]
+        else:
+            yield u, v, g.nodes[u], g.nodes[v]
+
+
+def _state_machine_steps(init, action, aut, g):
+    """Yield steps of `action` from `init`, depth-first.
+
+    Nodes are added to `g`. Read `_add_steps`.
     """
     assert init != aut.false
     assert action != aut.false
+    t0 = time.time()
     vrs = (
         prm.vars_in_support(init, aut) |
         prm.vars_in_support(action, aut))
-    g = nx.DiGraph()
     keys = list(vrs)
     umap = dict()
     init_iter = aut.pick_iter(init, vrs)
-    visited = aut.false
     queue = list()
     for d in init_iter:
-        _add_new_node(d, g, queue, umap, keys)
-        visited = _add_to_visited(d, visited, aut)
+        node = _add_new_node(d, g, queue, umap, keys)
+        yield None, node
     while queue:
         node = queue.pop()
         values = g.nodes[node]
         u = aut.let(values, action)
         u = prm.unprime(u, aut)
         for d in aut.pick_iter(u, vrs):
-            if aut.let(d, visited) != aut.true:
+            key = _node_tuple(d, keys)
+            if key in umap:
+                next_node = umap[key]
+            else:
                 next_node = _add_new_node(d, g, queue, umap, keys)
-                visited = _add_to_visited(d, visited, aut)
-            next_node = _find_node(d, umap, keys)
-            g.add_edge(node, next_node)
+            yield node, next_node
+    _log_rate(g, t0)
+
+
+def _state_machine_steps_bfs(init, action, aut, g):
+    """Breadth-first variant of `_state_machine_steps`."""
+    assert init != aut.false
+    assert action != aut.false
+    t0 = time.time()
+    vrs = (
+        prm.vars_in_support(init, aut) |
+        prm.vars_in_support(action, aut))
+    keys = list(vrs)
+    primed_keys = [stx.prime(var) for var in keys]
+    care_vars = keys + primed_keys
+    umap = dict()
+    queue = list()
+    for d in aut.pick_iter(init, vrs):
+        node = _add_new_node(d, g, queue, umap, keys)
+        yield None, node
+    frontier = init
+    reached = init
+    while frontier != aut.false:
+        steps = frontier & action
+        image = prm.unprime(aut.exist(vrs, steps), aut)
+        frontier = image & ~ reached
+        reached |= frontier
+        # number the new nodes as a batch
+        for d in aut.pick_iter(frontier, vrs):
+            _add_new_node(d, g, queue, umap, keys)
+        for d in aut.pick_iter(steps, care_vars):
+            node = umap[_node_tuple(d, keys)]
+            next_node = umap[_node_tuple(d, primed_keys)]
+            yield node, next_node
+    _log_rate(g, t0)
+
+
+def _action_to_steps(aut, qinit, bfs=False):
+    import networkx as nx
+    g = nx.DiGraph()
+    if bfs:
+        steps = _action_steps_bfs(aut, qinit, g)
+    else:
+        steps = _action_steps(aut, qinit, g)
+    g.initial_nodes = _add_steps(steps, g)
     return g
 
 
-def _action_to_steps(aut, qinit):
+def _action_steps(aut, qinit, g, init_states=None):
+    """Yield steps of the game in `aut`, depth-first.
+
+    Nodes are added to `g`. Read `_add_steps`.
+
+    @param init_states: `list` of initial states,
+        as `dict`s. If `None`, then enumerate
+        initial states according to `qinit`.
+    """
     assert aut.action['sys'] != aut.false
+    t0 = time.time()
     primed_vars = _primed_vars_per_quantifier(aut.varlist)
     vrs = set(aut.varlist['env']).union(aut.varlist['sys'])
     unprime_vars = {stx.prime(var): var for var in vrs}
     # fix an order for tupling
     keys = list(vrs)
+    env_keys = list(aut.varlist['env'])
+    sys_keys = list(aut.varlist['sys'])
     umap = dict()  # map assignments -> node numbers
-    g = nx.DiGraph()
-    queue, visited = _init_search(g, aut, umap, keys, qinit)
-    g.initial_nodes = set(queue)
+    queue = _init_queue(g, aut, umap, keys, qinit, init_states)
+    for node in queue:
+        yield None, node
+    # index of visited nodes:
+    # env values -> sys values -> node
+    visited = dict()
+    for node in umap.values():
+        _add_to_visited(g.nodes[node], node, visited,
+                        env_keys, sys_keys)
     varnames = set(keys)
     symbolic._assert_support_moore(aut.action['sys'], aut)
     # search
@@ -124,63 +309,294 @@ def _action_to_steps(aut, qinit):
         assert u != aut.false
         sys = aut.let(values, u)
         assert sys != aut.false
+        successors = set()
         for next_env in env_iter:
             log.debug('next_env: {r}'.format(r=next_env))
             # no effect if `aut.moore`
             u = aut.let(next_env, sys)
             u = aut.let(unprime_vars, u)
+            assert u != aut.false
             env_values = {unprime_vars[var]: value
                           for var, value in next_env.items()}
-            v = aut.let(env_values, visited)
-            v, remain = _select_candidate_nodes(
-                u, v, aut, visited=True)
-            sys_values = aut.pick(
-                v, care_vars=aut.varlist['sys'])
-            d = dict(env_values)
-            d.update(sys_values)
-            # assert
-            u = aut.let(d, visited)
-            assert u == aut.true or u == aut.false
-            assert remain == (u == aut.true), remain
-            # find or add node
-            if remain:
-                next_node = _find_node(d, umap, keys)
+            env_key = _node_tuple(env_values, env_keys)
+            nodes = visited.get(env_key, dict())
+            # prefer already visited nodes
+            next_node = _find_visited_node(
+                u, nodes, sys_keys, aut)
+            if next_node is not None:
+                sys_values = {
+                    k: g.nodes[next_node][k] for k in sys_keys}
             else:
+                log.info('cannot remain in visited nodes')
+                sys_values = aut.pick(
+                    u, care_vars=aut.varlist['sys'])
+                d = dict(env_values)
+                d.update(sys_values)
                 next_node = _add_new_node(d, g, queue, umap, keys)
-                visited = _add_to_visited(d, visited, aut)
-            g.add_edge(node, next_node)
+                _add_to_visited(d, next_node, visited,
+                                env_keys, sys_keys)
+            if next_node not in successors:
+                successors.add(next_node)
+                yield node, next_node
             log.debug((
                 'next env: {e}\n'
                 'next sys: {s}\n').format(
                     e=env_values,
                     s=sys_values))
+    _log_rate(g, t0)
+
+
+def _action_steps_bfs(aut, qinit, g, init_states=None):
+    r"""Breadth-first variant of `_action_steps`.
+
+    For each frontier, the steps are enumerated from the BDD
+    `frontier /\ env_action /\ sys_action`, instead of
+    cofactoring the actions at each node and each env move.
+    The steps are then grouped by node and next env values,
+    and one sys response is chosen for each group,
+    preferring visited nodes.
+
+    All sys responses are enumerated, so this mode suits
+    strategies with few sys responses to each env move.
+    For deterministic strategies, the result is the same
+    graph as `_action_steps`, up to node numbering.
+    """
+    assert aut.action['sys'] != aut.false
+    t0 = time.time()
+    vrs = set(aut.varlist['env']).union(aut.varlist['sys'])
+    # fix an order for tupling
+    keys = list(vrs)
+    env_keys = list(aut.varlist['env'])
+    sys_keys = list(aut.varlist['sys'])
+    primed_env = [stx.prime(var) for var in env_keys]
+    primed_sys = [stx.prime(var) for var in sys_keys]
+    care_vars = keys + primed_env + primed_sys
+    umap = dict()  # map assignments -> node numbers
+    queue = _init_queue(g, aut, umap, keys, qinit, init_states)
+    for node in queue:
+        yield None, node
+    # index of visited nodes:
+    # env values -> sys values -> node
+    visited = dict()
+    for node in umap.values():
+        _add_to_visited(g.nodes[node], node, visited,
+                        env_keys, sys_keys)
+    symbolic._assert_support_moore(aut.action['sys'], aut)
+    # search
+    while queue:
+        log.debug('frontier of {n} nodes'.format(n=len(queue)))
+        frontier = aut.false
+        for node in queue:
+            frontier |= aut.assign_from(g.nodes[node])
+        env_steps = frontier & aut.action['env']
+        steps = env_steps & aut.action['sys']
+        # each env move has a sys response
+        u = aut.exist(primed_sys, env_steps)
+        v = aut.exist(primed_sys, steps)
+        assert u == v, 'sys cannot respond to some env moves'
+        # (node, next env values) -> list of next sys values
+        responses = dict()
+        for d in aut.pick_iter(steps, care_vars):
+            node = umap[_node_tuple(d, keys)]
+            env_key = _node_tuple(d, primed_env)
+            sys_key = _node_tuple(d, primed_sys)
+            k = (node, env_key)
+            responses.setdefault(k, list()).append(sys_key)
+        queue = list()
+        edges = set()
+        for (node, env_key), sys_options in responses.items():
+            nodes = visited.get(env_key, dict())
+            # prefer already visited nodes
+            next_node = next(
+                (nodes[k] for k in sys_options if k in nodes),
+                None)
+            if next_node is None:
+                d = dict(zip(env_keys, env_key))
+                d.update(zip(sys_keys, sys_options[0]))
+                next_node = _add_new_node(d, g, queue, umap, keys)
+                _add_to_visited(d, next_node, visited,
+                                env_keys, sys_keys)
+            edge = (node, next_node)
+            if edge not in edges:
+                edges.add(edge)
+                yield edge
+    _log_rate(g, t0)
+
+
+def _init_queue(g, aut, umap, keys, qinit, init_states):
+    """Add initial nodes to `g`, and return them in a `list`.
+
+    If `init_states is None`, then call `_init_search`.
+    """
+    if init_states is None:
+        return _init_search(g, aut, umap, keys, qinit)
+    queue = list()
+    for d in init_states:
+        _add_new_node(d, g, queue, umap, keys)
+    return queue
+
+
+def _parallel_action_to_steps(aut, qinit, bfs, workers):
+    """Return graph of `_action_to_steps`, using processes.
+
+    Read `action_to_steps`.
+    """
+    import networkx as nx
+    t0 = time.time()
+    vrs = set(aut.varlist['env']).union(aut.varlist['sys'])
+    init = _StateTable(vrs)
+    queue = _init_search(init, aut, dict(), init.keys, qinit)
+    states = [init.nodes[u] for u in queue]
+    g = nx.DiGraph()
+    g.initial_nodes = set()
+    if not states:
+        log.info('no initial states')
+        return g
+    n = min(workers, len(states))
+    log.info((
+        'enumerating from {m} initial states '
+        'in {n} processes').format(m=len(states), n=n))
+    tasks = [(states[i::n], bfs) for i in range(n)]
+    spec = transfer.dumps_automaton(aut)
+    pool = multiprocessing.Pool(
+        processes=n,
+        initializer=_init_enumeration_worker,
+        initargs=(spec,))
+    try:
+        results = pool.map(_enumeration_task, tasks)
+    finally:
+        pool.terminate()
+        pool.join()
+    _merge_partial_graphs(results, init.keys, aut.varlist['env'], g)
+    _log_rate(g, t0)
     return g
 
 
-def _select_candidate_nodes(
-        next_nodes, visited_nodes, aut, visited=True):
-    """Return set of next nodes to choose from, as BDD."""
-    u = next_nodes
-    v = visited_nodes
-    # prefer already visited nodes ?
-    if visited:
-        v &= u
-        if v == aut.false:
-            log.info('cannot remain in visited nodes')
-            v = u
-            remain = False
-        else:
-            remain = True
+def _merge_partial_graphs(results, keys, env_vars, g):
+    """Add to `g` the merged graphs from `_enumeration_task`.
+
+    Nodes with the same state are merged. From each node,
+    the sys response to each env move is the successor
+    with the smallest node number. Nodes that become
+    unreachable from the initial nodes are omitted.
+
+    @param results: `list` of `(keys, states, edges, initial_nodes)`
+    @param keys: variable names, in `tuple` order
+    @param env_vars: env variable names
+    @type g: `networkx.DiGraph` with attribute `initial_nodes`
+    """
+    umap = dict()
+    env_index = [i for i, var in enumerate(keys) if var in env_vars]
+    initial = set()
+    # (node, next env values) -> next node
+    responses = dict()
+    for keys_, states, edges, initial_nodes in results:
+        assert keys_ == keys, (keys_, keys)
+        nodes = [_stitch_node(state, umap) for state in states]
+        initial.update(nodes[u] for u in initial_nodes)
+        for u, v in edges:
+            env_values = tuple(states[v][i] for i in env_index)
+            key = (nodes[u], env_values)
+            w = responses.get(key)
+            if w is None or nodes[v] < w:
+                responses[key] = nodes[v]
+    succ = dict()
+    for (u, _), v in responses.items():
+        succ.setdefault(u, list()).append(v)
+    reachable = set(initial)
+    stack = list(initial)
+    while stack:
+        u = stack.pop()
+        for v in succ.get(u, list()):
+            if v not in reachable:
+                reachable.add(v)
+                stack.append(v)
+    # renumber the reachable nodes
+    states = {u: state for state, u in umap.items()}
+    order = sorted(reachable)
+    new = {u: i for i, u in enumerate(order)}
+    for u in order:
+        g.add_node(new[u], **dict(zip(keys, states[u])))
+    g.initial_nodes.update(new[u] for u in initial)
+    g.add_edges_from(
+        (new[u], new[v])
+        for u in order
+        for v in sorted(succ.get(u, list())))
+
+
+def _stitch_node(state, umap):
+    """Return number of `state` in `umap`, adding it if absent.
+
+    @param state: `tuple` of values
+    @param umap: `dict` that maps `tuple`s to node numbers
+    """
+    if state in umap:
+        return umap[state]
+    u = len(umap)
+    umap[state] = u
+    return u
+
+
+_worker = dict()  # state of an enumeration process
+
+
+def _init_enumeration_worker(spec):
+    """Load the automaton of an enumeration process."""
+    aut, _ = transfer.loads_automaton(spec)
+    _worker['aut'] = aut
+
+
+def _enumeration_task(task):
+    """Enumerate steps from some initial states, in a process.
+
+    @param task: `(init_states, bfs)`
+    @return: `(keys, states, edges, initial_nodes)`,
+        where `states[u]` is the `tuple` of node `u`,
+        ordered by `keys`
+    """
+    init_states, bfs = task
+    aut = _worker['aut']
+    vrs = set(aut.varlist['env']).union(aut.varlist['sys'])
+    g = _StateTable(vrs)
+    if bfs:
+        steps = _action_steps_bfs(aut, None, g, init_states)
     else:
-        v = u & ~ v
-        if v == aut.false:
-            log.info('cannot visit new nodes')
-            v = u
-            remain = True
+        steps = _action_steps(aut, None, g, init_states)
+    initial_nodes = list()
+    edges = list()
+    for u, v in steps:
+        if u is None:
+            initial_nodes.append(v)
         else:
-            remain = False
-    assert v != aut.false
-    return v, remain
+            edges.append((u, v))
+    return g.keys, g._states, edges, initial_nodes
+
+
+def _find_visited_node(u, nodes, sys_keys, aut):
+    """Return a node in `nodes` that satisfies `u`, or `None`.
+
+    Iterates over whichever is smaller: the assignments
+    that satisfy `u`, or the visited `nodes`.
+
+    @param u: BDD over the (unprimed) sys variables
+    @param nodes: `dict` that maps `tuple`s of
+        sys values to nodes
+    @param sys_keys: sys variables, in tuple order
+    """
+    if not nodes:
+        return None
+    n = aut.count(u, care_vars=sys_keys)
+    if n <= len(nodes):
+        for d in aut.pick_iter(u, care_vars=sys_keys):
+            key = _node_tuple(d, sys_keys)
+            if key in nodes:
+                return nodes[key]
+        return None
+    for key, node in nodes.items():
+        d = dict(zip(sys_keys, key))
+        if aut.let(d, u) == aut.true:
+            return node
+    return None
 
 
 def _primed_vars_per_quantifier(varlist):
@@ -202,17 +618,17 @@ def _init_search(g, aut, umap, keys, qinit):
     # danger of blowup due to sparsity
     # implement enumerated equivalent to compare
     if qinit == '\A \E':
-        queue, visited = _forall_exist_init(g, aut, umap, keys)
+        queue = _forall_exist_init(g, aut, umap, keys)
     elif qinit == '\A \A':
-        queue, visited = _forall_init(g, aut, umap, keys)
+        queue = _forall_init(g, aut, umap, keys)
     elif qinit == '\E \E':
-        queue, visited = _exist_init(g, aut, umap, keys)
+        queue = _exist_init(g, aut, umap, keys)
     elif qinit == '\E \A':
-        queue, visited = _exist_forall_init(g, aut, umap, keys)
+        queue = _exist_forall_init(g, aut, umap, keys)
     else:
         raise Exception('unknown qinit "{q}"'.format(q=qinit))
     log.info('{n} initial nodes'.format(n=len(queue)))
-    return queue, visited
+    return queue
 
 
 def _forall_init(g, aut, umap, keys):
@@ -225,12 +641,10 @@ def _forall_init(g, aut, umap, keys):
     init_iter = aut.pick_iter(
         env_init & sys_init,
         care_vars=list(care_vars))
-    visited = aut.false
     queue = list()
     for d in init_iter:
         _add_new_node(d, g, queue, umap, keys)
-        visited = _add_to_visited(d, visited, aut)
-    return queue, visited
+    return queue
 
 
 def _exist_init(g, aut, umap, keys):
@@ -241,11 +655,9 @@ def _exist_init(g, aut, umap, keys):
     d = aut.pick(
         sys_init,
         care_vars=list(care_vars))
-    visited = aut.false
     queue = list()
     _add_new_node(d, g, queue, umap, keys)
-    visited = _add_to_visited(d, visited, aut)
-    return queue, visited
+    return queue
 
 
 def _forall_exist_init(g, aut, umap, keys):
@@ -262,7 +674,6 @@ def _forall_exist_init(g, aut, umap, keys):
     only_env_init = aut.exist(aut.varlist['sys'], env_init)
     env_iter = aut.pick_iter(
         only_env_init, care_vars=aut.varlist['env'])
-    visited = aut.false
     queue = list()
     for env_0 in env_iter:
         u = aut.let(env_0, sys_init)
@@ -273,8 +684,7 @@ def _forall_exist_init(g, aut, umap, keys):
         u = aut.let(d, env_init)
         assert u == aut.true, u
         _add_new_node(d, g, queue, umap, keys)
-        visited = _add_to_visited(d, visited, aut)
-    return queue, visited
+    return queue
 
 
 def _exist_forall_init(g, aut, umap, keys):
@@ -295,7 +705,6 @@ def _exist_forall_init(g, aut, umap, keys):
     # allow `EnvInit` that depends on sys vars (Mealy env)
     env_iter = aut.pick_iter(
         env_init, care_vars=aut.varlist['env'])
-    visited = aut.false
     queue = list()
     for env_0 in env_iter:
         d = dict(env_0)
@@ -304,8 +713,7 @@ def _exist_forall_init(g, aut, umap, keys):
         u = aut.let(d, env_init)
         assert u == aut.true, u
         _add_new_node(d, g, queue, umap, keys)
-        visited = _add_to_visited(d, visited, aut)
-    return queue, visited
+    return queue
 
 
 def _find_node(d, umap, keys):
@@ -331,26 +739,27 @@ def _add_new_node(d, g, queue, umap, keys):
     return u
 
 
-def _add_to_visited(values, visited, aut):
-    """Return BDD `visited` updated with assignment `values`."""
-    c = list()
-    for var, value in values.items():
-        t = aut.vars[var]['type']
-        if t == 'bool':
-            assert value in (True, False), value
-            if bool(value):
-                c.append(var)
-            else:
-                c.append(' ~ ' + var)
-            continue
-        # integer
-        assert t in ('int', 'saturating', 'modwrap'), t
-        s = '{var} = {value}'.format(var=var, value=value)
-        c.append(s)
-    s = stx.conj(c)
-    u = aut.add_expr(s)
-    visited |= u
-    return visited
+def _add_to_visited(d, node, visited, env_keys, sys_keys):
+    """Add `node` with assignment `d` to index `visited`.
+
+    @param visited: `dict` that maps `tuple`s of env values
+        to `dict`s that map `tuple`s of sys values to nodes
+    """
+    env_key = _node_tuple(d, env_keys)
+    sys_key = _node_tuple(d, sys_keys)
+    nodes = visited.setdefault(env_key, dict())
+    assert sys_key not in nodes, (sys_key, nodes)
+    nodes[sys_key] = node
+
+
+def _log_rate(g, t0):
+    """Log number of nodes in `g` enumerated per second."""
+    dt = time.time() - t0
+    rate = len(g) / dt if dt > 0 else float('inf')
+    log.info((
+        'enumerated {n} nodes in {dt:1.2f} sec '
+        '({r:1.0f} nodes/sec)').format(
+            n=len(g), dt=dt, r=rate))
 
 
 def _node_tuple(d, keys):
@@ -360,3 +769,215 @@ def _node_tuple(d, keys):
     @type keys: `tuple`
     """
     return tuple(d[k] for k in keys)
+
+
+class _StateTable(object):
+    """Node states as `tuple`s, in place of a graph.
+
+    Supports the methods of `networkx.DiGraph` that
+    the search uses to add nodes and read their states.
+    """
+
+    def __init__(self, vrs):
+        self.keys = sorted(vrs)
+        self._states = list()
+
+    def __len__(self):
+        return len(self._states)
+
+    def __contains__(self, u):
+        return 0 <= u < len(self._states)
+
+    def __getitem__(self, u):
+        return dict(zip(self.keys, self._states[u]))
+
+    @property
+    def nodes(self):
+        return self
+
+    def add_node(self, u, **d):
+        assert u == len(self._states), (u, len(self._states))
+        self._states.append(_node_tuple(d, self.keys))
+
+
+class CompactGraph(object):
+    """Enumerated graph in compressed sparse row (CSR) form.
+
+    The nodes are the integers `0, ..., n - 1`.
+    The successors of node `u` are
+    `targets[offsets[u]:offsets[u + 1]]`,
+    and the value of variable `var` at node `u` is
+    `columns[var][u]`. Boolean values are stored as
+    `0` and `1`, and read as `bool`.
+
+    The arrays are of type `array.array`, so they can
+    be viewed as NumPy arrays without copying,
+    for example `numpy.frombuffer(h.targets, dtype='int64')`
+    (`int32` where `h.targets.itemsize == 4`).
+
+    Supports the read-only methods of `networkx.DiGraph`
+    that `omega.steps.EnumStrategyStepper` uses.
+    To convert, use `networkx_to_compact` and `compact_to_networkx`.
+
+    @param keys: variable names, in `tuple` order
+    @param states: `states[u]` is a `tuple`
+        of the values at node `u`
+    @param sources, targets: the `i`-th edge is
+        `(sources[i], targets[i])`
+    """
+
+    def __init__(self, keys, states, sources, targets):
+        n = len(states)
+        self.keys = list(keys)
+        self._bools = {
+            k for i, k in enumerate(self.keys)
+            if states and isinstance(states[0][i], bool)}
+        self.columns = dict()
+        for i, k in enumerate(self.keys):
+            if k in self._bools:
+                typecode = 'b'
+            else:
+                typecode = senum.INT_TYPECODE
+            self.columns[k] = array.array(
+                typecode, (s[i] for s in states))
+        # count successors, then place them
+        counts = [0] * (n + 1)
+        for u in sources:
+            counts[u + 1] += 1
+        for u in range(n):
+            counts[u + 1] += counts[u]
+        self.offsets = array.array(senum.INT_TYPECODE, counts)
+        position = list(self.offsets[:-1])
+        self.targets = array.array(
+            senum.INT_TYPECODE, [0] * len(sources))
+        for u, v in zip(sources, targets):
+            self.targets[position[u]] = v
+            position[u] += 1
+        self.initial_nodes = set()
+        self.inputs = list()
+        self.outputs = list()
+        self.nodes = _CompactNodeView(self)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __iter__(self):
+        return iter(range(len(self)))
+
+    def __contains__(self, u):
+        return isinstance(u, int) and 0 <= u < len(self)
+
+    def successors(self, u):
+        """Return iterator over the successors of node `u`."""
+        start = self.offsets[u]
+        end = self.offsets[u + 1]
+        return iter(self.targets[start:end])
+
+    def edges(self):
+        """Return iterator over edges, as pairs of nodes."""
+        for u in self:
+            for v in self.successors(u):
+                yield u, v
+
+    def number_of_edges(self):
+        """Return number of edges."""
+        return len(self.targets)
+
+    def state(self, u):
+        """Return `dict` of values at node `u`."""
+        d = dict()
+        for k, column in self.columns.items():
+            value = column[u]
+            if k in self._bools:
+                value = bool(value)
+            d[k] = value
+        return d
+
+
+class _CompactNodeView(object):
+    """Read node states of a `CompactGraph`, like `g.nodes`."""
+
+    def __init__(self, graph):
+        self._graph = graph
+
+    def __getitem__(self, u):
+        if u not in self._graph:
+            raise KeyError(u)
+        return self._graph.state(u)
+
+    def __len__(self):
+        return len(self._graph)
+
+    def __iter__(self):
+        return iter(self._graph)
+
+    def __call__(self, data=False):
+        if not data:
+            return iter(self._graph)
+        return ((u, self._graph.state(u)) for u in self._graph)
+
+
+def networkx_to_compact(g, keys=None):
+    """Return `CompactGraph` from `networkx` graph `g`.
+
+    Nodes are renumbered as `0, ..., len(g) - 1`,
+    in the order of iteration over `g`.
+    The attributes `initial_nodes`, `inputs`, and
+    `outputs` of `g` are copied, if present.
+
+    @param keys: variables, in `tuple` order.
+        By default, the sorted keys of the
+        first node's attributes.
+    @type g: `networkx.DiGraph`
+    @rtype: `CompactGraph`
+    """
+    umap = {u: i for i, u in enumerate(g)}
+    if keys is None and umap:
+        u = next(iter(g))
+        keys = sorted(g.nodes[u])
+    elif keys is None:
+        keys = list()
+    states = [_node_tuple(d, keys) for _, d in g.nodes(data=True)]
+    sources = array.array(senum.INT_TYPECODE)
+    targets = array.array(senum.INT_TYPECODE)
+    for u, v in g.edges():
+        sources.append(umap[u])
+        targets.append(umap[v])
+    h = CompactGraph(keys, states, sources, targets)
+    h.initial_nodes = {
+        umap[u] for u in getattr(g, 'initial_nodes', set())}
+    h.inputs = list(getattr(g, 'inputs', list()))
+    h.outputs = list(getattr(g, 'outputs', list()))
+    return h
+
+
+def compact_to_networkx(h):
+    """Return `networkx.DiGraph` from `CompactGraph` `h`.
+
+    Sets the attributes `initial_nodes`, `inputs`, and `outputs`.
+    """
+    import networkx as nx
+    g = nx.DiGraph()
+    for u, d in h.nodes(data=True):
+        g.add_node(u, **d)
+    g.add_edges_from(h.edges())
+    g.initial_nodes = set(h.initial_nodes)
+    g.inputs = list(h.inputs)
+    g.outputs = list(h.outputs)
+    return g
+
+
+def steps_to_compact(steps, keys):
+    """Return `CompactGraph` from enumerated `steps`.
+
+    No `networkx` graph is constructed.
+
+    @param steps: as yielded by `iter_action_steps`
+    @param keys: variable names, in `tuple` order
+    @rtype: `CompactGraph`
+    """
+    states, sources, targets, initial_nodes = senum.steps_to_arrays(
+        steps, keys)
+    h = CompactGraph(keys, states, sources, targets)
+    h.initial_nodes = initial_nodes
+    return h
@@ -22,19 +22,29 @@ Robert Konighofer
 #
 import logging
 import copy
+import multiprocessing
+import warnings
 
+try:
+    from dd import cudd as _cudd
+except ImportError:
+    _cudd = None
 from omega.symbolic.prime import is_state_predicate
 from omega.symbolic import fixpoint as fx
 from omega.symbolic import fol as _fol
+from omega.symbolic import partition as prt
 from omega.symbolic import prime as prm
 from omega.symbolic import symbolic
 from omega.symbolic import temporal as trl
+from omega.symbolic import transfer
 
 
+STORE = ('all', 'rings', 'lazy')  # storage policies for iterants
 logger = logging.getLogger(__name__)
 
 
-def solve_streett_game(aut, rank=1):
+def solve_streett_game(aut, rank=1, warm=False, stats=None,
+                       store='all', workers=1):
     r"""Return winning set and iterants for Streett(1) game.
 
     The returned value takes into account actions and
@@ -46,64 +56,366 @@ def solve_streett_game(aut, rank=1):
       - `aut.varlist["env'"]`
       - `aut.varlist["sys'"]`
 
+    The outer greatest fixpoint decreases, so each inner
+    greatest fixpoint is bounded by its iterate in the previous
+    outer iteration (same goal and index), and can start from it.
+    Inner iterates with unchanged inputs are reused
+    (memoization in the style of Emerson and Lei).
+    The least fixpoints restart from `FALSE`.
+
     @param aut: compiled game with <>[] \/ []<> winning
     @type aut: `temporal.Automaton`
+    @param warm: if `True`, then warm-start and memoize as above.
+        The returned iterants are the same.
+    @param stats: if a `dict`, then add to it the keys:
+
+        - `"steps"`: number of calls to `fixpoint.step`
+        - `"saved"`: number of these calls avoided by
+          reusing iterants from the previous outer iteration
+        - `"warm_starts"`: number of inner fixpoints
+          started from a previous iterate
+        - `"reused"`: number of reused fixpoints
+        - `"retained_nodes"`: number of nodes in the returned
+          iterants, as `_count_nodes`
+        - `"peak_nodes"`: peak number of live nodes in the
+          BDD manager, `None` if not recorded by the manager
+    @param store: storage policy for the returned iterants
+        (the winning set `z` is returned in all cases):
+
+        - `"all"`: return each `y` in `yij`, each `x` in `xijk`
+        - `"rings"`: return the ring `y & ~ basin` in place of
+          each `y`, where `basin` is the previous `y`,
+          and `x & ~ basin` in place of each `x`
+        - `"lazy"`: return `None` for `yij` and `xijk`,
+          the transducer recomputes them
+
+        Rings are disjoint, but can share fewer nodes
+        than the iterants, so compare `"retained_nodes"`.
+        Pass the same `store` to `make_streett_transducer`.
+    @param workers: number of processes that compute
+        the attractors of different recurrence goals.
+        If `> 1`, then each process has its own BDD manager,
+        and BDDs are copied (`omega.symbolic.transfer`).
+        The result is the same as for `workers=1`.
+        Not supported together with `warm`.
     """
     assert rank == 1, 'only rank 1 supported for now'
     assert aut.bdd.vars or not aut.vars, (
         'first call `Automaton.build`')
     assert len(aut.win['<>[]']) > 0
     assert len(aut.win['[]<>']) > 0
+    assert store in STORE, store
+    if stats is None:
+        stats = dict()
+    for k in ('steps', 'saved', 'warm_starts', 'reused'):
+        stats.setdefault(k, 0)
     env_action = aut.action['env']
     sys_action = aut.action['sys']
     aut.build()
+    memo = dict()  # goal index -> iterants of previous iteration
+    if workers > 1:
+        assert not warm, 'warm start needs `workers=1`'
+        pool = _AttractorPool(aut, workers)
+    else:
+        pool = None
     z = aut.true
     zold = None
-    while z != zold:
-        zold = z
-        cox_z = fx.step(env_action, sys_action, z, aut)
-        xijk = list()
-        yij = list()
-        for goal in aut.win['[]<>']:
-            goal &= cox_z
-            y, yj, xjk = _attractor_under_assumptions(goal, aut)
-            z &= y
-            xijk.append(xjk)
-            yij.append(yj)
+    try:
+        while z != zold:
+            zold = z
+            cox_z = _step(env_action, sys_action, z, aut, stats)
+            goals = [goal & cox_z for goal in aut.win['[]<>']]
+            if pool is None:
+                results = _attractors(goals, aut, warm, memo, stats)
+            else:
+                results = pool.map(goals, stats)
+            xijk = list()
+            yij = list()
+            for y, yj, xjk in results:
+                z &= y
+                if store == 'lazy':
+                    continue
+                if store == 'rings':
+                    xjk = [_ring(xk, basin, aut) for xk, basin in
+                           zip(xjk, [aut.false] + yj[:-1])]
+                    yj = _rings(yj, aut)
+                xijk.append(xjk)
+                yij.append(yj)
+    finally:
+        if pool is not None:
+            pool.close()
     assert is_state_predicate(z), z.support
+    memo.clear()
+    if store == 'lazy':
+        yij = None
+        xijk = None
+    _report_nodes([z, yij, xijk], aut, stats)
     return z, yij, xijk
 
 
-def _attractor_under_assumptions(goal, aut):
-    """Targeting `goal`, under unconditional assumptions."""
+def _attractors(goals, aut, warm, memo, stats):
+    """Yield `_attractor_under_assumptions` for each goal.
+
+    @param memo: `dict` that maps goal indices to
+        `dict`s, used if `warm`
+    """
+    for i, goal in enumerate(goals):
+        if warm:
+            d = memo.setdefault(i, dict())
+        else:
+            d = None
+        yield _attractor_under_assumptions(
+            goal, aut, memo=d, stats=stats)
+
+
+class _AttractorPool(object):
+    """Processes that compute `_attractor_under_assumptions`.
+
+    Each process loads `aut` once, in its own BDD manager.
+    Goals and results are copied as tables of nodes
+    (`omega.symbolic.transfer`).
+    """
+
+    def __init__(self, aut, workers):
+        self.aut = aut
+        spec = transfer.dumps_automaton(aut)
+        self.pool = multiprocessing.Pool(
+            processes=workers,
+            initializer=_init_attractor_worker,
+            initargs=(spec,))
+
+    def map(self, goals, stats):
+        """Return `list` of `(y, yj, xjk)`, one for each goal.
+
+        @param stats: `dict` of counters, as in
+            `solve_streett_game`, incremented by the
+            counts of the processes
+        """
+        tasks = [transfer.dumps_bdds(dict(goal=goal), self.aut.bdd)
+                 for goal in goals]
+        m = len(self.aut.win['<>[]'])
+        results = list()
+        for table, n, counts in self.pool.map(_attractor_task, tasks):
+            bdds = transfer.loads_bdds(table, self.aut.bdd)
+            results.append(_unpack_attractor(bdds, n, m))
+            for k, v in counts.items():
+                stats[k] += v
+        return results
+
+    def close(self):
+        """Stop the processes."""
+        self.pool.terminate()
+        self.pool.join()
+
+
+_worker = dict()  # state of an `_AttractorPool` process
+
+
+def _init_attractor_worker(spec):
+    """Load the automaton of an `_AttractorPool` process."""
+    aut, _ = transfer.loads_automaton(spec)
+    _worker['aut'] = aut
+
+
+def _attractor_task(table):
+    """Compute `_attractor_under_assumptions` in a process.
+
+    @param table: goal, as returned by `transfer.dumps_bdds`
+    @return: `(table of iterants, number of y iterants, counts)`
+    """
+    aut = _worker['aut']
+    goal = transfer.loads_bdds(table, aut.bdd)['goal']
+    stats = dict(steps=0, saved=0, warm_starts=0, reused=0)
+    y, yj, xjk = _attractor_under_assumptions(goal, aut, stats=stats)
+    bdds = dict(y=y)
+    for j, (yy, xk) in enumerate(zip(yj, xjk)):
+        bdds['yj/{j}'.format(j=j)] = yy
+        for k, x in enumerate(xk):
+            bdds['xjk/{j}/{k}'.format(j=j, k=k)] = x
+    return transfer.dumps_bdds(bdds, aut.bdd), len(yj), stats
+
+
+def _unpack_attractor(bdds, n, m):
+    """Return `(y, yj, xjk)` from `dict` of `_attractor_task`.
+
+    @param n: number of `y` iterants
+    @param m: number of persistence holds
+    """
+    yj = [bdds['yj/{j}'.format(j=j)] for j in range(n)]
+    xjk = [
+        [bdds['xjk/{j}/{k}'.format(j=j, k=k)] for k in range(m)]
+        for j in range(n)]
+    return bdds['y'], yj, xjk
+
+
+def _attractor_under_assumptions(goal, aut, memo=None, stats=None):
+    """Targeting `goal`, under unconditional assumptions.
+
+    @param memo: if a `dict`, then read from it the iterants
+        of the previous call (a larger `goal`), and store in it
+        the iterants of this call
+    @param stats: `dict` of counters, as in `solve_streett_game`
+    """
     env_action = aut.action['env']
     sys_action = aut.action['sys']
+    if stats is None:
+        stats = dict(steps=0, saved=0, warm_starts=0, reused=0)
+    if memo is None:
+        memo = dict()
+        warm = False
+    else:
+        warm = bool(memo)
+    # same goal as before ?
+    if warm and memo['goal'] == goal:
+        stats['saved'] += memo['steps']
+        stats['reused'] += 1
+        return memo['y'], memo['yj'], memo['xjk']
+    steps = stats['steps']
     xjk = list()
     yj = list()
+    unless_j = list()
+    steps_jk = list()
     y = aut.false
     yold = None
     while y != yold:
         yold = y
-        cox_y = fx.step(env_action, sys_action, y, aut)
+        cox_y = _step(env_action, sys_action, y, aut, stats)
         unless = cox_y | goal
+        # previous iterants at this index, or the last ones
+        j = min(len(yj), len(memo.get('xjk', ())) - 1)
         xk = list()
-        for safe in aut.win['<>[]']:
-            x = fx.trap(env_action, sys_action,
-                        safe, aut, unless=unless)
+        steps_k = list()
+        for k, safe in enumerate(aut.win['<>[]']):
+            start = aut.true
+            if warm and memo['unless'][j] == unless:
+                x = memo['xjk'][j][k]
+                n = memo['steps_jk'][j][k]
+                stats['saved'] += n
+                stats['reused'] += 1
+            else:
+                if warm:
+                    start = memo['xjk'][j][k]
+                    stats['warm_starts'] += 1
+                n = stats['steps']
+                x = _trap(env_action, sys_action, safe, aut,
+                          unless, start, stats)
+                n = stats['steps'] - n
             xk.append(x)
+            steps_k.append(n)
             y |= x
         yj.append(y)
         xjk.append(xk)
+        unless_j.append(unless)
+        steps_jk.append(steps_k)
+    memo.update(
+        goal=goal, y=y, yj=yj, xjk=xjk,
+        unless=unless_j, steps_jk=steps_jk,
+        steps=stats['steps'] - steps)
     return y, yj, xjk
 
 
-def make_streett_transducer(z, yij, xijk, aut):
+def _trap(env_action, sys_action, safe, aut, unless, start, stats):
+    """Return `fixpoint.trap` computed from `start`.
+
+    @param start: superset of the result that is
+        a post-fixpoint, for example `aut.true`
+    """
+    q = start
+    qold = None
+    while q != qold:
+        qold = q
+        pre = _step(env_action, sys_action, q, aut, stats)
+        q = safe & pre
+        q |= unless
+    return q
+
+
+def _step(env_action, sys_action, target, aut, stats):
+    """Return `fixpoint.step`, counting calls in `stats`."""
+    stats['steps'] += 1
+    return fx.step(env_action, sys_action, target, aut)
+
+
+def _rings(us, aut):
+    """Return differences of successive elements of `us`.
+
+    @param us: increasing `list` of BDD nodes
+    """
+    return [_ring(u, basin, aut)
+            for u, basin in zip(us, [aut.false] + us[:-1])]
+
+
+def _ring(u, basin, aut):
+    """Return `u & ~ basin`, or `list` of these if `u` is a list."""
+    if isinstance(u, list):
+        return [_ring(v, basin, aut) for v in u]
+    return u & ~ basin
+
+
+def _report_nodes(iterants, aut, stats):
+    """Add node counts of `iterants` and of `aut.bdd` to `stats`."""
+    us = list(_flatten(iterants))
+    stats['retained_nodes'] = _count_nodes(us, aut)
+    with warnings.catch_warnings():
+        # `dd.cudd` warns about the units of `"mem"`
+        warnings.simplefilter('ignore')
+        d = aut.bdd.statistics()
+    stats['peak_nodes'] = d.get('peak_live_nodes')
+
+
+def _flatten(iterants):
+    """Yield BDD nodes from nested `list` of `iterants`."""
+    if iterants is None:
+        return
+    if not isinstance(iterants, list):
+        yield iterants
+        return
+    for u in iterants:
+        for v in _flatten(u):
+            yield v
+
+
+def _count_nodes(us, aut):
+    """Return number of nodes in BDDs `us`.
+
+    Shared nodes are counted once if `aut.bdd` is
+    from `dd.cudd`, otherwise the sum of sizes is returned.
+    """
+    if _cudd is not None and isinstance(aut.bdd, _cudd.BDD):
+        return _cudd.count_nodes(us)
+    return sum(len(u) for u in us)
+
+
+def _streett_iterants(z, aut):
+    """Yield `(yj, xjk)` for each goal, as `solve_streett_game`.
+
+    These are the iterants of the last iteration
+    of the outer fixpoint, where `z` is the winning set.
+    """
+    env_action = aut.action['env']
+    sys_action = aut.action['sys']
+    cox_z = fx.step(env_action, sys_action, z, aut)
+    for goal in aut.win['[]<>']:
+        goal &= cox_z
+        _, yj, xjk = _attractor_under_assumptions(goal, aut)
+        yield yj, xjk
+
+
+def make_streett_transducer(z, yij, xijk, aut, store='all'):
     """Return I/O `temporal.Automaton` implementing strategy.
 
     An auxiliary variable `_goal` is declared,
     to represent the counter of recurrence goals.
     The variable `_goal` is appended to `varlist['impl']`.
+
+    @param store: storage policy passed to
+        `solve_streett_game`. If `"lazy"`, then the iterants
+        are recomputed from `z`, one goal at a time.
+        If `"rings"`, then the strategy may move from a ring
+        of `x` to lower rings too, so it can be more permissive
+        than for `"all"`.
     """
+    assert store in STORE, store
     winning = z
     assert is_realizable(winning, aut)
     _warn_moore_mealy(aut)
@@ -117,8 +429,8 @@ def make_streett_transducer(z, yij, xijk, aut):
     # compile transducer with refined shared BDD
     env_init = aut.init['env']
     sys_init = aut.init['sys']
-    env_action = aut.action['env']
-    sys_action = aut.action['sys']
+    env_action = prt.conjoin(aut.action['env'])
+    sys_action = prt.conjoin(aut.action['sys'])
     holds = aut.win['<>[]']
     goals = aut.win['[]<>']
     # compute strategy from iterates
@@ -132,11 +444,16 @@ def make_streett_transducer(z, yij, xijk, aut):
         rho_1 |= u
     zstar = _controllable_action(z, aut)
     rho_1 &= zstar
-    # \rho_2: descent in basin
+    if store == 'lazy':
+        iterants = _streett_iterants(z, aut)
+    else:
+        iterants = zip(yij, xijk)
     rho_2 = aut.false
-    for i, yj in enumerate(yij):
+    rho_3 = aut.false
+    for i, (yj, xjk) in enumerate(iterants):
         s = "({c} = {i}) /\ ({c}' = {i})".format(c=c, i=i)
         count = aut.add_expr(s)
+        # \rho_2: descent in basin
         rho_2j = aut.false
         basin = yj[0]
         for y in yj[1:]:
@@ -148,23 +465,24 @@ def make_streett_transducer(z, yij, xijk, aut):
             basin |= y
         u = rho_2j & count
         rho_2 |= u
-    # \rho_3: persistence holds
-    rho_3 = aut.false
-    for i, xjk in enumerate(xijk):
-        s = "({c} = {i}) /\ ({c}' = {i})".format(c=c, i=i)
-        count = aut.add_expr(s)
+        # \rho_3: persistence holds
         rho_3j = aut.false
         used = aut.false
-        for xk in xjk:
+        below = aut.false
+        for xk, y in zip(xjk, yj):
             assert len(xk) == len(holds), xk
             for x, hold in zip(xk, holds):
                 # steps leading to next wait
-                xstar = _controllable_action(x, aut)
+                if store == 'rings':
+                    xstar = _controllable_action(x | below, aut)
+                else:
+                    xstar = _controllable_action(x, aut)
                 stay = x & ~ used
                 used |= x
                 u = stay & xstar
                 u &= hold
                 rho_3j |= u
+            below |= y
         u = rho_3j & count
         rho_3 |= u
     # \rho
@@ -175,10 +493,10 @@ def make_streett_transducer(z, yij, xijk, aut):
     u &= aut.add_expr(s)
     # `sys_action` is already in the `\rho`
     # next is "useful" only if `env_action` depends on `y'`
-    if not aut.plus_one:
+    if not aut.plus_one and aut.moore:
+        u = aut.or_forall(aut.varlist["env'"], u, ~ env_action)
+    elif not aut.plus_one:
         u |= ~ env_action
-        if aut.moore:
-            u = aut.forall(aut.varlist["env'"], u)
     assert u != aut.false
     symbolic._assert_support_moore(u, aut)
     aut.action['impl'] = u
@@ -192,13 +510,28 @@ def make_streett_transducer(z, yij, xijk, aut):
     return aut.action['impl']
 
 
-def solve_rabin_game(aut, rank=1):
+def solve_rabin_game(aut, rank=1, stats=None, store='all'):
     """Return winning set and iterants for Rabin(1) game.
 
     @param aut: compiled game with <>[] & []<> winning
     @type aut: `temporal.Automaton`
+    @param stats: if a `dict`, then add to it the keys
+        `"retained_nodes"` and `"peak_nodes"`,
+        as in `solve_streett_game`
+    @param store: storage policy for the returned iterants
+        (`zk` is returned in all cases):
+
+        - `"all"`: return each `y` in `yki`, and
+          each `x` in `xkijr`
+        - `"rings"`: return the ring `x & ~ xold` in place
+          of each `x`, where `xold` is the previous `x`
+        - `"lazy"`: return `None` for `yki` and `xkijr`,
+          the transducer recomputes them
+
+        Pass the same `store` to `make_rabin_transducer`.
     """
     assert rank == 1, 'only rank 1 supported for now'
+    assert store in STORE, store
     assert aut.bdd.vars or not aut.vars, (
         'first call `Automaton.build`')
     # TODO: can these assertions be removed elegantly ?
@@ -217,15 +550,43 @@ def solve_rabin_game(aut, rank=1):
         for hold in aut.win['<>[]']:
             y, xjr = _cycle_inside(zold, hold, aut)
             z |= y
+            if store == 'lazy':
+                continue
+            if store == 'rings':
+                xjr = [_rings(xr, aut) for xr in xjr]
             xijr.append(xjr)
             yi.append(y)
         zk.append(z)
+        if store == 'lazy':
+            continue
         yki.append(yi)
         xkijr.append(xijr)
     assert is_state_predicate(z), z.support
+    if store == 'lazy':
+        yki = None
+        xkijr = None
+    if stats is not None:
+        _report_nodes([zk, yki, xkijr], aut, stats)
     return zk, yki, xkijr
 
 
+def _rabin_iterants(zk, aut):
+    """Yield `(yi, xijr)` for each `z` in `zk`.
+
+    Same iterants as those computed by `solve_rabin_game`.
+    """
+    zold = aut.false
+    for z in zk:
+        xijr = list()
+        yi = list()
+        for hold in aut.win['<>[]']:
+            y, xjr = _cycle_inside(zold, hold, aut)
+            xijr.append(xjr)
+            yi.append(y)
+        yield yi, xijr
+        zold = z
+
+
 def _cycle_inside(z, hold, aut):
     """Cycling through goals, while staying in `hold`."""
     env_action = aut.action['env']
@@ -262,8 +623,14 @@ def _attractor_inside(inside, goal, aut):
     return x, xr
 
 
-def make_rabin_transducer(zk, yki, xkijr, aut):
-    """Return O/I transducer for Rabin(1) game."""
+def make_rabin_transducer(zk, yki, xkijr, aut, store='all'):
+    """Return O/I transducer for Rabin(1) game.
+
+    @param store: storage policy passed to
+        `solve_rabin_game`. If `"lazy"`, then the iterants
+        are recomputed from `zk`, one `z` at a time.
+    """
+    assert store in STORE, store
     winning = zk[-1]
     assert is_realizable(winning, aut)
     _warn_moore_mealy(aut)
@@ -283,8 +650,8 @@ def make_rabin_transducer(zk, yki, xkijr, aut):
     # compile
     env_init = aut.init['env']
     sys_init = aut.init['sys']
-    env_action = aut.action['env']
-    sys_action = aut.action['sys']
+    env_action = prt.conjoin(aut.action['env'])
+    sys_action = prt.conjoin(aut.action['sys'])
     goals = aut.win['[]<>']
     # compute strategy from iterates
     # \rho_1: descent in persistence basin
@@ -303,8 +670,12 @@ def make_rabin_transducer(zk, yki, xkijr, aut):
     rho_2 = aut.false
     rho_3 = aut.false
     rho_4 = aut.false
+    if store == 'lazy':
+        iterants = _rabin_iterants(zk, aut)
+    else:
+        iterants = zip(yki, xkijr)
     basin = aut.false
-    for z, yi, xijr in zip(zk, yki, xkijr):
+    for z, (yi, xijr) in zip(zk, iterants):
         cox_basin = fx.step(env_action, sys_action,
                             basin, aut)
         rim = z & ~ basin
@@ -345,7 +716,7 @@ def make_rabin_transducer(zk, yki, xkijr, aut):
                     q = xstar & ~ x_basin
                     q &= x
                     p |= q
-                    x_basin = x
+                    x_basin |= x
                 p &= count
                 p &= ~ goal
                 v |= p
@@ -386,10 +757,10 @@ def make_rabin_transducer(zk, yki, xkijr, aut):
     s = '({w} \in 0..{n_w}) /\ ({c} \in 0..{n_c})'.format(
         w=w, n_w=n_w, c=c, n_c=n_c)
     u &= aut.add_expr(s)
-    if not aut.plus_one:
+    if not aut.plus_one and aut.moore:
+        u = aut.or_forall(aut.varlist["env'"], u, ~ env_action)
+    elif not aut.plus_one:
         u |= ~ env_action
-        if aut.moore:
-            u = aut.forall(aut.varlist["env'"], u)
     assert u != aut.false
     symbolic._assert_support_moore(u, aut)
     aut.action['impl'] = u
@@ -403,12 +774,75 @@ def make_rabin_transducer(zk, yki, xkijr, aut):
     return aut.action['impl']
 
 
+def check_realizable(aut):
+    """Return `True` if, and only if, the Streett(1) game is realizable.
+
+    Same result as `is_realizable` for the winning set returned
+    by `solve_streett_game`, but no iterants are stored.
+    The initial condition is checked after each update of the
+    winning set. The winning set only shrinks, so the
+    computation stops as soon as the check fails.
+
+    @param aut: compiled game with <>[] \/ []<> winning
+    @type aut: `temporal.Automaton`
+    """
+    assert aut.bdd.vars or not aut.vars, (
+        'first call `Automaton.build`')
+    assert len(aut.win['<>[]']) > 0
+    assert len(aut.win['[]<>']) > 0
+    env_action = aut.action['env']
+    sys_action = aut.action['sys']
+    aut.build()
+    z = aut.true
+    zold = None
+    while z != zold:
+        zold = z
+        cox_z = fx.step(env_action, sys_action, z, aut)
+        for goal in aut.win['[]<>']:
+            goal &= cox_z
+            z &= _attractor_without_iterants(goal, aut)
+            r, msg = _check_init(z, aut)
+            if not r:
+                print(msg)
+                return False
+    return True
+
+
+def _attractor_without_iterants(goal, aut):
+    """Return `y` of `_attractor_under_assumptions`."""
+    env_action = aut.action['env']
+    sys_action = aut.action['sys']
+    y = aut.false
+    yold = None
+    while y != yold:
+        yold = y
+        cox_y = fx.step(env_action, sys_action, y, aut)
+        unless = cox_y | goal
+        for safe in aut.win['<>[]']:
+            y |= fx.trap(env_action, sys_action,
+                         safe, aut, unless=unless)
+    return y
+
+
 def is_realizable(win, aut):
     """Return `True` if, and only if, `aut` wins from `z`.
 
     @param win: bdd node
     @param aut: `temporal.Automaton`
     """
+    r, msg = _check_init(win, aut)
+    if not r:
+        print(msg)
+    return r
+
+
+def _check_init(win, aut):
+    """Return whether initial condition holds, and message if not.
+
+    @param win: bdd node
+    @param aut: `temporal.Automaton`
+    @return: `(r, msg)` where `r` is `bool`, and `msg` a `str`
+    """
     sys_init = aut.init['sys']
     env_init = aut.init['env']
     sys_vars = aut.varlist['sys']
@@ -432,7 +866,7 @@ def is_realizable(win, aut):
     elif qinit == '\E \E':
         assert env_init == aut.true
         vrs = env_vars + sys_vars
-        u = aut.exist(vrs, win & sys_init)
+        u = aut.and_exist(vrs, win, sys_init)
         r = (u == aut.true)
         msg = (
             'The initial condition requirement:\n'
@@ -464,9 +898,7 @@ def is_realizable(win, aut):
         raise ValueError(
             'unknown `qinit` value "{q}"'.format(
                 q=qinit))
-    if not r:
-        print(msg)
-    return r
+    return r, msg
 
 
 def _controllable_action(target, aut):
@@ -474,20 +906,24 @@ def _controllable_action(target, aut):
 
     Compared to CPre, this has "half" the quantification.
     """
-    env_action = aut.action['env']
-    sys_action = aut.action['sys']
-    u = prm.prime(target, aut)
-    if aut.plus_one:
+    env_action = prt.conjoin(aut.action['env'])
+    sys_action = prt.conjoin(aut.action['sys'])
+    xp = aut.varlist["env'"]
+    target = prm.prime(target, aut)
+    if aut.plus_one and aut.moore:
+        # \A uvars':  sys_action /\ (env_action => target')
+        u = aut.or_forall(xp, ~ env_action, target)
+        u &= aut.forall(xp, sys_action)
+    elif aut.plus_one:
         # sys_action /\ (env_action => target')
-        u |= ~ env_action
+        u = ~ env_action | target
         u &= sys_action
+    elif aut.moore:
+        # \A uvars':  env_action => (sys_action /\ target')
+        u = aut.or_forall(xp, ~ env_action, sys_action & target)
     else:
         # env_action => (sys_action /\ target')
-        u &= sys_action
-        u |= ~ env_action
-    if aut.moore:
-        # \A uvars'
-        u = aut.forall(aut.varlist["env'"], u)
+        u = ~ env_action | (sys_action & target)
     return u
 
 
@@ -572,8 +1008,8 @@ def _make_init(internal_init, win, aut):
 
 def _warn_moore_mealy(aut):
     """Warn the user if they define actions suspect of error."""
-    env_action = aut.action['env']
-    sys_action = aut.action['sys']
+    env_action = prt.conjoin(aut.action['env'])
+    sys_action = prt.conjoin(aut.action['sys'])
     moore = aut.moore
     env_support = aut.support(env_action)
     sys_support = aut.support(sys_action)
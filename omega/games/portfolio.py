@@ -0,0 +1,220 @@
+"""Solving games with a portfolio of BDD configurations.
+
+The time needed to solve a game depends on the variable order,
+and on whether dynamic reordering is enabled.
+A portfolio solves the same game in several processes,
+each with its own BDD manager and configuration,
+and returns the result that is computed first.
+"""
+# Copyright 2016 by California Institute of Technology
+# All rights reserved. Licensed under BSD-3.
+#
+import logging
+import multiprocessing
+import random
+import time
+
+from omega.games import gr1
+from omega.logic import syntax as stx
+from omega.symbolic import transfer
+
+
+logger = logging.getLogger(__name__)
+ORDERS = ('given', 'natural', 'env_first', 'sys_first', 'random')
+DEFAULT_CONFIGS = [
+    dict(order='given', reordering=True),
+    dict(order='given', reordering=False),
+    dict(order='natural', reordering=True),
+    dict(order='natural', reordering=False),
+    dict(order='env_first', reordering=True),
+    dict(order='sys_first', reordering=True),
+    dict(order='random', seed=0, reordering=True),
+    dict(order='random', seed=1, reordering=True)]
+SOLVERS = dict(
+    streett=gr1.solve_streett_game,
+    rabin=gr1.solve_rabin_game)
+
+
+def solve(aut, game='streett', configs=None, workers=None):
+    """Return result of the configuration that finishes first.
+
+    Each configuration is a `dict` with keys:
+
+      - `"order"`: initial variable order, either a `list`
+        of all bits, or a name from `ORDERS`:
+
+        - `"given"`: the order in `aut.bdd`
+        - `"natural"`: variables in natural order
+        - `"env_first"`, `"sys_first"`: variables of
+          one player above those of the other player
+        - `"random"`: variables shuffled with `"seed"`
+
+        The bits of each variable are adjacent to
+        the bits of its primed copy.
+
+      - `"reordering"`: enable dynamic reordering
+      - `"seed"`: for `"random"` orders (optional)
+
+    The other processes are terminated.
+
+    @param aut: compiled game, as for `gr1.solve_streett_game`
+    @type aut: `temporal.Automaton`
+    @param game: `"streett"` or `"rabin"`
+    @param configs: `list` of configurations,
+        if `None` then `DEFAULT_CONFIGS`
+    @param workers: number of processes,
+        if `None` then one for each configuration,
+        up to the number of CPUs
+    @return: `(result, winner)`, where:
+
+        - `result` is returned by the solver, with BDDs in `aut.bdd`
+        - `winner` is a `dict` with keys:
+          - `"index"`: of the configuration in `configs`
+          - `"config"`: the configuration
+          - `"order"`: `list` of bits in the order of the
+            winning BDD manager after solving,
+            reusable as `"order"` of a configuration
+          - `"time"`: seconds spent solving, in the process
+    """
+    assert game in SOLVERS, game
+    if configs is None:
+        configs = DEFAULT_CONFIGS
+    assert configs, configs
+    if workers is None:
+        workers = min(len(configs), multiprocessing.cpu_count())
+    assert workers > 0, workers
+    aut.build()
+    spec = transfer.dumps_automaton(aut)
+    tasks = [(spec, game, i, config)
+             for i, config in enumerate(configs)]
+    pool = multiprocessing.Pool(processes=workers)
+    failures = list()
+    try:
+        for r in pool.imap_unordered(_solve_task, tasks):
+            if stx.isinstance_str(r):
+                failures.append(r)
+                continue
+            i, table, layout, order, t = r
+            break
+        else:
+            raise Exception(
+                'all configurations failed:\n{f}'.format(
+                    f='\n'.join(sorted(failures))))
+    finally:
+        pool.terminate()
+        pool.join()
+    bdds = transfer.loads_bdds(table, aut.bdd)
+    result = tuple(_unpack(layout, bdds))
+    winner = dict(index=i, config=configs[i], order=order, time=t)
+    logger.info('configuration {i} solved first: {c}'.format(
+        i=i, c=configs[i]))
+    return result, winner
+
+
+def _solve_task(task):
+    """Solve game in this process, with the given configuration.
+
+    @return: `str` that describes the error if solving failed,
+        otherwise `(index, table of BDDs, layout, order, time)`
+    """
+    spec, game, i, config = task
+    try:
+        order = pick_order(config, spec)
+        aut, _ = transfer.loads_automaton(spec, order=order)
+        aut.bdd.configure(reordering=config.get('reordering', False))
+        t0 = time.time()
+        result = SOLVERS[game](aut)
+        t1 = time.time()
+        bdds = dict()
+        layout = _pack(result, 'r', bdds)
+        table = transfer.dumps_bdds(bdds, aut.bdd)
+        levels = {var: aut.bdd.level_of_var(var)
+                  for var in aut.bdd.vars}
+        order = sorted(levels, key=levels.get)
+    except Exception as e:
+        logger.exception('configuration {i} failed'.format(i=i))
+        return 'configuration {i} {c}: {t}: {e}'.format(
+            i=i, c=config, t=type(e).__name__, e=e)
+    return i, table, layout, order, t1 - t0
+
+
+def pick_order(config, spec):
+    """Return `list` of bits for the `"order"` of `config`.
+
+    @param spec: as returned by `transfer.dumps_automaton`
+    """
+    import natsort
+    order = config.get('order', 'given')
+    bits = spec['bits']
+    if not stx.isinstance_str(order):
+        return list(order)
+    assert order in ORDERS, order
+    if order == 'given':
+        return list(bits)
+    dvars = spec['vars']
+    varlist = spec['varlist']
+    unprimed = [var for var in dvars if not stx.isprimed(var)]
+    if order == 'natural':
+        vrs = natsort.natsorted(unprimed)
+    elif order in ('env_first', 'sys_first'):
+        env = set(varlist.get('env', list()))
+        vrs = natsort.natsorted(unprimed)
+        first = [var for var in vrs if (var in env) ==
+                 (order == 'env_first')]
+        vrs = first + [var for var in vrs if var not in first]
+    else:
+        vrs = sorted(unprimed)
+        random.Random(config.get('seed')).shuffle(vrs)
+    r = list()
+    for var in vrs:
+        r.extend(_interleaved_bits(var, dvars))
+    known = set(bits)
+    r = [b for b in r if b in known]
+    ordered = set(r)
+    r.extend(b for b in bits if b not in ordered)
+    return r
+
+
+def _interleaved_bits(var, dvars):
+    """Return bits of `var`, each followed by its primed bit."""
+    pvar = stx.prime(var)
+    bits = _bits(var, dvars)
+    if pvar not in dvars:
+        return bits
+    pbits = _bits(pvar, dvars)
+    r = list()
+    for b, pb in zip(bits, pbits):
+        r.extend([b, pb])
+    return r
+
+
+def _bits(var, dvars):
+    """Return `list` of bits that refine `var`."""
+    d = dvars[var]
+    if d['type'] == 'bool':
+        return [var]
+    return list(d['bitnames'])
+
+
+def _pack(result, name, bdds):
+    """Add BDDs in nested `result` to `bdds`, return layout.
+
+    The layout has the nesting of `result`,
+    with names in place of BDDs.
+    """
+    if result is None:
+        return None
+    if isinstance(result, (list, tuple)):
+        return [_pack(u, '{n}/{i}'.format(n=name, i=i), bdds)
+                for i, u in enumerate(result)]
+    bdds[name] = result
+    return name
+
+
+def _unpack(layout, bdds):
+    """Inverse of `_pack`, with `list` in place of `tuple`."""
+    if layout is None:
+        return None
+    if isinstance(layout, list):
+        return [_unpack(u, bdds) for u in layout]
+    return bdds[layout]
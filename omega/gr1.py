@@ -11,7 +11,7 @@ from omega.symbolic import temporal as trl
 
 
 TEMPORAL_OPERATORS = {'[]', '<>'}
-parser = lexyacc.Parser()
+parser = lexyacc.LazyParser()
 
 
 def closed_system_to_automaton(formula):
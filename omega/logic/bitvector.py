@@ -15,10 +15,14 @@ Decision Procedures, Springer
 # All rights reserved. Licensed under BSD-3.
 #
 from __future__ import absolute_import
+import bisect
 import logging
 import math
 
-import networkx as nx
+try:
+    from dd import cudd as _cudd
+except ImportError:
+    _cudd = None
 
 from omega.logic import lexyacc
 from omega.logic import syntax as stx
@@ -28,10 +32,11 @@ from omega.logic.ast import Nodes as _Nodes
 ALU_BITWIDTH = 32
 DATA_TYPES = {'bool', 'int', 'saturating', 'modwrap'}
 KEYS = {'type', 'dom', 'signed', 'width', 'bitnames'}
+ENCODINGS = ('binary', 'offset', 'gray', 'onehot')
 logger = logging.getLogger(__name__)
 
 
-def bitblast(f, vrs, defs=None):
+def bitblast(f, vrs, defs=None, share=True, primed=None):
     """Flatten formula `f` to bitvector logic.
 
     @param f: quantified first-order action formula
@@ -39,13 +44,76 @@ def bitblast(f, vrs, defs=None):
     @param vrs: symbol table of variables as returned by `bitblast_table`
     @type vrs: `dict`
     @param defs: operator definitions
-    @type defs: `dict` that maps names (`str`) to expressions (`str`)
+    @type defs: `dict` that maps names (`str`) to
+        expressions (`str`) or BDD nodes,
+        which are referenced with `@` in the result
+    @param share: if `True`, then flatten each distinct
+        subterm once (see `share_subtrees`)
+    @param primed: `dict` that maps names of operators in `defs`
+        to BDDs with primed bits. Required if a BDD in `defs`
+        is primed. The result references these BDDs with `@`,
+        so `primed` should be kept until the result is used.
     """
     if defs is None:
         defs = dict()
     tree = _parser.parse(f)
-    defs = {k: _parser.parse(v) for k, v in defs.items()}
-    return tree.flatten(t=vrs, defs=defs)
+    defs = {
+        k: _parser.parse(v) if stx.isinstance_str(v) else v
+        for k, v in defs.items()}
+    if not share:
+        return tree.flatten(
+            t=vrs, defs=defs, ranges=dict(), primed=primed)
+    table = dict()
+    defs = {
+        k: v if hasattr(v, 'var') else share_subtrees(v, table)
+        for k, v in defs.items()}
+    tree = share_subtrees(tree, table)
+    return tree.flatten(
+        t=vrs, defs=defs, cse=dict(), ranges=dict(), primed=primed)
+
+
+def bitblast_to_bdd(f, vrs, bdd, defs=None, linear=True, share=True):
+    """Flatten formula `f` directly to a BDD in `bdd`.
+
+    Same as `bitblast`, but without the intermediate
+    bitvector formula in prefix syntax.
+
+    Comparisons of linear expressions, for example
+    `2 * x - 3 * y' <= z + 5`, are translated by
+    `_bdd_linear_comparator`, without adders.
+
+    @param f: quantified first-order action formula,
+        or its syntax tree from `_bdd_parser`
+    @type f: `str` or `BDDNodes` instance
+    @param vrs: symbol table of variables as returned by `bitblast_table`
+    @type vrs: `dict`
+    @param bdd: BDD manager where the bits of `vrs` are declared
+    @param defs: operator definitions
+    @type defs: `dict` that maps names (`str`) to
+        expressions (`str`) or BDD nodes
+    @param linear: if `False`, then translate
+        all comparisons using adders
+    @param share: if `True`, then flatten each distinct
+        subterm once (see `share_subtrees`)
+    @return: BDD node
+    """
+    if defs is None:
+        defs = dict()
+    tree = _bdd_parser.parse(f) if stx.isinstance_str(f) else f
+    defs = {
+        k: _bdd_parser.parse(v) if stx.isinstance_str(v) else v
+        for k, v in defs.items()}
+    if not share:
+        return tree.flatten(
+            t=vrs, defs=defs, bdd=bdd, linear=linear, ranges=dict())
+    table = dict()
+    defs = {
+        k: v if hasattr(v, 'var') else share_subtrees(v, table)
+        for k, v in defs.items()}
+    tree = share_subtrees(tree, table)
+    return tree.flatten(
+        t=vrs, defs=defs, bdd=bdd, linear=linear,
+        cse=dict(), ranges=dict())
 
 
 def bitblast_table(table):
@@ -57,6 +125,9 @@ def bitblast_table(table):
       - "type": `in ('bool', 'saturating', 'modwrap', 'int')`
       - "dom": `tuple([min, max])` where `min, max` are `int`
         used only if "type" is an integer
+      - "encoding" (optional): in `ENCODINGS`,
+        used only if "type" is an integer,
+        see `encode_int`
       - "init" (optional)
     """
     t = dict()
@@ -71,7 +142,9 @@ def bitblast_table(table):
         elif dtype in ('saturating', 'modwrap', 'int'):
             dom = d['dom']
             assert len(dom) == 2, dom
-            signed, width = dom_to_width(dom)
+            encoding = d.get('encoding', 'binary')
+            assert encoding in ENCODINGS, (var, encoding)
+            signed, width = dom_to_width(dom, encoding)
             b.update(type='int',
                      signed=signed, width=width,
                      dom=dom)
@@ -112,6 +185,11 @@ def type_invariants(table):
         # ranged bitfield safety constraints
         if dtype == 'bool':
             continue
+        s = encoding_invariant(var, d)
+        if s is not None:
+            init[var].append(s)
+            safety[var].append(s)
+            safety[var].append(encoding_invariant(var, d, prime=True))
         dom = d['dom']
         # int var
         assert dtype in ('int', 'saturating', 'modwrap'), dtype
@@ -151,15 +229,25 @@ def _init_to_logic(var, d):
         op=op, var=var, value=d['init'])
 
 
-def dom_to_width(dom):
+def dom_to_width(dom, encoding='binary'):
     """Return whether integer variable is signed and its bit width.
 
     @param dom: the variable's range
     @type dom: `(MIN, MAX)` where `MIN, MAX` are integers
+    @param encoding: in `ENCODINGS`
     """
     minval, maxval = dom
     logger.debug('int in ({m}, {M})'.format(
         m=minval, M=maxval))
+    if encoding in ('offset', 'gray'):
+        # unsigned `x - MIN`
+        assert minval <= maxval, (minval, maxval)
+        width = max((maxval - minval).bit_length(), 1)
+        return False, width
+    if encoding == 'onehot':
+        assert minval <= maxval, (minval, maxval)
+        return False, maxval - minval + 1
+    assert encoding == 'binary', encoding
     signed = (minval < 0) and (maxval >= 0)
     absval = max(abs(minval), abs(maxval))
     width = absval.bit_length()
@@ -217,7 +305,7 @@ def bit_table(variables, table):
     """
     dout = dict()
     keys = {'type', 'dom', 'signed',
-            'width', 'bitnames', 'init'}
+            'width', 'bitnames', 'init', 'encoding'}
     for var in variables:
         d = table[var]
         dtype = d['type']
@@ -279,6 +367,7 @@ def bitfield_to_int_states(g, t):
 
     @rtype: `networkx.Digraph`
     """
+    import networkx as nx
     h = nx.DiGraph()
     for u, d in g.nodes(data=True):
         bit_state = d['state']
@@ -318,10 +407,144 @@ def bitfields_to_ints(bit_state, t):
         bitnames = d['bitnames']
         bitvalues = [bit_state[b] for b in bitnames]
         _append_sign_bit(bitvalues, flatname, d)
-        int_state[flatname] = twos_complement_to_int(bitvalues)
+        code = twos_complement_to_int(bitvalues)
+        int_state[flatname] = decode_int(code, d)
     return int_state
 
 
+def encode_int(value, d):
+    """Return the integer stored in the bits, for `value`.
+
+    For the "binary" encoding, the bits store `value`.
+    The other encodings store `n = value - min`:
+
+      - "offset": as unsigned integer `n`
+      - "gray": as the Gray code `n ^ (n >> 1)`
+      - "onehot": as `2**n`, so bit `n` is the only bit set
+
+    @param d: attributes of integer variable
+    @type d: `dict`
+    """
+    encoding = d.get('encoding', 'binary')
+    if encoding == 'binary':
+        return value
+    n = value - d['dom'][0]
+    if encoding == 'onehot':
+        size = d['width']
+    else:
+        size = 2**d['width']
+    if n < 0 or n >= size:
+        raise ValueError((
+            'value {v} not representable with '
+            '{enc} encoding of domain {dom}').format(
+                v=value, enc=encoding, dom=d['dom']))
+    if encoding == 'offset':
+        return n
+    if encoding == 'gray':
+        return n ^ (n >> 1)
+    assert encoding == 'onehot', encoding
+    return 1 << n
+
+
+def decode_int(code, d):
+    """Return value of integer variable, inverse of `encode_int`.
+
+    A one-hot `code` with several bits set decodes to
+    the bitwise "or" of their indices (plus `min`),
+    as in `decode_bits`.
+    """
+    encoding = d.get('encoding', 'binary')
+    if encoding == 'binary':
+        return code
+    if encoding == 'offset':
+        n = code
+    elif encoding == 'gray':
+        n = code
+        shift = code >> 1
+        while shift:
+            n ^= shift
+            shift >>= 1
+    else:
+        assert encoding == 'onehot', encoding
+        n = 0
+        i = 0
+        while code:
+            if code & 1:
+                n |= i
+            code >>= 1
+            i += 1
+    return n + d['dom'][0]
+
+
+def encoding_invariant(var, d, prime=False):
+    """Return constraint on the bits of `var` due to encoding.
+
+    Only the "onehot" encoding constrains the bits,
+    to exactly one bit set. The formula has size
+    `O(n log(n))` for `n` bits (see `_exactly_one`).
+    Use `encoding_invariant_bdd` to obtain a BDD.
+
+    @param prime: if `True`, then constrain the primed bits
+    @return: formula as `str`, or `None`
+    """
+    if d.get('encoding', 'binary') != 'onehot':
+        return None
+    bits = d['bitnames']
+    if prime:
+        bits = [stx.prime(b) for b in bits]
+    at_least, at_most = _exactly_one(bits)
+    if at_most is None:
+        return at_least
+    return r'{a} /\ {b}'.format(a=at_least, b=at_most)
+
+
+def _exactly_one(bits):
+    """Return formulas that at least and at most one bit is set.
+
+    The bits are split in halves, and at most one bit is set
+    if so in each half, and not in both halves at least one.
+
+    @type bits: `list` of `str`
+    @return: `(at_least, at_most)`, where `at_most` is
+        `None` if `len(bits) == 1`
+    """
+    if len(bits) == 1:
+        return bits[0], None
+    i = len(bits) // 2
+    a, a_most = _exactly_one(bits[:i])
+    b, b_most = _exactly_one(bits[i:])
+    at_least = r'({a} \/ {b})'.format(a=a, b=b)
+    at_most = [u for u in (a_most, b_most) if u is not None]
+    at_most.append(r'~ ({a} /\ {b})'.format(a=a, b=b))
+    return at_least, r' /\ '.join(at_most)
+
+
+def encoding_invariant_bdd(var, d, bdd, prime=False):
+    """Return BDD of `encoding_invariant`.
+
+    The BDD of exactly one bit set has two nodes for
+    each bit, and is built bottom-up in the current
+    variable order.
+
+    @param bdd: BDD manager where the bits of `var` are declared
+    @return: BDD node, or `None`
+    """
+    if d.get('encoding', 'binary') != 'onehot':
+        return None
+    bits = d['bitnames']
+    if prime:
+        bits = [stx.prime(b) for b in bits]
+    bits = sorted(bits, key=bdd.level_of_var, reverse=True)
+    # no bit set below, and exactly one bit set below
+    none = bdd.true
+    one = bdd.false
+    for b in bits:
+        u = bdd.var(b)
+        one = bdd.ite(u, none, one)
+        none = ~ u & none
+    return one
+
+
 def make_table(d, env_vars=None):
     """Return symbol table from "simple" `dict`.
 
@@ -348,11 +571,19 @@ def make_table(d, env_vars=None):
 
 
 def make_symbol_table(vrs):
-    """Return table of declarations from "simple" `dict`."""
+    """Return table of declarations from "simple" `dict`.
+
+    Integers are given as `(min, max)`,
+    or `(min, max, encoding)` with `encoding in ENCODINGS`.
+    """
     d = dict()
     for var, dom in vrs.items():
         if dom == 'bool':
             d[var] = dict(type='bool')
+        elif len(dom) == 3:
+            a, b, encoding = dom
+            assert encoding in ENCODINGS, (var, encoding)
+            d[var] = dict(type='int', dom=(a, b), encoding=encoding)
         else:
             assert len(dom) == 2, dom
             d[var] = dict(type='int', dom=dom)
@@ -388,17 +619,17 @@ class Nodes(_Nodes):
 
     class Operator(_Nodes.Operator):
         def flatten(self, mem=None, *arg, **kw):
+            if self.operator == 'ite':
+                return _flatten_shared(self, mem, arg, kw)
+            return self._flatten(mem=mem, *arg, **kw)
+
+        def _flatten(self, mem=None, *arg, **kw):
             if self.operator in ('\A', '\E'):
                 assert mem is None, mem
                 x, e = self.operands
-                cube = x.flatten(mem=None, *arg, **kw)
-                assert isinstance(cube, str), cube
-                u = e.flatten(mem=None, *arg, **kw)
-                r = ' {op} {cube} {u}'.format(
-                    op=Nodes.opmap[self.operator],
-                    cube=cube,
-                    u=u)
-                return r
+                qbits = _param_bits(x, kw)
+                forall = (self.operator == '\A')
+                return _flatten_quantifier(forall, qbits, e, kw)
             if self.operator == 'params':
                 assert mem == None, mem
                 # list bits
@@ -424,6 +655,8 @@ class Nodes(_Nodes):
                     d_new = t[new_var]
                     assert d_old['type'] == d_new['type']
                     assert d_old.get('dom') == d_new.get('dom')
+                    assert (d_old.get('encoding') ==
+                            d_new.get('encoding'))
                     # flatten
                     a = _flatten_var(old, mem=mem, **kw)
                     b = _flatten_var(new, mem=mem, **kw)
@@ -446,6 +679,9 @@ class Nodes(_Nodes):
                 local_defs, e = self.operands
                 kw = dict(kw)  # local scope instead
                 kw.pop('defs')
+                # names in local scope can shadow operators
+                kw.pop('cse', None)
+                kw.pop('ranges', None)
                 for op_def in local_defs:
                     op_def.flatten(defs=defs, mem=mem, *arg, **kw)
                 # flatten expr in local scope
@@ -538,6 +774,8 @@ class Nodes(_Nodes):
                 u = defs[name]
                 # BDD ?
                 if hasattr(u, 'var'):
+                    if prime:
+                        u = _primed_def(u, name, kw.get('primed'))
                     return str(u)
                 # list at arithmetic level ?
                 if isinstance(u, list):
@@ -550,20 +788,10 @@ class Nodes(_Nodes):
                 # Boolean scope ?
                 if name in t:
                     assert mem is None, mem
-                return '{v}{prime}'.format(
-                    v=name, prime=stx.PRIME if prime else '')
-            assert name in t, (
-                '"{name}" neither var nor operator'.format(
-                    name=name))
-            # arithmetic context
-            # must be integer variable
-            # a refinement occurs here automatically
-            bits = var_to_twos_complement(name, t)
-            bits = ["{b}{prime}".format(
-                    b=b, prime=stx.PRIME
-                    if not b[0].isdigit() and prime else '')
-                for b in bits]
-            return bits
+            bits = _var_bits(name, prime, t)
+            if stx.isinstance_str(bits):
+                return bits
+            return decode_bits(bits, t[name])
 
     class Num(_Nodes.Num):
         def flatten(self, *arg, **kw):
@@ -576,10 +804,16 @@ class Nodes(_Nodes):
 
     class Comparator(_Nodes.Comparator):
         def flatten(self, mem=None, *arg, **kw):
+            return _flatten_shared(self, mem, arg, kw)
+
+        def _flatten(self, mem=None, *arg, **kw):
             logger.info('flatten "{s}"'.format(s=repr(self)))
             assert mem is None, (
                 '"{expr}" appears in arithmetic scope'.format(
                     expr=self))
+            r = _decide_comparison(self, kw)
+            if r is not None:
+                return Nodes.opmap[str(r).lower()]
             mem = list()
             p = self.operands[0].flatten(mem=mem, *arg, **kw)
             q = self.operands[1].flatten(mem=mem, *arg, **kw)
@@ -587,6 +821,14 @@ class Nodes(_Nodes):
 
     class Arithmetic(_Nodes.Arithmetic):
         def flatten(self, mem=None, *arg, **kw):
+            return _flatten_shared(self, mem, arg, kw)
+
+        def _flatten(self, mem=None, *arg, **kw):
+            rng = _value_range(
+                self, kw.get('t'), kw.get('defs'), kw.get('ranges'))
+            # constant ?
+            if rng is not None and rng[0] == rng[1]:
+                return int_to_twos_complement(rng[0])
             if self.operator == '<<>>':
                 return flatten_truncator(
                     self.operands, mem=mem, *arg, **kw)
@@ -598,10 +840,546 @@ class Nodes(_Nodes):
                     f=self)
             p = self.operands[0].flatten(mem=mem, *arg, **kw)
             q = self.operands[1].flatten(mem=mem, *arg, **kw)
-            return flatten_arithmetic(self.operator, p, q, mem)
+            width = _range_width(rng)
+            return flatten_arithmetic(
+                self.operator, p, q, mem, width=width)
+
+
+class BDDNodes(Nodes):
+    """AST nodes that flatten directly to BDD nodes.
+
+    Pass the BDD manager as keyword argument `bdd`.
+    In Boolean scope, `flatten` returns a BDD node.
+    In arithmetic scope, `flatten` returns a `list` of BDD nodes,
+    in two's complement (little-endian).
+    Sharing of nodes replaces the memory buffers
+    of the prefix syntax.
+    """
+
+    class Operator(Nodes.Operator):
+        def _flatten(self, mem=None, *arg, **kw):
+            bdd = kw['bdd']
+            if self.operator in ('\A', '\E'):
+                assert mem is None, mem
+                x, e = self.operands
+                qbits = _param_bits(x, kw)
+                forall = (self.operator == '\A')
+                return _bdd_flatten_quantifier(forall, qbits, e, kw)
+            if self.operator == 'params':
+                assert mem is None, mem
+                bits = list()
+                for v in self.operands:
+                    flat = _bdd_flatten_var(v, **kw)
+                    bits.extend(flat)
+                return bits
+            if self.operator == '\S':
+                x, e = self.operands
+                assert isinstance(x, list), x
+                unique = set(new.value for new, old in x)
+                assert len(unique) == len(x), x  # duplicates ?
+                t = kw['t']
+                rename = dict()
+                for new, old in x:
+                    d_old = t[old.value]
+                    d_new = t[new.value]
+                    assert d_old['type'] == d_new['type']
+                    assert d_old.get('dom') == d_new.get('dom')
+                    assert (d_old.get('encoding') ==
+                            d_new.get('encoding'))
+                    a = _bdd_flatten_var(old, **kw)
+                    b = _bdd_flatten_var(new, **kw)
+                    assert len(a) == len(b), (a, b)
+                    rename.update(zip(a, b))
+                u = e.flatten(mem=mem, **kw)
+                return bdd.let(rename, u)
+            if self.operator == '@':
+                # priming of state predicate BDDs unsupported yet
+                assert not kw.get('prime'), kw
+                x = int(self.operands[0].value)
+                assert x != 0, x
+                if x == 1:
+                    return bdd.true
+                return bdd._add_int(x)
+            if self.operator == '/\\':
+                r = bdd.true
+                for u in self.operands:
+                    r &= u.flatten(mem=mem, *arg, **kw)
+                return r
+            if self.operator == r'\/':
+                r = bdd.false
+                for u in self.operands:
+                    r |= u.flatten(mem=mem, *arg, **kw)
+                return r
+            if self.operator == 'LET':
+                return super(BDDNodes.Operator, self)._flatten(
+                    mem=mem, *arg, **kw)
+            if self.operator != 'ite':
+                raise ValueError(
+                    'unknown operator "{op}"'.format(op=self.operator))
+            # ternary conditional
+            x = self.operands[0].flatten(mem=None, *arg, **kw)
+            y = self.operands[1].flatten(mem=mem, *arg, **kw)
+            z = self.operands[2].flatten(mem=mem, *arg, **kw)
+            # ternary connective ?
+            if mem is None:
+                return bdd.ite(x, y, z)
+            p, q = equalize_width(y, z)
+            return [bdd.ite(x, a, b) for a, b in zip(p, q)]
+
+    class Unary(Nodes.Unary):
+        def flatten(self, *arg, **kw):
+            if self.operator == 'X':
+                kw.update(prime=True)
+                return self.operands[0].flatten(*arg, **kw)
+            if self.operator == '~':
+                return ~ self.operands[0].flatten(*arg, **kw)
+            raise ValueError(
+                'unknown operator "{op}"'.format(op=self.operator))
+
+    class Binary(Nodes.Binary):
+        def flatten(self, *arg, **kw):
+            op = self.operator
+            if op == '==':
+                return super(BDDNodes.Binary, self).flatten(*arg, **kw)
+            bdd = kw['bdd']
+            x, y = self.operands
+            x = x.flatten(*arg, **kw)
+            y = y.flatten(*arg, **kw)
+            if op == '..':
+                return (x, y)
+            elif op == r'\in':
+                assert len(y) == 2, y
+                e = x
+                a, b = y
+                x = _bdd_comparator('<=', a, e, bdd)
+                y = _bdd_comparator('<=', e, b, bdd)
+                op = '/\\'
+            if op == '/\\':
+                return x & y
+            elif op == r'\/':
+                return x | y
+            elif op == '=>':
+                return ~ x | y
+            elif op == '<=>':
+                return ~ bdd.apply('xor', x, y)
+            raise ValueError(
+                'unknown operator "{op}"'.format(op=op))
+
+    class Var(Nodes.Var):
+        def flatten(self, prime=None, mem=None,
+                    t=None, defs=None, *arg, **kw):
+            name = self.value
+            # operator definition ?
+            if defs is not None and name in defs:
+                u = defs[name]
+                # BDD ?
+                if hasattr(u, 'var') and prime:
+                    return _prime_bdd(u, name)
+                # BDD or list at arithmetic level ?
+                if hasattr(u, 'var') or isinstance(u, list):
+                    return u
+                # ast
+                return u.flatten(
+                    prime=prime, mem=mem, t=t, defs=defs,
+                    *arg, **kw)
+            bits = _var_bits(name, prime, t)
+            bdd = kw['bdd']
+            if stx.isinstance_str(bits):
+                return bdd.var(bits)
+            return _bdd_decode_bits(_bdd_bits(bits, bdd), t[name], bdd)
+
+    class Num(Nodes.Num):
+        def flatten(self, *arg, **kw):
+            bits = int_to_twos_complement(self.value)
+            return _bdd_bits(bits, kw['bdd'])
+
+    class Bool(Nodes.Bool):
+        def flatten(self, *arg, **kw):
+            bdd = kw['bdd']
+            if self.value.lower() == 'true':
+                return bdd.true
+            return bdd.false
+
+    class Comparator(Nodes.Comparator):
+        def _flatten(self, mem=None, *arg, **kw):
+            assert mem is None, (
+                '"{expr}" appears in arithmetic scope'.format(
+                    expr=self))
+            bdd = kw['bdd']
+            r = _decide_comparison(self, kw)
+            if r is not None:
+                return bdd.true if r else bdd.false
+            if kw.get('linear'):
+                r = _bdd_linear_comparator(self, kw)
+                if r is not None:
+                    return r
+            mem = list()
+            p = self.operands[0].flatten(mem=mem, *arg, **kw)
+            q = self.operands[1].flatten(mem=mem, *arg, **kw)
+            return _bdd_comparator(self.operator, p, q, bdd)
+
+    class Arithmetic(Nodes.Arithmetic):
+        def _flatten(self, mem=None, *arg, **kw):
+            bdd = kw['bdd']
+            rng = _value_range(
+                self, kw.get('t'), kw.get('defs'), kw.get('ranges'))
+            # constant ?
+            if rng is not None and rng[0] == rng[1]:
+                return _bdd_bits(int_to_twos_complement(rng[0]), bdd)
+            if self.operator == '<<>>':
+                p = self.operands[0].flatten(mem=mem, *arg, **kw)
+                assert isinstance(p, list), p
+                y = self.operands[1]
+                assert isinstance(y, Nodes.Num), (type(y), y)
+                tr = truncate(p, int(y.value))
+                # if extended, should not use MSB of truncation
+                tr.append(bdd.false)
+                return tr
+            assert mem is not None, (
+                'Arithmetic formula "{f}" '
+                'in Boolean scope.').format(
+                    f=self)
+            p = self.operands[0].flatten(mem=mem, *arg, **kw)
+            q = self.operands[1].flatten(mem=mem, *arg, **kw)
+            width = _range_width(rng)
+            return _bdd_arithmetic(self.operator, p, q, bdd, width=width)
+
+
+_parser = lexyacc.LazyParser(nodes=Nodes())
+_bdd_parser = lexyacc.LazyParser(nodes=BDDNodes())
+
+
+def share_subtrees(tree, table=None):
+    """Return `tree` with structurally equal subtrees shared.
+
+    Hash-consing: each subtree is replaced by the first
+    subtree in `table` with the same structure.
+    Structure is keyed by the identities of the shared operands,
+    so each node is hashed once.
+    Calling `flatten` with a `dict` as keyword argument `cse`
+    then flattens each distinct subterm once
+    (see `_flatten_shared`).
+
+    Operators with operands that are not nodes
+    (for example, `LET` and substitution)
+    are not shared, but their node operands are.
+
+    @param table: `dict` that maps structural keys to nodes,
+        pass the same `dict` to share subtrees among trees
+    @return: node
+    """
+    if table is None:
+        table = dict()
+    if not hasattr(tree, 'operands'):
+        key = (type(tree), tree.type, tree.value)
+        return table.setdefault(key, tree)
+    are_nodes = True
+    for i, u in enumerate(tree.operands):
+        if hasattr(u, 'operands') or hasattr(u, 'value'):
+            tree.operands[i] = share_subtrees(u, table)
+        else:
+            are_nodes = False
+    if not are_nodes:
+        return tree
+    key = (type(tree), tree.operator) + tuple(
+        id(u) for u in tree.operands)
+    return table.setdefault(key, tree)
+
+
+def _primed_def(u, name, primed):
+    """Return BDD `u` of operator `name` primed, stored in `primed`.
+
+    The `@` reference to the returned BDD is valid
+    as long as `primed` references it.
+    """
+    if primed is None:
+        raise ValueError((
+            'priming operator "{name}" requires a `dict` as '
+            'keyword argument `primed`').format(name=name))
+    r = primed.get(name)
+    if r is None:
+        r = _prime_bdd(u, name)
+        primed[name] = r
+    return r
+
+
+def _prime_bdd(u, name):
+    """Return BDD `u` of operator `name`, with its bits primed.
+
+    Priming an operator whose definition
+    contains primed variables raises `ValueError`.
+    """
+    bdd = u.bdd
+    support = bdd.support(u)
+    primed = [b for b in support if stx.isprimed(b)]
+    if primed:
+        raise ValueError((
+            'cannot prime operator "{name}", '
+            'because it depends on primed bits: {bits}').format(
+                name=name, bits=primed))
+    rename = {b: stx.prime(b) for b in support}
+    return bdd.let(rename, u)
+
+
+def _param_bits(params, kw):
+    """Return `list` of bits of the variables in `params`."""
+    assert params.operator == 'params', params.operator
+    bits = list()
+    for v in params.operands:
+        bits.extend(_flatten_var(v, **kw))
+    return bits
 
 
-_parser = lexyacc.Parser(nodes=Nodes())
+def _flatten_quantifier(forall, qbits, tree, kw):
+    r"""Return prefix formula for `\A qbits: tree` or `\E qbits: tree`.
+
+    Quantifiers are pushed into conjunctions and disjunctions,
+    based on the bits that each operand mentions
+    (see `_tree_bits`):
+
+      - `\E` distributes over `\/`, and `\A` over `/\`
+      - `\E` over `/\` (`\A` over `\/`) quantifies each bit
+        right after the last operand that mentions it
+        (see `_quantification_schedule`)
+    """
+    op = Nodes.opmap[r'\A' if forall else r'\E']
+    junction, operands = _junction_operands(tree)
+    if junction is None:
+        u = tree.flatten(mem=None, **kw)
+        if not qbits:
+            return u
+        cube = (len(qbits) - 1) * '& ' + ' '.join(qbits)
+        return ' {op} {cube} {u}'.format(op=op, cube=cube, u=u)
+    if junction == '/\\':
+        join = stx.conj_prefix
+    else:
+        join = stx.disj_prefix
+    supports = [_tree_bits(u, kw) for u in operands]
+    # distributive ?
+    if (junction == '/\\') == forall:
+        return join([
+            _flatten_quantifier(forall, qbits, u, kw)
+            if support is None else
+            _flatten_quantifier(
+                forall, [b for b in qbits if b in support], u, kw)
+            for u, support in zip(operands, supports)])
+    free, bound, schedule = _quantification_schedule(
+        operands, supports, qbits)
+    r = None
+    for u, q in zip(bound, schedule):
+        if r is None:
+            r = _flatten_quantifier(forall, q, u, kw)
+            continue
+        r = join([r, u.flatten(mem=None, **kw)])
+        if q:
+            cube = (len(q) - 1) * '& ' + ' '.join(q)
+            r = ' {op} {cube} {r}'.format(op=op, cube=cube, r=r)
+    us = [u.flatten(mem=None, **kw) for u in free]
+    if r is not None:
+        us.append(r)
+    return join(us)
+
+
+def _bdd_flatten_quantifier(forall, qbits, tree, kw):
+    """Return BDD, same as `_flatten_quantifier`.
+
+    The supports of operands are those of their BDDs.
+    The fused operations of `dd.cudd` are used,
+    if available, so conjunctions are not constructed.
+    """
+    bdd = kw['bdd']
+    junction, operands = _junction_operands(tree)
+    if junction is None:
+        u = tree.flatten(mem=None, **kw)
+        return bdd.quantify(u, qbits, forall=forall)
+    conj = (junction == '/\\')
+    # distributive ?
+    if conj == forall:
+        us = (
+            _bdd_flatten_quantifier(forall, qbits, u, kw)
+            for u in operands)
+        return _bdd_join(us, conj, bdd)
+    us = [u.flatten(mem=None, **kw) for u in operands]
+    supports = [bdd.support(u) for u in us]
+    free, bound, schedule = _quantification_schedule(
+        us, supports, qbits)
+    r = bdd.false if forall else bdd.true
+    for u, q in zip(bound, schedule):
+        r = _bdd_relprod(q, r, u, forall, bdd)
+    free.append(r)
+    return _bdd_join(free, conj, bdd)
+
+
+def _bdd_join(us, conj, bdd):
+    """Return conjunction (if `conj`) or disjunction of `us`."""
+    if conj:
+        r = bdd.true
+        for u in us:
+            r &= u
+    else:
+        r = bdd.false
+        for u in us:
+            r |= u
+    return r
+
+
+def _bdd_relprod(qbits, u, v, forall, bdd):
+    r"""Return `\E qbits: u /\ v`, or `\A qbits: u \/ v` if `forall`."""
+    if not qbits:
+        return (u | v) if forall else (u & v)
+    if _cudd is not None and isinstance(bdd, _cudd.BDD):
+        if forall:
+            return _cudd.or_forall(u, v, qbits)
+        return _cudd.and_exists(u, v, qbits)
+    if forall:
+        return bdd.forall(qbits, u | v)
+    return bdd.exist(qbits, u & v)
+
+
+def _quantification_schedule(operands, supports, qbits):
+    """Return when to quantify each bit in `qbits`.
+
+    Each bit is quantified right after
+    the last operand whose support contains it.
+
+    @param supports: `set` of bits for each operand,
+        `None` if unknown (treated as containing all `qbits`)
+    @return: `(free, bound, schedule)` where:
+        - `free`: operands that mention no bit in `qbits`
+        - `bound`: the other operands, in the given order
+        - `schedule`: `list` of `list` of bits to quantify
+          after each operand in `bound`
+    """
+    qset = set(qbits)
+    free = list()
+    bound = list()
+    bound_supports = list()
+    for u, support in zip(operands, supports):
+        if support is None:
+            support = qset
+        if qset.isdisjoint(support):
+            free.append(u)
+        else:
+            bound.append(u)
+            bound_supports.append(support)
+    later = set()
+    schedule = list()
+    for support in reversed(bound_supports):
+        q = [b for b in qbits if b in support and b not in later]
+        later.update(q)
+        schedule.append(q)
+    schedule.reverse()
+    return free, bound, schedule
+
+
+def _junction_operands(tree):
+    r"""Return `(op, operands)` if `tree` is a conjunction or disjunction.
+
+    Nested junctions of the same operator are flattened.
+    An implication `a => b` is read as `~ a \/ b`.
+
+    @return: `('/\', list)` or `('\/', list)`,
+        otherwise `(None, None)`
+    """
+    op = getattr(tree, 'operator', None)
+    if op == '=>':
+        op = r'\/'
+    if op not in ('/\\', r'\/'):
+        return None, None
+    operands = list()
+    stack = [tree]
+    while stack:
+        u = stack.pop()
+        u_op = getattr(u, 'operator', None)
+        if u_op == op:
+            stack.extend(reversed(u.operands))
+        elif u_op == '=>' and op == r'\/':
+            a, b = u.operands
+            if isinstance(u, BDDNodes.Binary):
+                nodes = BDDNodes
+            else:
+                nodes = Nodes
+            stack.extend([b, nodes.Unary('~', a)])
+        else:
+            operands.append(u)
+    return op, operands
+
+
+def _tree_bits(tree, kw, prime=False):
+    """Return `set` of bits that `tree` can depend on.
+
+    Bound variables are included, so the result
+    can be a superset of the support.
+
+    @param kw: keyword arguments of `flatten`
+    @return: `set`, or `None` if unknown
+    """
+    t = kw['t']
+    defs = kw.get('defs')
+    if isinstance(tree, Nodes.Var):
+        name = tree.value
+        if defs is not None and name in defs:
+            u = defs[name]
+            # BDD ?
+            if hasattr(u, 'var'):
+                bits = u.bdd.support(u)
+                if prime:
+                    bits = {stx.prime(b) for b in bits}
+                return set(bits)
+            if isinstance(u, list):
+                return None
+            return _tree_bits(u, kw, prime)
+        if name not in t and not _is_bool_var(name, t):
+            return None
+        bits = _var_bits(name, prime, t)
+        if stx.isinstance_str(bits):
+            return {bits}
+        return set(_filter_trailing_zeros(bits))
+    if not hasattr(tree, 'operands'):
+        return set()
+    if tree.operator in ('LET', '\\S', '@'):
+        return None
+    if tree.operator == 'X':
+        prime = True
+    bits = set()
+    for u in tree.operands:
+        if not hasattr(u, 'operands') and not hasattr(u, 'value'):
+            return None
+        s = _tree_bits(u, kw, prime)
+        if s is None:
+            return None
+        bits.update(s)
+    return bits
+
+
+def _flatten_shared(tree, mem, arg, kw):
+    """Return `tree._flatten(...)`, memoized in `kw['cse']`.
+
+    Results are keyed by the identity of `tree`,
+    so structurally equal subtrees are flattened once
+    if shared by `share_subtrees`.
+    In arithmetic scope, bitvector formulas refer to
+    registers of the memory buffer `mem`,
+    so they are reused only within that buffer.
+    BDD nodes are reused anywhere.
+    """
+    cse = kw.get('cse')
+    if cse is None:
+        return tree._flatten(mem=mem, *arg, **kw)
+    if mem is None or 'bdd' in kw:
+        scope = (mem is None)
+    else:
+        scope = id(mem)
+    key = (id(tree), bool(kw.get('prime')), scope)
+    if key in cse:
+        # `mem` stored to keep `id(mem)` unique
+        _, r = cse[key]
+    else:
+        r = tree._flatten(mem=mem, *arg, **kw)
+        cse[key] = (mem, r)
+    if isinstance(r, list):
+        return list(r)
+    return r
 
 
 def flatten_truncator(operands, mem=None, *arg, **kw):
@@ -678,8 +1456,14 @@ def less_than(p, q, mem):
         a=p[-1], b=q[-1], carry=carry)
 
 
-def flatten_arithmetic(operator, p, q, mem):
-    """Return flattened arithmetic expression."""
+def flatten_arithmetic(operator, p, q, mem, width=None):
+    """Return flattened arithmetic expression.
+
+    @param width: if not `None`, then the result is known
+        to fit in this many bits (including the sign bit),
+        so `+, -, *` are computed modulo `2**width`
+    @type width: `int` >= 2
+    """
     logger.info(
         '++ flatten arithmetic operator "{op}"'.format(
             op=operator))
@@ -689,22 +1473,248 @@ def flatten_arithmetic(operator, p, q, mem):
     start = len(mem)
     if operator in {'+', '-'}:
         add = (operator == '+')
-        result, res_mem, _ = adder_subtractor(p, q, add, start)
+        if width is None:
+            extend_by = 1
+        else:
+            p = _fit_width(p, width)
+            q = _fit_width(q, width)
+            extend_by = 0
+        result, res_mem, _ = adder_subtractor(
+            p, q, add, start, extend_by=extend_by)
     elif operator == '*':
-        result, res_mem = multiplier(p, q, start)
-    elif operator == '/':
-        result, _, res_mem = restoring_divider(p, q, start)
-    elif operator == '%':
-        _, result, res_mem = restoring_divider(p, q, start)
+        result, res_mem = multiplier(p, q, start, width=width)
+    elif operator in ('/', '%'):
+        # narrowed operands can have different widths
+        n = max(len(p), len(q))
+        quo, rem, res_mem = restoring_divider(
+            _fit_width(p, n), _fit_width(q, n), start)
+        result = quo if operator == '/' else rem
     else:
         raise ValueError(
             'Unknown arithmetic operator "{op}"'.format(
                 op=operator))
     mem.extend(res_mem)
+    if width is not None:
+        result = _fit_width(result, width)
     logger.info('-- done flattening "{op}"\n'.format(op=operator))
     return result
 
 
+def _value_range(tree, t, defs=None, memo=None):
+    """Return interval of values that `tree` can take.
+
+    Variables range over all values that their bits can store,
+    which includes the declared `dom`, so the analysis is
+    sound also for assignments outside the type invariants.
+    The bitblaster extends widths to avoid overflow,
+    so the ranges of `+, -, *` are exact.
+
+    @param t: symbol table, as returned by `bitblast_table`
+    @param defs: operator definitions
+    @param memo: `dict` that maps `id` of each subtree
+        to the subtree and its range, so each subtree
+        is analyzed once (as in `_flatten_shared`)
+    @return: `(min, max)`, or `None` if unknown
+    @rtype: `tuple` of `int`
+    """
+    if t is None:
+        return None
+    if memo is None:
+        return _value_range_of(tree, t, defs, memo)
+    key = id(tree)
+    if key in memo:
+        # `tree` stored to keep `id(tree)` unique
+        _, r = memo[key]
+        return r
+    r = _value_range_of(tree, t, defs, memo)
+    memo[key] = (tree, r)
+    return r
+
+
+def _value_range_of(tree, t, defs, memo):
+    """Return interval of values of `tree`, see `_value_range`."""
+    if isinstance(tree, Nodes.Num):
+        x = int(tree.value)
+        return x, x
+    if isinstance(tree, Nodes.Unary):
+        if tree.operator != 'X':
+            return None
+        (e,) = tree.operands
+        return _value_range(e, t, defs, memo)
+    if isinstance(tree, Nodes.Var):
+        name = tree.value
+        if defs is not None and name in defs:
+            u = defs[name]
+            if isinstance(u, list):
+                return _bits_range(u)
+            # BDD ?
+            if hasattr(u, 'var'):
+                return None
+            return _value_range(u, t, defs, memo)
+        if name not in t or t[name]['type'] == 'bool':
+            return None
+        return _var_range(name, t)
+    if isinstance(tree, Nodes.Operator):
+        if tree.operator != 'ite':
+            return None
+        _, x, y = tree.operands
+        x = _value_range(x, t, defs, memo)
+        y = _value_range(y, t, defs, memo)
+        if x is None or y is None:
+            return None
+        return min(x[0], y[0]), max(x[1], y[1])
+    if not isinstance(tree, Nodes.Arithmetic):
+        return None
+    op = tree.operator
+    x, y = tree.operands
+    if op == '<<>>':
+        n = int(y.value)
+        return 0, 2**n - 1
+    x = _value_range(x, t, defs, memo)
+    if x is None:
+        return None
+    y = _value_range(y, t, defs, memo)
+    if y is None:
+        return None
+    (a, b), (c, d) = x, y
+    if op == '+':
+        r = (a + c, b + d)
+    elif op == '-':
+        r = (a - d, b - c)
+    elif op == '*':
+        products = [a * c, a * d, b * c, b * d]
+        r = (min(products), max(products))
+    elif op in ('/', '%'):
+        # zero divisor ?
+        if c <= 0 <= d:
+            return None
+        # quotient rounds toward zero,
+        # remainder has the sign of the dividend
+        if a == b and c == d:
+            quo = abs(a) // abs(c)
+            if (a < 0) != (c < 0):
+                quo = -quo
+            m = quo if op == '/' else a - c * quo
+            return m, m
+        m = max(abs(a), abs(b))
+        if op == '%':
+            m = min(m, max(abs(c), abs(d)) - 1)
+        r = (-m if a < 0 else 0, m if b > 0 else 0)
+    else:
+        return None
+    # may be truncated by the ALU ?
+    if _range_width(r) >= ALU_BITWIDTH:
+        return None
+    return r
+
+
+def _var_range(name, t):
+    """Return interval of values stored in the bits of `name`."""
+    d = t[name]
+    encoding = d.get('encoding', 'binary')
+    if encoding == 'binary':
+        return _bits_range(var_to_twos_complement(name, t))
+    if encoding == 'onehot':
+        n = _onehot_width(d['bitnames'])
+    else:
+        n = d['width']
+    minval = d['dom'][0]
+    return minval, minval + 2**n - 1
+
+
+def _bits_range(bits):
+    """Return interval of values of two's complement `bits`.
+
+    Bits other than the constants "0" and "1" can take
+    either value, so BDD nodes are treated as unknown.
+    """
+    lo = 0
+    hi = 0
+    n = len(bits) - 1
+    for i, b in enumerate(bits):
+        w = -2**i if i == n else 2**i
+        if stx.isinstance_str(b) and b == '0':
+            continue
+        if stx.isinstance_str(b) and b == '1':
+            lo += w
+            hi += w
+            continue
+        lo += min(w, 0)
+        hi += max(w, 0)
+    return lo, hi
+
+
+def _range_width(rng):
+    """Return width of two's complement that fits `rng`.
+
+    @param rng: `(min, max)` or `None`
+    @return: `int` >= 2 that includes the sign bit,
+        or `None` if `rng is None`
+    """
+    if rng is None:
+        return None
+    n = max(
+        x.bit_length() if x >= 0 else (~ x).bit_length()
+        for x in rng)
+    return max(n + 1, 2)
+
+
+def _fit_width(x, n):
+    """Return two's complement `x` truncated or extended to `n` bits.
+
+    Truncation preserves the value of `x`
+    only if the value fits in `n` bits.
+    """
+    if len(x) < n:
+        return sign_extension(x, n)
+    return truncate(x, n)
+
+
+def _decide_comparison(tree, kw):
+    """Return `bool` if the ranges of operands decide `tree`.
+
+    @param tree: `Nodes.Comparator`
+    @param kw: keyword arguments of `flatten`
+    @return: `True` or `False`, or `None` if undecided
+    """
+    t = kw.get('t')
+    defs = kw.get('defs')
+    memo = kw.get('ranges')
+    p, q = tree.operands
+    x = _value_range(p, t, defs, memo)
+    if x is None:
+        return None
+    y = _value_range(q, t, defs, memo)
+    if y is None:
+        return None
+    op = tree.operator
+    if op in ('>', '>='):
+        x, y = y, x
+        op = '<' if op == '>' else '<='
+    (a, b), (c, d) = x, y
+    if op == '<':
+        if b < c:
+            return True
+        if a >= d:
+            return False
+    elif op == '<=':
+        if b <= c:
+            return True
+        if a > d:
+            return False
+    elif op in ('=', '!=', '/='):
+        if a == b == c == d:
+            r = True
+        elif b < c or d < a:
+            r = False
+        else:
+            return None
+        if op != '=':
+            r = not r
+        return r
+    return None
+
+
 def restoring_divider(x, y, start=0):
     """Return divider for bitvectors `x`, `y`.
 
@@ -796,17 +1806,23 @@ def _restoring_divider(x, y, s=None, start=0):
     return quo, rem, mem
 
 
-def multiplier(x, y, start=0):
+def multiplier(x, y, start=0, width=None):
     """Return the signed product of `x` and `y`.
 
     @param x, y: multiplicands
     @type x, y: `list`
+    @param width: if not `None`, then compute
+        the product modulo `2**width`
 
     @return: (result, memory)
     @rtype: `tuple(list, list)`
     """
     assert isinstance(x, list), x
     assert isinstance(y, list), y
+    if width is not None:
+        p = _fit_width(x, width)
+        q = _fit_width(y, width)
+        return _multiplier(p, q, s=None, start=start)
     nx = len(x)
     ny = len(y)
     n = nx + ny
@@ -1075,6 +2091,116 @@ def var_to_twos_complement(var, t):
     return bits
 
 
+def _var_bits(name, prime, t):
+    """Return bits that store variable `name`.
+
+    @return: name of bit if `name` is Boolean-valued,
+        else `list` of bits, as `var_to_twos_complement`
+    """
+    if _is_bool_var(name, t):
+        return '{v}{prime}'.format(
+            v=name, prime=stx.PRIME if prime else '')
+    assert name in t, (
+        '"{name}" neither var nor operator'.format(
+            name=name))
+    # arithmetic context
+    # must be integer variable
+    # a refinement occurs here automatically
+    bits = var_to_twos_complement(name, t)
+    bits = ["{b}{prime}".format(
+            b=b, prime=stx.PRIME
+            if not b[0].isdigit() and prime else '')
+        for b in bits]
+    return bits
+
+
+def decode_bits(bits, d):
+    """Return two's complement of value stored in `bits`.
+
+    The inverse of `encode_int`, at the bit level.
+    The stored bits are decoded to the unsigned `value - min`,
+    then the constant `min` is added, with a ripple-carry
+    adder whose formulas need no memory buffer.
+
+    @param bits: as returned by `var_to_twos_complement`
+    @param d: attributes of integer variable
+    """
+    encoding = d.get('encoding', 'binary')
+    if encoding == 'binary':
+        return bits
+    # omit the sign bit
+    code = bits[:-1]
+    if encoding == 'gray':
+        bits = list()
+        b = '0'
+        for g in reversed(code):
+            b = '^ {b} {g}'.format(b=b, g=g)
+            bits.append(b)
+        bits.reverse()
+    elif encoding == 'onehot':
+        bits = [
+            stx.disj_prefix([x for i, x in enumerate(code)
+                             if (i >> j) & 1])
+            for j in range(_onehot_width(code))]
+    else:
+        assert encoding == 'offset', encoding
+        bits = list(code)
+    bits.append('0')
+    minval = d['dom'][0]
+    if minval == 0:
+        return bits
+    c = int_to_twos_complement(minval)
+    p, q = equalize_width(bits, c, extend_by=1)
+    r = list()
+    carry = '0'
+    for a, b in zip(p, q):
+        if b == '0':
+            r.append('^ {a} {c}'.format(a=a, c=carry))
+            carry = '& {a} {c}'.format(a=a, c=carry)
+        else:
+            r.append('! ^ {a} {c}'.format(a=a, c=carry))
+            carry = '| {a} {c}'.format(a=a, c=carry)
+    return r
+
+
+def _bdd_decode_bits(bits, d, bdd):
+    """Return `list` of BDD nodes, same as `decode_bits`."""
+    encoding = d.get('encoding', 'binary')
+    if encoding == 'binary':
+        return bits
+    code = bits[:-1]
+    if encoding == 'gray':
+        bits = list()
+        b = bdd.false
+        for g in reversed(code):
+            b = bdd.apply('xor', b, g)
+            bits.append(b)
+        bits.reverse()
+    elif encoding == 'onehot':
+        bits = list()
+        for j in range(_onehot_width(code)):
+            b = bdd.false
+            for i, x in enumerate(code):
+                if (i >> j) & 1:
+                    b |= x
+            bits.append(b)
+    else:
+        assert encoding == 'offset', encoding
+        bits = list(code)
+    bits.append(bdd.false)
+    minval = d['dom'][0]
+    if minval == 0:
+        return bits
+    c = _bdd_bits(int_to_twos_complement(minval), bdd)
+    r, _ = _bdd_adder_subtractor(bits, c, bdd)
+    return r
+
+
+def _onehot_width(code):
+    """Return number of bits of the largest index in `code`."""
+    return max((len(code) - 1).bit_length(), 1)
+
+
 def _append_sign_bit(bits, var, d):
     """Convert trimmed bitfield to two's complement.
 
@@ -1091,6 +2217,10 @@ def _append_sign_bit(bits, var, d):
     """
     logger.debug('bits of "{var}": {bits}"'.format(
         var=var, bits=bits))
+    # encoded as unsigned integer ?
+    if d.get('encoding', 'binary') != 'binary':
+        bits.append('0')
+        return
     # variable sign ?
     if d['signed']:
         logger.debug('variable "{var}" is signed'.format(var=var))
@@ -1298,15 +2428,394 @@ def _format_mem(mem):
                       for i, v in enumerate(mem)))
 
 
-def _flatten_var(v, *arg, **kw):
-    """Return `list` of bits, for both integer and Boolean var."""
-    flat = v.flatten(*arg, **kw)
+def _flatten_var(v, prime=None, t=None, **kw):
+    """Return `list` of bits, for both integer and Boolean var.
+
+    The bits are those that store the variable,
+    so no decoding (see `decode_bits`).
+    """
+    if isinstance(v, Nodes.Unary):
+        assert v.operator == 'X', v.operator
+        prime = True
+        (v,) = v.operands
+    flat = _var_bits(v.value, prime, t)
     # bool ?
     if stx.isinstance_str(flat):
         flat = [flat]
-    bits = _filter_trailing_zeros(flat)
-    return bits
+    return _filter_trailing_zeros(flat)
 
 
 def _filter_trailing_zeros(flat):
     return [b for b in flat if not b[0].isdigit()]
+
+
+def _bdd_flatten_var(v, prime=None, t=None, **kw):
+    """Return `list` of bit names, for both integer and Boolean var."""
+    return _flatten_var(v, prime=prime, t=t)
+
+
+def _bdd_bits(bits, bdd):
+    """Return `list` of BDD nodes for `list` of bit names."""
+    r = list()
+    for b in bits:
+        if b == '0':
+            u = bdd.false
+        elif b == '1':
+            u = bdd.true
+        else:
+            u = bdd.var(b)
+        r.append(u)
+    return r
+
+
+def _bdd_comparator(operator, x, y, bdd):
+    """Return BDD for comparison of bitvectors `x`, `y`.
+
+    Same as `flatten_comparator`, for bits that are BDD nodes.
+    """
+    assert isinstance(x, list), x
+    assert isinstance(y, list), y
+    p, q = equalize_width(x, y)
+    negate = False
+    if operator in {'=', '!=', '/='}:
+        r = _bdd_inequality(p, q, bdd)
+        negate = (operator == '=')
+    elif operator in {'<', '<=', '>=', '>'}:
+        swap = operator in ('<=', '>')
+        negate = operator in ('<=', '>=')
+        if swap:
+            p, q = q, p
+        r = _bdd_less_than(p, q, bdd)
+    else:
+        raise ValueError(
+            'unknown operator "{op}"'.format(op=operator))
+    if negate:
+        r = ~ r
+    return r
+
+
+def _bdd_linear_comparator(tree, kw):
+    """Return BDD for comparison of linear expressions.
+
+    The comparison `p op q` is written as `S op 0`,
+    where `S == p - q` is a weighted sum of bits plus
+    a constant. Equality is the conjunction of
+    `S <= 0` and `-S <= 0`. Each inequality is built
+    by `_bdd_linear_leq`.
+
+    @param tree: `Nodes.Comparator`
+    @param kw: keyword arguments of `flatten`
+    @return: BDD node, or `None` if `p` or `q` is not linear
+        in integer variables with "binary" or "offset" encoding
+    """
+    op = tree.operator
+    t = kw['t']
+    defs = kw.get('defs')
+    p, q = tree.operands
+    lin = _linear_form(p, t, defs, kw.get('prime'))
+    if lin is None:
+        return None
+    other = _linear_form(q, t, defs, kw.get('prime'))
+    if other is None:
+        return None
+    weights, const = lin
+    for bit, w in other[0].items():
+        weights[bit] = weights.get(bit, 0) - w
+    const -= other[1]
+    # normalize to `S <= 0` or `S = 0`
+    negate = False
+    if op in ('>', '>='):
+        weights = {b: -w for b, w in weights.items()}
+        const = -const
+        op = '<' if op == '>' else '<='
+    if op == '<':
+        const += 1
+        op = '<='
+    elif op in ('!=', '/='):
+        negate = True
+        op = '='
+    assert op in ('<=', '='), op
+    bdd = kw['bdd']
+    weights = {b: w for b, w in weights.items() if w != 0}
+    r = _bdd_linear_leq(weights, const, bdd)
+    if op == '=':
+        neg = {b: -w for b, w in weights.items()}
+        r &= _bdd_linear_leq(neg, -const, bdd)
+    if negate:
+        r = ~ r
+    return r
+
+
+def _bdd_linear_leq(weights, const, bdd):
+    """Return BDD for `const + sum of weighted bits <= 0`.
+
+    The BDD is built over the bits in the current
+    variable order. At each level, the partial sums that
+    yield the same BDD form an interval, so the memo
+    stores intervals, as in the construction of BDDs
+    for pseudo-Boolean constraints by Abio et al.
+    So the number of memoized intervals is at most the
+    number of BDD nodes, independently of the weights.
+
+    @param weights: `dict` that maps bits to nonzero `int`
+    @type const: `int`
+    @return: BDD node
+    """
+    bits = sorted(weights, key=bdd.level_of_var)
+    ws = [weights[b] for b in bits]
+    # bounds of the sum of remaining bits
+    n = len(bits)
+    lo = [0] * (n + 1)
+    hi = [0] * (n + 1)
+    for i in range(n - 1, -1, -1):
+        w = ws[i]
+        lo[i] = lo[i + 1] + min(w, 0)
+        hi[i] = hi[i + 1] + max(w, 0)
+    # level -> sorted starts, and (start, end, node)
+    starts = [list() for _ in range(n)]
+    intervals = [list() for _ in range(n)]
+    levels = (bits, ws, lo, hi, starts, intervals)
+    u, _, _ = _bdd_linear_leq_node(0, const, levels, bdd)
+    return u
+
+
+def _bdd_linear_leq_node(i, s, levels, bdd):
+    """Return `(u, a, b)` such that the partial sum
+    `s` and each partial sum in `a..b` yield `u`.
+
+    A function, instead of a closure, in order to avoid
+    a reference cycle that holds BDD nodes.
+    """
+    bits, ws, lo, hi, starts, intervals = levels
+    inf = float('inf')
+    # constant ?
+    if s + hi[i] <= 0:
+        return bdd.true, -inf, -hi[i]
+    if s + lo[i] > 0:
+        return bdd.false, 1 - lo[i], inf
+    j = bisect.bisect_right(starts[i], s) - 1
+    if j >= 0:
+        a, b, u = intervals[i][j]
+        if s <= b:
+            return u, a, b
+    w = ws[i]
+    high, ah, bh = _bdd_linear_leq_node(i + 1, s + w, levels, bdd)
+    low, al, bl = _bdd_linear_leq_node(i + 1, s, levels, bdd)
+    a = max(ah - w, al)
+    b = min(bh - w, bl)
+    u = bdd.ite(bdd.var(bits[i]), high, low)
+    j = bisect.bisect_left(starts[i], a)
+    starts[i].insert(j, a)
+    intervals[i].insert(j, (a, b, u))
+    return u, a, b
+
+
+def _linear_form(tree, t, defs, prime=False):
+    """Return `(weights, constant)` if `tree` is linear.
+
+    @return: `None` if not linear, otherwise `tuple` with:
+        - `weights`: `dict` that maps bits to integer weights
+        - `constant`: `int`
+        such that the value of `tree` equals the
+        weighted sum of bits plus `constant`
+    """
+    if isinstance(tree, Nodes.Num):
+        return dict(), int(tree.value)
+    if isinstance(tree, Nodes.Unary):
+        if tree.operator != 'X':
+            return None
+        (e,) = tree.operands
+        return _linear_form(e, t, defs, prime=True)
+    if isinstance(tree, Nodes.Var):
+        name = tree.value
+        if defs is not None and name in defs:
+            u = defs[name]
+            # BDD or list at arithmetic level ?
+            if hasattr(u, 'var') or isinstance(u, list):
+                return None
+            return _linear_form(u, t, defs, prime)
+        if name not in t or t[name]['type'] == 'bool':
+            return None
+        d = t[name]
+        encoding = d.get('encoding', 'binary')
+        if encoding not in ('binary', 'offset'):
+            return None
+        bits = _var_bits(name, prime, t)
+        weights = dict()
+        const = 0
+        if encoding == 'offset':
+            const = d['dom'][0]
+        n = len(bits) - 1
+        for i, b in enumerate(bits):
+            w = -2**i if i == n else 2**i
+            if b == '1':
+                const += w
+            elif b != '0':
+                weights[b] = w
+        return weights, const
+    if not isinstance(tree, Nodes.Arithmetic):
+        return None
+    op = tree.operator
+    if op not in ('+', '-', '*'):
+        return None
+    x, y = tree.operands
+    x = _linear_form(x, t, defs, prime)
+    if x is None:
+        return None
+    y = _linear_form(y, t, defs, prime)
+    if y is None:
+        return None
+    if op == '*':
+        # constant factor ?
+        if not y[0]:
+            x, y = y, x
+        if x[0]:
+            return None
+        c = x[1]
+        weights = {b: c * w for b, w in y[0].items()}
+        return weights, c * y[1]
+    sign = 1 if op == '+' else -1
+    weights = dict(x[0])
+    for b, w in y[0].items():
+        weights[b] = weights.get(b, 0) + sign * w
+    return weights, x[1] + sign * y[1]
+
+
+def _bdd_inequality(p, q, bdd):
+    """Return BDD for '/='."""
+    assert len(p) == len(q), (p, q)
+    r = bdd.false
+    for a, b in zip(p, q):
+        r |= bdd.apply('xor', a, b)
+    return r
+
+
+def _bdd_less_than(p, q, bdd):
+    """Return BDD for '<'."""
+    _, carry = _bdd_adder_subtractor(p, q, bdd, add=False)
+    return bdd.apply('xor', ~ bdd.apply('xor', p[-1], q[-1]), carry)
+
+
+def _bdd_arithmetic(operator, p, q, bdd, width=None):
+    """Return `list` of BDD nodes, same as `flatten_arithmetic`."""
+    assert isinstance(p, list), p
+    assert isinstance(q, list), q
+    if operator in {'+', '-'}:
+        add = (operator == '+')
+        if width is None:
+            extend_by = 1
+        else:
+            p = _fit_width(p, width)
+            q = _fit_width(q, width)
+            extend_by = 0
+        result, _ = _bdd_adder_subtractor(
+            p, q, bdd, add, extend_by=extend_by)
+    elif operator == '*':
+        result = _bdd_multiplier(p, q, bdd, width=width)
+    elif operator in ('/', '%'):
+        # narrowed operands can have different widths
+        n = max(len(p), len(q))
+        quo, rem = _bdd_divider(
+            _fit_width(p, n), _fit_width(q, n), bdd)
+        result = quo if operator == '/' else rem
+    else:
+        raise ValueError(
+            'Unknown arithmetic operator "{op}"'.format(
+                op=operator))
+    if width is not None:
+        result = _fit_width(result, width)
+    return result
+
+
+def _bdd_adder_subtractor(x, y, bdd, add=True, extend_by=1):
+    """Return sum of `x` and `y`, and the carry out.
+
+    Same as `adder_subtractor`, for bits that are BDD nodes.
+
+    @return: (result, carry)
+    """
+    assert extend_by >= 0, extend_by
+    p, q = equalize_width(x, y, extend_by=extend_by)
+    # invert
+    if add:
+        carry = bdd.false
+    else:
+        q = [~ b for b in q]
+        carry = bdd.true
+    result = list()
+    for a, b in zip(p, q):
+        a_xor_b = bdd.apply('xor', a, b)
+        result.append(bdd.apply('xor', a_xor_b, carry))
+        carry = (a & b) | (a_xor_b & carry)
+    return result, carry
+
+
+def _bdd_multiplier(x, y, bdd, width=None):
+    """Return the signed product of `x` and `y`.
+
+    Same as `multiplier`, for bits that are BDD nodes.
+    """
+    nx = len(x)
+    ny = len(y)
+    if width is None:
+        n = nx + ny
+        p, q = equalize_width(x, y, extend_by=min(nx, ny))
+    else:
+        n = width
+        p = _fit_width(x, n)
+        q = _fit_width(y, n)
+    res = [bdd.false] * n
+    for s, b in enumerate(q):
+        shifted_p = s * [bdd.false] + p[:n - s]
+        z = [a & b for a in shifted_p]
+        res, _ = _bdd_adder_subtractor(
+            res, z, bdd, add=True, extend_by=0)
+    if n > ALU_BITWIDTH:
+        print('WARNING: (bitvector) '
+              'Truncating multiplication to {alu} bits.'.format(
+                  alu=ALU_BITWIDTH))
+        res = truncate(res, ALU_BITWIDTH)
+    return res
+
+
+def _bdd_divider(x, y, bdd):
+    """Return quotient and remainder of `x` divided by `y`.
+
+    Same as `restoring_divider`, for bits that are BDD nodes.
+
+    @return: (quotient, remainder)
+    """
+    a = _bdd_negate_if(sign(x), x, bdd)
+    b = _bdd_negate_if(sign(y), y, bdd)
+    # divide
+    n = len(a)
+    div = b + (2 * n - len(b)) * [bdd.false]
+    div = n * [bdd.false] + div[:n]
+    quo = list()
+    rem = a + n * [bdd.false]
+    for _ in range(n):
+        shifted_p = [bdd.false] + rem[:-1]
+        r, _ = _bdd_adder_subtractor(
+            shifted_p, div, bdd, add=False, extend_by=0)
+        q = ~ sign(r)
+        quo.insert(0, q)
+        rem = [bdd.ite(q, u, v) for u, v in zip(r, shifted_p)]
+    rem = rem[n:]
+    # fix signs
+    opposite_signs = bdd.apply('xor', sign(x), sign(y))
+    quo = _bdd_negate_if(opposite_signs, quo, bdd)
+    rem = _bdd_negate_if(sign(x), rem, bdd)
+    return quo, rem
+
+
+def _bdd_negate_if(guard, x, bdd):
+    """Return conditional negation of `x`.
+
+    Same as `_negate_if`, for bits that are BDD nodes.
+    """
+    n = len(x)
+    zero = n * [bdd.false]
+    neg_x, _ = _bdd_adder_subtractor(
+        zero, x, bdd, add=False, extend_by=1)
+    ext_x = sign_extension(x, n + 1)
+    return [bdd.ite(guard, a, b) for a, b in zip(neg_x, ext_x)]
@@ -394,6 +394,32 @@ class Parser(astutils.Parser):
         p[0] = self.nodes.Str('"' + p[2] + '"')
 
 
+class LazyParser(object):
+    """Parser that is constructed on first use.
+
+    Modules keep parsers as globals. Building the lexer
+    and loading the LALR tables is deferred until the
+    first call to `parse`, so importing a module is cheap.
+
+    @param kw: passed to `Parser`
+    """
+
+    def __init__(self, **kw):
+        self._kw = kw
+        self._parser = None
+
+    @property
+    def parser(self):
+        """Return `Parser`, constructing it if needed."""
+        if self._parser is None:
+            self._parser = Parser(**self._kw)
+        return self._parser
+
+    def parse(self, formula):
+        """Return syntax tree of `formula`."""
+        return self.parser.parse(formula)
+
+
 def _rewrite_tables(outputdir='./'):
     astutils.rewrite_tables(Parser, TABMODULE, outputdir)
 
@@ -0,0 +1,103 @@
+
+# ltl_parsetab.py
+# This file is automatically generated. Do not edit.
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'startnonassocREDUCE_LISTnonassocDEFnonassocLET_INIF_THEN_ELSECONJ_LISTleftCOLONleftEQUIVleftIMPLIESleftXORleftORleftANDleftALWAYSEVENTUALLYHISTORICALLYONCEleftUNTILWEAK_UNTILRELEASESINCETRIGGERleftEQUALSNEQUALSleftLTLEGTGEINleftPLUSMINUSleftTIMESDIVMODrightNOTUMINUSleftRENAMEleftFORALLEXISTSrightNEXTWEAK_PREVIOUSPREVIOUSnonassocDOTSleftPRIMELPAREN RPAREN DQUOTES COMMA NOT AND OR XOR IMPLIES EQUIV EQUALS NEQUALS LT LE GT GE PLUS MINUS TIMES DIV MOD TRUNCATE PREVIOUS WEAK_PREVIOUS HISTORICALLY ALWAYS EVENTUALLY ONCE PRIME DOTS AT FORALL EXISTS RENAME IN COLON DEF NAME NUMBER CONSTANT CONSTANTS ELSE FALSE IF IN_EXPR ITE LET NEXT RELEASE SINCE THEN TRIGGER TRUE UNTIL VARIABLE VARIABLES WEAK_UNTILstart : module\n                 | expr\n        module : unitsunits : units unitunits : unitunit : def\n                | var_decl\n                | const_decl\n        var_decl : VARIABLE list\n                    | VARIABLES list\n        const_decl : CONSTANT list\n                      | CONSTANTS list\n        defs : defs defdefs : defdef : NAME DEF expr expr : LET defs IN_EXPR expr %prec LET_INexpr : TRUE\n                | FALSE\n        expr : expr PRIMEexpr : NOT expr\n                | ALWAYS expr\n                | EVENTUALLY expr\n                | NEXT expr\n                | WEAK_PREVIOUS expr\n                | PREVIOUS expr\n                | HISTORICALLY expr\n                | ONCE expr\n        expr : expr AND expr\n                | expr OR expr\n                | expr XOR expr\n                | expr IMPLIES expr\n                | expr EQUIV expr\n                | expr UNTIL expr\n                | expr WEAK_UNTIL expr\n                | expr RELEASE expr\n                | expr SINCE expr\n                | expr TRIGGER expr\n        expr : expr EQUALS expr\n                | expr NEQUALS expr\n                | expr LT expr\n                | expr LE expr\n                | expr GT expr\n                | expr GE expr\n        expr : expr TIMES expr\n                | expr DIV expr\n                | expr MOD expr\n                | expr PLUS expr\n                | expr MINUS expr\n        expr : junc_list  %prec REDUCE_LISTjunc_list : junc_list AND expr\n                     | junc_list OR expr\n        junc_list : AND expr\n                     | OR expr  %prec CONJ_LIST\n        expr : expr TRUNCATE numberexpr : IF expr THEN expr ELSE expr %prec IF_THEN_ELSEexpr : ITE LPAREN expr COMMA expr COMMA expr RPARENexpr : FORALL list COLON expr\n                | EXISTS list COLON expr\n        expr : RENAME pairs COLON exprexpr : expr IN exprexpr : number DOTS numberlist : list COMMA exprlist : exprpairs : pairs COMMA pairpairs : pairpair : expr DIV exprexpr : LPAREN expr RPARENexpr : varvar : NAMEexpr : AT numberexpr : numbernumber : NUMBERnumber : MINUS NUMBER %prec UMINUSexpr : DQUOTES NAME DQUOTES'
+    
+_lr_action_items = {'LET':([0,8,9,10,11,12,13,14,15,16,17,21,23,24,25,26,36,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,80,81,84,94,122,127,130,131,132,133,134,135,140,147,150,],[5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,]),'TRUE':([0,8,9,10,11,12,13,14,15,16,17,21,23,24,25,26,36,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,80,81,84,94,122,127,130,131,132,133,134,135,140,147,150,],[6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,]),'FALSE':([0,8,9,10,11,12,13,14,15,16,17,21,23,24,25,26,36,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,80,81,84,94,122,127,130,131,132,133,134,135,140,147,150,],[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,]),'NOT':([0,8,9,10,11,12,13,14,15,16,17,21,23,24,25,26,36,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,80,81,84,94,122,127,130,131,132,133,134,135,140,147,150,],[8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,]),'ALWAYS':([0,8,9,10,11,12,13,14,15,16,17,21,23,24,25,26,36,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,80,81,84,94,122,127,130,131,132,133,134,135,140,147,150,],[9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,]),'EVENTUALLY':([0,8,9,10,11,12,13,14,15,16,17,21,23,24,25,26,36,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,80,81,84,94,122,127,130,131,132,133,134,135,140,147,150,],[10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,]),'NEXT':([0,8,9,10,11,12,13,14,15,16,17,21,23,24,25,26,36,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,80,81,84,94,122,127,130,131,132,133,134,135,140,147,150,],[11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,]),'WEAK_PREVIOUS':([0,8,9,10,11,12,13,14,15,16,17,21,23,24,25,26,36,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,80,81,84,94,122,127,130,131,132,133,134,135,140,147,150,],[12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,]),'PREVIOUS':([0,8,9,10,11,12,13,14,15,16,17,21,23,24,25,26,36,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,80,81,84,94,122,127,130,131,132,133,134,135,140,147,150,],[13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,]),'HISTORICALLY':([0,8,9,10,11,12,13,14,15,16,17,21,23,24,25,26,36,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,80,81,84,94,122,127,130,131,132,133,134,135,140,147,150,],[14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,]),'ONCE':([0,8,9,10,11,12,13,14,15,16,17,21,23,24,25,26,36,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,80,81,84,94,122,127,130,131,132,133,134,135,140,147,150,],[15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,]),'IF':([0,8,9,10,11,12,13,14,15,16,17,21,23,24,25,26,36,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,80,81,84,94,122,127,130,131,132,133,134,135,140,147,150,],[21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,]),'ITE':([0,8,9,10,11,12,13,14,15,16,17,21,23,24,25,26,36,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,80,81,84,94,122,127,130,131,132,133,134,135,140,147,150,],[22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,]),'FORALL':([0,8,9,10,11,12,13,14,15,16,17,21,23,24,25,26,36,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,80,81,84,94,122,127,130,131,132,133,134,135,140,147,150,],[24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,]),'EXISTS':([0,8,9,10,11,12,13,14,15,16,17,21,23,24,25,26,36,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,80,81,84,94,122,127,130,131,132,133,134,135,140,147,150,],[25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,]),'RENAME':([0,8,9,10,11,12,13,14,15,16,17,21,23,24,25,26,36,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,80,81,84,94,122,127,130,131,132,133,134,135,140,147,150,],[26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,]),'LPAREN':([0,8,9,10,11,12,13,14,15,16,17,21,22,23,24,25,26,36,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,80,81,84,94,122,127,130,131,132,133,134,135,140,147,150,],[23,23,23,23,23,23,23,23,23,23,23,23,84,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,]),'AT':([0,8,9,10,11,12,13,14,15,16,17,21,23,24,25,26,36,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,80,81,84,94,122,127,130,131,132,133,134,135,140,147,150,],[28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,]),'DQUOTES':([0,8,9,10,11,12,13,14,15,16,17,21,23,24,25,26,36,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,80,81,84,93,94,122,127,130,131,132,133,134,135,140,147,150,],[29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,136,29,29,29,29,29,29,29,29,29,29,29,29,]),'AND':([0,3,6,7,8,9,10,11,12,13,14,15,16,17,19,20,21,23,24,25,26,27,30,32,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,68,69,70,71,72,73,74,75,76,77,78,79,80,81,83,84,85,87,90,92,94,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,146,147,148,149,150,151,152,],[16,41,-17,-18,16,16,16,16,16,16,16,16,16,16,80,-71,16,16,16,16,16,-68,-69,-72,16,16,16,16,-19,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,-20,-69,-21,-22,-23,-24,-25,-26,-27,-52,41,-73,16,16,41,16,41,41,41,-70,16,-28,41,41,41,41,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-54,-60,16,-50,41,-61,16,41,-67,16,16,16,16,16,16,-74,41,41,41,16,41,41,41,41,-45,16,41,41,16,41,-56,]),'OR':([0,3,6,7,8,9,10,11,12,13,14,15,16,17,19,20,21,23,24,25,26,27,30,32,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,68,69,70,71,72,73,74,75,76,77,78,79,80,81,83,84,85,87,90,92,94,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,146,147,148,149,150,151,152,],[17,42,-17,-18,17,17,17,17,17,17,17,17,17,17,81,-71,17,17,17,17,17,-68,-69,-72,17,17,17,17,-19,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,-20,-69,-21,-22,-23,-24,-25,-26,-27,-52,42,-73,17,17,42,17,42,42,42,-70,17,-28,-29,42,42,42,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-54,-60,17,-50,-51,-61,17,42,-67,17,17,17,17,17,17,-74,42,42,42,17,42,42,42,42,-45,17,42,42,17,42,-56,]),'NUMBER':([0,8,9,10,11,12,13,14,15,16,17,18,21,23,24,25,26,28,36,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,80,81,82,84,94,122,127,130,131,132,133,134,135,140,147,150,],[32,32,32,32,32,32,32,32,32,32,32,79,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,]),'MINUS':([0,3,6,7,8,9,10,11,12,13,14,15,16,17,19,20,21,23,24,25,26,27,28,30,32,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,87,90,92,94,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,146,147,148,149,150,151,152,],[18,61,-17,-18,18,18,18,18,18,18,18,18,18,18,-49,-71,18,18,18,18,18,-68,18,-69,-72,18,18,18,18,-19,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,-20,-69,61,61,-23,-24,-25,61,61,61,61,-73,18,18,18,61,18,61,61,61,-70,18,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,-44,-45,-46,-47,-48,-54,61,18,61,61,-61,18,61,-67,18,18,18,18,18,18,-74,61,61,61,18,61,61,61,61,-45,18,61,61,18,61,-56,]),'NAME':([0,4,5,6,7,8,9,10,11,12,13,14,15,16,17,19,20,21,23,24,25,26,27,29,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,64,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,84,87,92,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,129,130,131,132,133,134,135,136,137,138,140,141,142,143,144,147,149,150,152,],[30,65,65,-17,-18,69,69,69,69,69,69,69,69,69,69,-49,-71,69,69,69,69,69,-68,93,-5,-72,-6,-7,-8,69,69,69,69,-19,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,-4,65,-14,-20,-69,-21,-22,-23,-24,-25,-26,-27,-52,-53,-73,69,69,69,-63,-70,69,-9,-10,-11,-12,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-54,-60,69,-13,-50,-51,-61,69,-67,69,69,69,69,69,69,-74,-15,-16,69,-57,-62,-58,-59,69,-55,69,-56,]),'VARIABLE':([0,4,6,7,19,20,27,31,32,33,34,35,40,64,68,69,70,71,72,73,74,75,76,77,78,79,87,92,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,124,125,126,129,136,137,138,141,142,143,144,149,152,],[36,36,-17,-18,-49,-71,-68,-5,-72,-6,-7,-8,-19,-4,-20,-69,-21,-22,-23,-24,-25,-26,-27,-52,-53,-73,-63,-70,-9,-10,-11,-12,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-54,-60,-50,-51,-61,-67,-74,-15,-16,-57,-62,-58,-59,-55,-56,]),'VARIABLES':([0,4,6,7,19,20,27,31,32,33,34,35,40,64,68,69,70,71,72,73,74,75,76,77,78,79,87,92,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,124,125,126,129,136,137,138,141,142,143,144,149,152,],[37,37,-17,-18,-49,-71,-68,-5,-72,-6,-7,-8,-19,-4,-20,-69,-21,-22,-23,-24,-25,-26,-27,-52,-53,-73,-63,-70,-9,-10,-11,-12,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-54,-60,-50,-51,-61,-67,-74,-15,-16,-57,-62,-58,-59,-55,-56,]),'CONSTANT':([0,4,6,7,19,20,27,31,32,33,34,35,40,64,68,69,70,71,72,73,74,75,76,77,78,79,87,92,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,124,125,126,129,136,137,138,141,142,143,144,149,152,],[38,38,-17,-18,-49,-71,-68,-5,-72,-6,-7,-8,-19,-4,-20,-69,-21,-22,-23,-24,-25,-26,-27,-52,-53,-73,-63,-70,-9,-10,-11,-12,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-54,-60,-50,-51,-61,-67,-74,-15,-16,-57,-62,-58,-59,-55,-56,]),'CONSTANTS':([0,4,6,7,19,20,27,31,32,33,34,35,40,64,68,69,70,71,72,73,74,75,76,77,78,79,87,92,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,124,125,126,129,136,137,138,141,142,143,144,149,152,],[39,39,-17,-18,-49,-71,-68,-5,-72,-6,-7,-8,-19,-4,-20,-69,-21,-22,-23,-24,-25,-26,-27,-52,-53,-73,-63,-70,-9,-10,-11,-12,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-54,-60,-50,-51,-61,-67,-74,-15,-16,-57,-62,-58,-59,-55,-56,]),'$end':([1,2,3,4,6,7,19,20,27,30,31,32,33,34,35,40,64,68,69,70,71,72,73,74,75,76,77,78,79,87,92,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,124,125,126,129,136,137,138,141,142,143,144,149,152,],[0,-1,-2,-3,-17,-18,-49,-71,-68,-69,-5,-72,-6,-7,-8,-19,-4,-20,-69,-21,-22,-23,-24,-25,-26,-27,-52,-53,-73,-63,-70,-9,-10,-11,-12,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-54,-60,-50,-51,-61,-67,-74,-15,-16,-57,-62,-58,-59,-55,-56,]),'PRIME':([3,6,7,19,20,27,30,32,40,68,69,70,71,72,73,74,75,76,77,78,79,83,85,87,90,92,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,124,125,126,128,129,136,137,138,139,141,142,143,144,146,148,149,151,152,],[40,-17,-18,-49,-71,-68,-69,-72,-19,40,-69,40,40,40,40,40,40,40,40,40,-73,40,40,40,40,-70,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,-54,40,40,40,-61,40,-67,-74,40,40,40,40,40,40,40,40,40,40,40,-56,]),'XOR':([3,6,7,19,20,27,30,32,40,68,69,70,71,72,73,74,75,76,77,78,79,83,85,87,90,92,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,124,125,126,128,129,136,137,138,139,141,142,143,144,146,148,149,151,152,],[43,-17,-18,-49,-71,-68,-69,-72,-19,-20,-69,-21,-22,-23,-24,-25,-26,-27,-52,43,-73,43,43,43,43,-70,-28,-29,-30,43,43,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-54,-60,-50,-51,-61,43,-67,-74,43,43,43,43,43,43,43,-45,43,43,43,-56,]),'IMPLIES':([3,6,7,19,20,27,30,32,40,68,69,70,71,72,73,74,75,76,77,78,79,83,85,87,90,92,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,124,125,126,128,129,136,137,138,139,141,142,143,144,146,148,149,151,152,],[44,-17,-18,-49,-71,-68,-69,-72,-19,-20,-69,-21,-22,-23,-24,-25,-26,-27,-52,44,-73,44,44,44,44,-70,-28,-29,-30,-31,44,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-54,-60,-50,-51,-61,44,-67,-74,44,44,44,44,44,44,44,-45,44,44,44,-56,]),'EQUIV':([3,6,7,19,20,27,30,32,40,68,69,70,71,72,73,74,75,76,77,78,79,83,85,87,90,92,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,124,125,126,128,129,136,137,138,139,141,142,143,144,146,148,149,151,152,],[45,-17,-18,-49,-71,-68,-69,-72,-19,-20,-69,-21,-22,-23,-24,-25,-26,-27,-52,45,-73,45,45,45,45,-70,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-54,-60,-50,-51,-61,45,-67,-74,45,45,45,45,45,45,45,-45,45,45,45,-56,]),'UNTIL':([3,6,7,19,20,27,30,32,40,68,69,70,71,72,73,74,75,76,77,78,79,83,85,87,90,92,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,124,125,126,128,129,136,137,138,139,141,142,143,144,146,148,149,151,152,],[46,-17,-18,-49,-71,-68,-69,-72,-19,-20,-69,46,46,-23,-24,-25,46,46,46,46,-73,46,46,46,46,-70,46,46,46,46,46,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-54,-60,46,46,-61,46,-67,-74,46,46,46,46,46,46,46,-45,46,46,46,-56,]),'WEAK_UNTIL':([3,6,7,19,20,27,30,32,40,68,69,70,71,72,73,74,75,76,77,78,79,83,85,87,90,92,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,124,125,126,128,129,136,137,138,139,141,142,143,144,146,148,149,151,152,],[47,-17,-18,-49,-71,-68,-69,-72,-19,-20,-69,47,47,-23,-24,-25,47,47,47,47,-73,47,47,47,47,-70,47,47,47,47,47,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-54,-60,47,47,-61,47,-67,-74,47,47,47,47,47,47,47,-45,47,47,47,-56,]),'RELEASE':([3,6,7,19,20,27,30,32,40,68,69,70,71,72,73,74,75,76,77,78,79,83,85,87,90,92,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,124,125,126,128,129,136,137,138,139,141,142,143,144,146,148,149,151,152,],[48,-17,-18,-49,-71,-68,-69,-72,-19,-20,-69,48,48,-23,-24,-25,48,48,48,48,-73,48,48,48,48,-70,48,48,48,48,48,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-54,-60,48,48,-61,48,-67,-74,48,48,48,48,48,48,48,-45,48,48,48,-56,]),'SINCE':([3,6,7,19,20,27,30,32,40,68,69,70,71,72,73,74,75,76,77,78,79,83,85,87,90,92,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,124,125,126,128,129,136,137,138,139,141,142,143,144,146,148,149,151,152,],[49,-17,-18,-49,-71,-68,-69,-72,-19,-20,-69,49,49,-23,-24,-25,49,49,49,49,-73,49,49,49,49,-70,49,49,49,49,49,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-54,-60,49,49,-61,49,-67,-74,49,49,49,49,49,49,49,-45,49,49,49,-56,]),'TRIGGER':([3,6,7,19,20,27,30,32,40,68,69,70,71,72,73,74,75,76,77,78,79,83,85,87,90,92,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,124,125,126,128,129,136,137,138,139,141,142,143,144,146,148,149,151,152,],[50,-17,-18,-49,-71,-68,-69,-72,-19,-20,-69,50,50,-23,-24,-25,50,50,50,50,-73,50,50,50,50,-70,50,50,50,50,50,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-54,-60,50,50,-61,50,-67,-74,50,50,50,50,50,50,50,-45,50,50,50,-56,]),'EQUALS':([3,6,7,19,20,27,30,32,40,68,69,70,71,72,73,74,75,76,77,78,79,83,85,87,90,92,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,124,125,126,128,129,136,137,138,139,141,142,143,144,146,148,149,151,152,],[51,-17,-18,-49,-71,-68,-69,-72,-19,-20,-69,51,51,-23,-24,-25,51,51,51,51,-73,51,51,51,51,-70,51,51,51,51,51,51,51,51,51,51,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-54,-60,51,51,-61,51,-67,-74,51,51,51,51,51,51,51,-45,51,51,51,-56,]),'NEQUALS':([3,6,7,19,20,27,30,32,40,68,69,70,71,72,73,74,75,76,77,78,79,83,85,87,90,92,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,124,125,126,128,129,136,137,138,139,141,142,143,144,146,148,149,151,152,],[52,-17,-18,-49,-71,-68,-69,-72,-19,-20,-69,52,52,-23,-24,-25,52,52,52,52,-73,52,52,52,52,-70,52,52,52,52,52,52,52,52,52,52,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-54,-60,52,52,-61,52,-67,-74,52,52,52,52,52,52,52,-45,52,52,52,-56,]),'LT':([3,6,7,19,20,27,30,32,40,68,69,70,71,72,73,74,75,76,77,78,79,83,85,87,90,92,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,124,125,126,128,129,136,137,138,139,141,142,143,144,146,148,149,151,152,],[53,-17,-18,-49,-71,-68,-69,-72,-19,-20,-69,53,53,-23,-24,-25,53,53,53,53,-73,53,53,53,53,-70,53,53,53,53,53,53,53,53,53,53,53,53,-40,-41,-42,-43,-44,-45,-46,-47,-48,-54,-60,53,53,-61,53,-67,-74,53,53,53,53,53,53,53,-45,53,53,53,-56,]),'LE':([3,6,7,19,20,27,30,32,40,68,69,70,71,72,73,74,75,76,77,78,79,83,85,87,90,92,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,124,125,126,128,129,136,137,138,139,141,142,143,144,146,148,149,151,152,],[54,-17,-18,-49,-71,-68,-69,-72,-19,-20,-69,54,54,-23,-24,-25,54,54,54,54,-73,54,54,54,54,-70,54,54,54,54,54,54,54,54,54,54,54,54,-40,-41,-42,-43,-44,-45,-46,-47,-48,-54,-60,54,54,-61,54,-67,-74,54,54,54,54,54,54,54,-45,54,54,54,-56,]),'GT':([3,6,7,19,20,27,30,32,40,68,69,70,71,72,73,74,75,76,77,78,79,83,85,87,90,92,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,124,125,126,128,129,136,137,138,139,141,142,143,144,146,148,149,151,152,],[55,-17,-18,-49,-71,-68,-69,-72,-19,-20,-69,55,55,-23,-24,-25,55,55,55,55,-73,55,55,55,55,-70,55,55,55,55,55,55,55,55,55,55,55,55,-40,-41,-42,-43,-44,-45,-46,-47,-48,-54,-60,55,55,-61,55,-67,-74,55,55,55,55,55,55,55,-45,55,55,55,-56,]),'GE':([3,6,7,19,20,27,30,32,40,68,69,70,71,72,73,74,75,76,77,78,79,83,85,87,90,92,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,124,125,126,128,129,136,137,138,139,141,142,143,144,146,148,149,151,152,],[56,-17,-18,-49,-71,-68,-69,-72,-19,-20,-69,56,56,-23,-24,-25,56,56,56,56,-73,56,56,56,56,-70,56,56,56,56,56,56,56,56,56,56,56,56,-40,-41,-42,-43,-44,-45,-46,-47,-48,-54,-60,56,56,-61,56,-67,-74,56,56,56,56,56,56,56,-45,56,56,56,-56,]),'TIMES':([3,6,7,19,20,27,30,32,40,68,69,70,71,72,73,74,75,76,77,78,79,83,85,87,90,92,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,124,125,126,128,129,136,137,138,139,141,142,143,144,146,148,149,151,152,],[57,-17,-18,-49,-71,-68,-69,-72,-19,-20,-69,57,57,-23,-24,-25,57,57,57,57,-73,57,57,57,57,-70,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,-44,-45,-46,57,57,-54,57,57,57,-61,57,-67,-74,57,57,57,57,57,57,57,-45,57,57,57,-56,]),'DIV':([3,6,7,19,20,27,30,32,40,68,69,70,71,72,73,74,75,76,77,78,79,83,85,87,90,92,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,124,125,126,128,129,136,137,138,139,141,142,143,144,146,148,149,151,152,],[58,-17,-18,-49,-71,-68,-69,-72,-19,-20,-69,58,58,-23,-24,-25,58,58,58,58,-73,58,58,58,135,-70,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,-44,-45,-46,58,58,-54,58,58,58,-61,58,-67,-74,58,58,58,58,58,58,58,-45,58,58,58,-56,]),'MOD':([3,6,7,19,20,27,30,32,40,68,69,70,71,72,73,74,75,76,77,78,79,83,85,87,90,92,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,124,125,126,128,129,136,137,138,139,141,142,143,144,146,148,149,151,152,],[59,-17,-18,-49,-71,-68,-69,-72,-19,-20,-69,59,59,-23,-24,-25,59,59,59,59,-73,59,59,59,59,-70,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,-44,-45,-46,59,59,-54,59,59,59,-61,59,-67,-74,59,59,59,59,59,59,59,-45,59,59,59,-56,]),'PLUS':([3,6,7,19,20,27,30,32,40,68,69,70,71,72,73,74,75,76,77,78,79,83,85,87,90,92,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,124,125,126,128,129,136,137,138,139,141,142,143,144,146,148,149,151,152,],[60,-17,-18,-49,-71,-68,-69,-72,-19,-20,-69,60,60,-23,-24,-25,60,60,60,60,-73,60,60,60,60,-70,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,-44,-45,-46,-47,-48,-54,60,60,60,-61,60,-67,-74,60,60,60,60,60,60,60,-45,60,60,60,-56,]),'TRUNCATE':([3,6,7,19,20,27,30,32,40,68,69,70,71,72,73,74,75,76,77,78,79,83,85,87,90,92,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,124,125,126,128,129,136,137,138,139,141,142,143,144,146,148,149,151,152,],[62,-17,-18,-49,-71,-68,-69,-72,-19,-20,-69,-21,-22,-23,-24,-25,-26,-27,-52,-53,-73,62,62,62,62,-70,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-54,-60,-50,-51,-61,62,-67,-74,62,-16,62,-57,62,-58,-59,-45,62,-55,62,-56,]),'IN':([3,6,7,19,20,27,30,32,40,68,69,70,71,72,73,74,75,76,77,78,79,83,85,87,90,92,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,124,125,126,128,129,136,137,138,139,141,142,143,144,146,148,149,151,152,],[63,-17,-18,-49,-71,-68,-69,-72,-19,-20,-69,63,63,-23,-24,-25,63,63,63,63,-73,63,63,63,63,-70,63,63,63,63,63,63,63,63,63,63,63,63,-40,-41,-42,-43,-44,-45,-46,-47,-48,-54,-60,63,63,-61,63,-67,-74,63,63,63,63,63,63,63,-45,63,63,63,-56,]),'THEN':([6,7,19,20,27,32,40,68,69,70,71,72,73,74,75,76,77,78,79,83,92,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,124,125,126,129,136,138,141,143,144,149,152,],[-17,-18,-49,-71,-68,-72,-19,-20,-69,-21,-22,-23,-24,-25,-26,-27,-52,-53,-73,127,-70,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-54,-60,-50,-51,-61,-67,-74,-16,-57,-58,-59,-55,-56,]),'RPAREN':([6,7,19,20,27,32,40,68,69,70,71,72,73,74,75,76,77,78,79,85,92,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,124,125,126,129,136,138,141,143,144,149,151,152,],[-17,-18,-49,-71,-68,-72,-19,-20,-69,-21,-22,-23,-24,-25,-26,-27,-52,-53,-73,129,-70,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-54,-60,-50,-51,-61,-67,-74,-16,-57,-58,-59,-55,152,-56,]),'COLON':([6,7,19,20,27,32,40,68,69,70,71,72,73,74,75,76,77,78,79,86,87,88,89,91,92,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,124,125,126,129,136,138,141,142,143,144,145,146,149,152,],[-17,-18,-49,-71,-68,-72,-19,-20,-69,-21,-22,-23,-24,-25,-26,-27,-52,-53,-73,130,-63,132,133,-65,-70,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-54,-60,-50,-51,-61,-67,-74,-16,-57,-62,-58,-59,-64,-66,-55,-56,]),'COMMA':([6,7,19,20,27,32,40,68,69,70,71,72,73,74,75,76,77,78,79,86,87,88,89,91,92,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,124,125,126,128,129,136,138,141,142,143,144,145,146,148,149,152,],[-17,-18,-49,-71,-68,-72,-19,-20,-69,-21,-22,-23,-24,-25,-26,-27,-52,-53,-73,131,-63,131,134,-65,-70,131,131,131,131,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-54,-60,-50,-51,-61,140,-67,-74,-16,-57,-62,-58,-59,-64,-66,150,-55,-56,]),'IN_EXPR':([6,7,19,20,27,32,40,66,67,68,69,70,71,72,73,74,75,76,77,78,79,92,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,123,124,125,126,129,136,137,138,141,143,144,149,152,],[-17,-18,-49,-71,-68,-72,-19,122,-14,-20,-69,-21,-22,-23,-24,-25,-26,-27,-52,-53,-73,-70,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-54,-60,-13,-50,-51,-61,-67,-74,-15,-16,-57,-58,-59,-55,-56,]),'ELSE':([6,7,19,20,27,32,40,68,69,70,71,72,73,74,75,76,77,78,79,92,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,124,125,126,129,136,138,139,141,143,144,149,152,],[-17,-18,-49,-71,-68,-72,-19,-20,-69,-21,-22,-23,-24,-25,-26,-27,-52,-53,-73,-70,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-54,-60,-50,-51,-61,-67,-74,-16,147,-57,-58,-59,-55,-56,]),'DOTS':([20,32,79,],[82,-72,-73,]),'DEF':([30,65,],[94,94,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'start':([0,],[1,]),'module':([0,],[2,]),'expr':([0,8,9,10,11,12,13,14,15,16,17,21,23,24,25,26,36,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,80,81,84,94,122,127,130,131,132,133,134,135,140,147,150,],[3,68,70,71,72,73,74,75,76,77,78,83,85,87,87,90,87,87,87,87,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,121,124,125,128,137,138,139,141,142,143,144,90,146,148,149,151,]),'units':([0,],[4,]),'junc_list':([0,8,9,10,11,12,13,14,15,16,17,21,23,24,25,26,36,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,80,81,84,94,122,127,130,131,132,133,134,135,140,147,150,],[19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,]),'number':([0,8,9,10,11,12,13,14,15,16,17,21,23,24,25,26,28,36,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,80,81,82,84,94,122,127,130,131,132,133,134,135,140,147,150,],[20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,92,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,120,20,20,20,126,20,20,20,20,20,20,20,20,20,20,20,20,20,]),'var':([0,8,9,10,11,12,13,14,15,16,17,21,23,24,25,26,36,37,38,39,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,63,80,81,84,94,122,127,130,131,132,133,134,135,140,147,150,],[27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,]),'unit':([0,4,],[31,64,]),'def':([0,4,5,66,],[33,33,67,123,]),'var_decl':([0,4,],[34,34,]),'const_decl':([0,4,],[35,35,]),'defs':([5,],[66,]),'list':([24,25,36,37,38,39,],[86,88,95,96,97,98,]),'pairs':([26,],[89,]),'pair':([26,134,],[91,145,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> start","S'",1,None,None,None),
+  ('start -> module','start',1,'p_start','lexyacc.py',182),
+  ('start -> expr','start',1,'p_start','lexyacc.py',183),
+  ('module -> units','module',1,'p_module','lexyacc.py',188),
+  ('units -> units unit','units',2,'p_units_iter','lexyacc.py',192),
+  ('units -> unit','units',1,'p_units_end','lexyacc.py',197),
+  ('unit -> def','unit',1,'p_unit','lexyacc.py',201),
+  ('unit -> var_decl','unit',1,'p_unit','lexyacc.py',202),
+  ('unit -> const_decl','unit',1,'p_unit','lexyacc.py',203),
+  ('var_decl -> VARIABLE list','var_decl',2,'p_variable_declaration','lexyacc.py',208),
+  ('var_decl -> VARIABLES list','var_decl',2,'p_variable_declaration','lexyacc.py',209),
+  ('const_decl -> CONSTANT list','const_decl',2,'p_constant_declaration','lexyacc.py',214),
+  ('const_decl -> CONSTANTS list','const_decl',2,'p_constant_declaration','lexyacc.py',215),
+  ('defs -> defs def','defs',2,'p_defs_iter','lexyacc.py',220),
+  ('defs -> def','defs',1,'p_defs_end','lexyacc.py',225),
+  ('def -> NAME DEF expr','def',3,'p_operator_definition','lexyacc.py',229),
+  ('expr -> LET defs IN_EXPR expr','expr',4,'p_let_in','lexyacc.py',235),
+  ('expr -> TRUE','expr',1,'p_nullary','lexyacc.py',239),
+  ('expr -> FALSE','expr',1,'p_nullary','lexyacc.py',240),
+  ('expr -> expr PRIME','expr',2,'p_postfix_next','lexyacc.py',245),
+  ('expr -> NOT expr','expr',2,'p_unary','lexyacc.py',249),
+  ('expr -> ALWAYS expr','expr',2,'p_unary','lexyacc.py',250),
+  ('expr -> EVENTUALLY expr','expr',2,'p_unary','lexyacc.py',251),
+  ('expr -> NEXT expr','expr',2,'p_unary','lexyacc.py',252),
+  ('expr -> WEAK_PREVIOUS expr','expr',2,'p_unary','lexyacc.py',253),
+  ('expr -> PREVIOUS expr','expr',2,'p_unary','lexyacc.py',254),
+  ('expr -> HISTORICALLY expr','expr',2,'p_unary','lexyacc.py',255),
+  ('expr -> ONCE expr','expr',2,'p_unary','lexyacc.py',256),
+  ('expr -> expr AND expr','expr',3,'p_binary_connective','lexyacc.py',261),
+  ('expr -> expr OR expr','expr',3,'p_binary_connective','lexyacc.py',262),
+  ('expr -> expr XOR expr','expr',3,'p_binary_connective','lexyacc.py',263),
+  ('expr -> expr IMPLIES expr','expr',3,'p_binary_connective','lexyacc.py',264),
+  ('expr -> expr EQUIV expr','expr',3,'p_binary_connective','lexyacc.py',265),
+  ('expr -> expr UNTIL expr','expr',3,'p_binary_connective','lexyacc.py',266),
+  ('expr -> expr WEAK_UNTIL expr','expr',3,'p_binary_connective','lexyacc.py',267),
+  ('expr -> expr RELEASE expr','expr',3,'p_binary_connective','lexyacc.py',268),
+  ('expr -> expr SINCE expr','expr',3,'p_binary_connective','lexyacc.py',269),
+  ('expr -> expr TRIGGER expr','expr',3,'p_binary_connective','lexyacc.py',270),
+  ('expr -> expr EQUALS expr','expr',3,'p_binary_predicate','lexyacc.py',275),
+  ('expr -> expr NEQUALS expr','expr',3,'p_binary_predicate','lexyacc.py',276),
+  ('expr -> expr LT expr','expr',3,'p_binary_predicate','lexyacc.py',277),
+  ('expr -> expr LE expr','expr',3,'p_binary_predicate','lexyacc.py',278),
+  ('expr -> expr GT expr','expr',3,'p_binary_predicate','lexyacc.py',279),
+  ('expr -> expr GE expr','expr',3,'p_binary_predicate','lexyacc.py',280),
+  ('expr -> expr TIMES expr','expr',3,'p_binary_function','lexyacc.py',285),
+  ('expr -> expr DIV expr','expr',3,'p_binary_function','lexyacc.py',286),
+  ('expr -> expr MOD expr','expr',3,'p_binary_function','lexyacc.py',287),
+  ('expr -> expr PLUS expr','expr',3,'p_binary_function','lexyacc.py',288),
+  ('expr -> expr MINUS expr','expr',3,'p_binary_function','lexyacc.py',289),
+  ('expr -> junc_list','expr',1,'p_junction_list','lexyacc.py',295),
+  ('junc_list -> junc_list AND expr','junc_list',3,'p_junction_list_iter','lexyacc.py',299),
+  ('junc_list -> junc_list OR expr','junc_list',3,'p_junction_list_iter','lexyacc.py',300),
+  ('junc_list -> AND expr','junc_list',2,'p_conjunction_list_end','lexyacc.py',305),
+  ('junc_list -> OR expr','junc_list',2,'p_conjunction_list_end','lexyacc.py',306),
+  ('expr -> expr TRUNCATE number','expr',3,'p_truncator','lexyacc.py',311),
+  ('expr -> IF expr THEN expr ELSE expr','expr',6,'p_if_then_else','lexyacc.py',316),
+  ('expr -> ITE LPAREN expr COMMA expr COMMA expr RPAREN','expr',8,'p_ternary_conditional','lexyacc.py',320),
+  ('expr -> FORALL list COLON expr','expr',4,'p_quantifier','lexyacc.py',324),
+  ('expr -> EXISTS list COLON expr','expr',4,'p_quantifier','lexyacc.py',325),
+  ('expr -> RENAME pairs COLON expr','expr',4,'p_substitute','lexyacc.py',331),
+  ('expr -> expr IN expr','expr',3,'p_in_range','lexyacc.py',335),
+  ('expr -> number DOTS number','expr',3,'p_range','lexyacc.py',339),
+  ('list -> list COMMA expr','list',3,'p_varlist_iter','lexyacc.py',343),
+  ('list -> expr','list',1,'p_varlist_end','lexyacc.py',348),
+  ('pairs -> pairs COMMA pair','pairs',3,'p_pairs_iter','lexyacc.py',352),
+  ('pairs -> pair','pairs',1,'p_pairs_end','lexyacc.py',357),
+  ('pair -> expr DIV expr','pair',3,'p_pair','lexyacc.py',361),
+  ('expr -> LPAREN expr RPAREN','expr',3,'p_paren','lexyacc.py',365),
+  ('expr -> var','expr',1,'p_var','lexyacc.py',369),
+  ('var -> NAME','var',1,'p_var_unprimed','lexyacc.py',373),
+  ('expr -> AT number','expr',2,'p_bdd_node','lexyacc.py',377),
+  ('expr -> number','expr',1,'p_number_expr','lexyacc.py',381),
+  ('number -> NUMBER','number',1,'p_number','lexyacc.py',385),
+  ('number -> MINUS NUMBER','number',2,'p_negative_number','lexyacc.py',389),
+  ('expr -> DQUOTES NAME DQUOTES','expr',3,'p_string','lexyacc.py',393),
+]
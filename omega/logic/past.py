@@ -239,7 +239,7 @@ def _flatten_until(operands, testers, context, *arg, **kw):
 
 
 # LTL parser that translates past to future.
-parser = lexyacc.Parser(nodes=Nodes)
+parser = lexyacc.LazyParser(nodes=Nodes)
 
 
 def translate(s, debug=False, until=False):
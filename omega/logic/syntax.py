@@ -359,7 +359,8 @@ def _add_prime_like_too(table):
         if dom == 'bool':
             r = 'bool'
         else:
-            assert len(dom) == 2, dom
+            # `(min, max)` or `(min, max, encoding)`
+            assert len(dom) in (2, 3), dom
             r = tuple(dom)
         t[var] = r
         t[pvar] = r
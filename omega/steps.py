@@ -157,12 +157,18 @@ class AutomatonStepper(object):
 
 
 class EnumStrategyStepper(object):
-    """Initialize and step an enumerated strategy."""
+    """Initialize and step an enumerated strategy.
+
+    @param graph: `networkx.DiGraph` or
+        `omega.games.enumeration.CompactGraph`,
+        with attributes `initial_nodes` and `outputs`
+    """
 
     def __init__(self, graph):
         assert graph.initial_nodes
         # self.vars = graph.vars
         self.graph = graph
+        self._umap = None  # map states -> nodes
 
     def init(self):
         """Return initial values for variables this component controls."""
@@ -170,9 +176,21 @@ class EnumStrategyStepper(object):
 
     def step(self, state):
         """Return next values for variables this component controls."""
-        u = next(u for u in self.graph if self.graph.nodes[u] == state)
+        u = self._find_node(state)
         return self._pick_sys(self.graph.successors(u))
 
+    def _find_node(self, state):
+        """Return node with `state`, indexing nodes on first call."""
+        if self._umap is None:
+            self._umap = {
+                _state_key(d): u
+                for u, d in self.graph.nodes(data=True)}
+        key = _state_key(state)
+        if key not in self._umap:
+            raise ValueError(
+                'no node has state: {s}'.format(s=state))
+        return self._umap[key]
+
     def _pick_sys(self, nodes):
         u = next(iter(nodes))
         d = self.graph.nodes[u]
@@ -324,6 +342,11 @@ def _omit_prefix(s, prefix):
     return s
 
 
+def _state_key(state):
+    """Return hashable key of `dict` `state`."""
+    return tuple(sorted(state.items()))
+
+
 def _unprime_state(primed_state):
     """Return same state but with identifiers unprimed."""
     return {stx.unprime(k): v for k, v in primed_state.items()}
@@ -7,8 +7,7 @@ This module may be better merged into `fol` or `bitvector`.
 #
 import logging
 
-import natsort
-
+from omega.logic import bitvector as bv
 from omega.logic import syntax as stx
 
 
@@ -75,6 +74,7 @@ def _list_type_hints(variables, table):
     These are the high-level type invariant,
     as defined by the type hints (`"dom"`) in `table`.
     """
+    import natsort
     assert variables, variables
     r = list()
     keys = natsort.natsorted(variables)
@@ -92,6 +92,7 @@ def _list_limits(vrs, table):
 
     @param table: must be bitblasted
     """
+    import natsort
     assert vrs, vrs
     r = list()
     keys = natsort.natsorted(vrs)
@@ -105,6 +106,13 @@ def _list_limits(vrs, table):
 def _bitfield_limits(hint):
     """Return extremal integer values of bitfield."""
     width = hint['width']
+    encoding = hint.get('encoding', 'binary')
+    if encoding == 'onehot':
+        width = max((width - 1).bit_length(), 1)
+    if encoding != 'binary':
+        # unsigned `x - min`, see `bv.decode_int`
+        min_ = hint['dom'][0]
+        return (min_, min_ + 2**width - 1)
     if hint['signed']:
         n = width - 1
         limits = (- 2**n, 2**n - 1)
@@ -123,6 +131,7 @@ def _bitfield_limits(hint):
 def _conjoin_type_hints(vrs, fol):
     """Return conjunction of type hints for `vrs` as BDD."""
     r = list()
+    invariants = list()
     for var in vrs:
         hints = fol.vars[var]
         if hints['type'] == 'bool':
@@ -134,7 +143,12 @@ def _conjoin_type_hints(vrs, fol):
         s = r'({a} <= {var}) /\ ({var} <= {b})'
         type_hints = s.format(a=a, b=b, var=var)
         r.append(type_hints)
+        v = bv.encoding_invariant_bdd(var, hints, fol.bdd)
+        if v is not None:
+            invariants.append(v)
     u = fol.add_expr(stx.conj(r))
+    for v in invariants:
+        u &= v
     return u
 
 
@@ -52,7 +52,7 @@ class Lexer(object):
 
     def build(self):
         log = logging.getLogger(__name__ + '.slugs_logger')
-        self.lexer = ply.lex.lex(module=self, debug=True, debuglog=log)
+        self.lexer = ply.lex.lex(module=self, debuglog=log)
 
     def t_error(self, t):
         raise Exception('Illegal character "{t}"'.format(t=t.value[0]))
@@ -66,11 +66,18 @@ class Parser(object):
         if nodes is None:
             nodes = Nodes()
         self.nodes = nodes
-        self.lexer = Lexer()
-        self.tokens = self.lexer.tokens
+        self._lexer = None
+        self.tokens = Lexer.operators + Lexer.identifiers
         self._binary = {'AND', 'OR', 'XOR',
                         'FORALL', 'EXISTS', 'RENAME'}
 
+    @property
+    def lexer(self):
+        """Return `Lexer`, building it on first use."""
+        if self._lexer is None:
+            self._lexer = Lexer()
+        return self._lexer
+
     def parse(self, data):
         self.lexer.lexer.input(data)
         r = self._recurse()
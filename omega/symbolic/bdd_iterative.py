@@ -30,10 +30,17 @@ class Parser(object):
     # Context-sensitive grammar, so cannot use PLY
 
     def __init__(self):
-        self.lexer = Lexer()
-        self.tokens = self.lexer.tokens
+        self._lexer = None
+        self.tokens = Lexer.operators + Lexer.identifiers
         self._binary = {'AND', 'OR', 'XOR'}
 
+    @property
+    def lexer(self):
+        """Return `Lexer`, building it on first use."""
+        if self._lexer is None:
+            self._lexer = Lexer()
+        return self._lexer
+
     def parse(self, data, bdd):
         self.lexer.lexer.input(data)
         mem = None
@@ -37,7 +37,8 @@ def dumps_bdds_as_code(u, out_vars, aut, lang='python'):
     functions = [
         step, assign_bitvectors, int_to_bits,
         out_bits_to_ints, bv.bitfields_to_ints,
-        bv._append_sign_bit, bv.twos_complement_to_int]
+        bv._append_sign_bit, bv.twos_complement_to_int,
+        bv.encode_int, bv.decode_int]
     lines = list()
     for func in functions:
         func_lines, _ = inspect.getsourcelines(func)
@@ -136,9 +137,9 @@ def assign_bitvectors(state, vrs):
     """
     bitvectors = dict()
     for var, value in state.items():
-        bitnames = vrs[var]['bitnames']
-        width = len(bitnames)
-        bitvectors[var] = int_to_bits(value, width)
+        d = vrs[var]
+        width = len(d['bitnames'])
+        bitvectors[var] = int_to_bits(encode_int(value, d), width)
     return bitvectors
 
 
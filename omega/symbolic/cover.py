@@ -18,8 +18,6 @@ from itertools import cycle
 import logging
 import time
 
-import humanize
-import natsort
 from omega.logic import syntax as stx
 from omega.symbolic.prime import support_issubset
 from omega.symbolic.prime import joint_support
@@ -383,6 +381,7 @@ def _print_cyclic_core(
 
     Assert support and covering properties.
     """
+    import humanize
     if log.getEffectiveLevel() > logging.INFO:
         return
     # assert
@@ -977,6 +976,7 @@ def _comma_sorted(c):
 
     The items are listed as sorted by `natsort`.
     """
+    import natsort
     return ', '.join(natsort.natsorted(c))
 
 
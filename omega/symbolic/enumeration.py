@@ -5,18 +5,25 @@ Integers are decoded from binary to decimal.
 # Copyright 2015 by California Institute of Technology
 # All rights reserved. Licensed under BSD-3.
 #
+import array
+import json
 import logging
 import math
 
-import natsort
-import networkx as nx
-
 from omega.logic import bitvector as bv
+from omega.logic import syntax as stx
 from omega.symbolic import prime as scope
 from omega.symbolic import symbolic
 
 
 logger = logging.getLogger(__name__)
+# typecode of `array.array` for node numbers,
+# 64 bits if available (not in Python 2.7)
+try:
+    array.array('q')
+    INT_TYPECODE = 'q'
+except ValueError:
+    INT_TYPECODE = 'l'
 
 
 def dump_relation(
@@ -25,6 +32,7 @@ def dump_relation(
         care_target=None,
         fname='edges.pdf'):
     """Dump graph of relation as PDF."""
+    import networkx as nx
     g = relation_to_graph(u, aut, care_source, care_target)
     h, umap = _format_nx(g)
     pd = nx.drawing.nx_pydot.to_pydot(h)
@@ -45,13 +53,36 @@ def relation_to_graph(
     @type u, care_source, care_target: node in `aut.bdd`
     @rtype: `networkx.DiGraph`
     """
+    import networkx as nx
+    edges = iter_relation_edges(
+        u, aut, care_source, care_target, care_bits)
+    g = nx.DiGraph()
+    for u, v, source, target in edges:
+        g.add_node(u, **source)
+        g.add_node(v, **target)
+        g.add_edge(u, v)
+    return g
+
+
+def iter_relation_edges(
+        u, aut,
+        care_source=None,
+        care_target=None,
+        care_bits=None):
+    """Yield edges of relation `u`, as they are enumerated.
+
+    Each edge is a `tuple`
+    `(source, target, source_state, target_state)`,
+    with integer nodes, as in `relation_to_graph`.
+    No graph is constructed.
+
+    For the arguments, read `relation_to_graph`.
+    """
     assert u != aut.bdd.false
     t, care_relation = _make_table(u, aut, care_source,
                                    care_target, care_bits)
-    c = _enumerate_bdd(u, aut.bdd, t,
-                       care_relation, care_bits)
-    # to nx graph
-    g = nx.DiGraph()
+    c = _iter_bdd_models(u, aut.bdd, t,
+                         care_relation, care_bits)
     # fix an order of keys for lookup
     keys = list(aut.vars)
     umap = dict()
@@ -65,16 +96,131 @@ def relation_to_graph(
                 source[var] = value
             else:
                 target[var] = value
-        # map valuation to g node
+        # map valuation to node
         target = _unprime_any_primed(target)
         u = _find_or_add_model(source, umap, keys)
         v = _find_or_add_model(target, umap, keys)
-        g.add_node(u, **source)
+        yield u, v, source, target
+
+
+def steps_to_graph(steps):
+    """Return graph from enumerated `steps`.
+
+    @param steps: iterable of `tuple`s
+        `(source, target, source_state, target_state)`,
+        with `source is None` for initial nodes,
+        as yielded by `omega.games.enumeration.iter_action_steps`
+    @return: graph with the attribute `initial_nodes`
+    @rtype: `networkx.DiGraph`
+    """
+    import networkx as nx
+    g = nx.DiGraph()
+    g.initial_nodes = set()
+    for u, v, source, target in steps:
         g.add_node(v, **target)
+        if u is None:
+            g.initial_nodes.add(v)
+            continue
+        g.add_node(u, **source)
         g.add_edge(u, v)
     return g
 
 
+def steps_to_arrays(steps, keys):
+    """Return compact arrays from enumerated `steps`.
+
+    Each state is stored once, as a `tuple` ordered by `keys`.
+    The edges are stored in two arrays of integers,
+    with typecode `INT_TYPECODE`.
+
+    @param steps: as described in `steps_to_graph`
+    @param keys: variable names, in `tuple` order
+    @return: `(states, sources, targets, initial_nodes)`,
+        where `states[u]` is the `tuple` of node `u`,
+        `sources[i], targets[i]` is the `i`-th edge,
+        and `initial_nodes` is a `set`
+    """
+    states = list()
+    sources = array.array(INT_TYPECODE)
+    targets = array.array(INT_TYPECODE)
+    initial_nodes = set()
+    for u, v, source, target in steps:
+        _store_state(v, target, states, keys)
+        if u is None:
+            initial_nodes.add(v)
+            continue
+        _store_state(u, source, states, keys)
+        sources.append(u)
+        targets.append(v)
+    assert None not in states, 'nodes missing from `steps`'
+    return states, sources, targets, initial_nodes
+
+
+def _store_state(u, d, states, keys):
+    """Store in `states[u]` the values of `d` as `tuple`."""
+    if u < len(states) and states[u] is not None:
+        return
+    if u >= len(states):
+        states.extend([None] * (u + 1 - len(states)))
+    states[u] = tuple(d[k] for k in keys)
+
+
+def dump_steps_csv(steps, f, keys):
+    """Write enumerated `steps` to file `f` as CSV.
+
+    The first row is the header. Each other row is a step,
+    with the columns: source node, target node,
+    the source values of `keys`, and the target values
+    of `keys` (primed in the header).
+    For initial nodes, the source columns are empty.
+
+    @param steps: as described in `steps_to_graph`
+    @param f: file object opened for writing text
+    @param keys: variable names, in column order
+    @return: number of steps written
+    """
+    import csv
+    writer = csv.writer(f)
+    header = ['source', 'target']
+    header.extend(keys)
+    header.extend(stx.prime(k) for k in keys)
+    writer.writerow(header)
+    empty = [''] * len(keys)
+    n = 0
+    for u, v, source, target in steps:
+        if u is None:
+            row = ['', v] + empty
+        else:
+            row = [u, v] + [source[k] for k in keys]
+        row.extend(target[k] for k in keys)
+        writer.writerow(row)
+        n += 1
+    return n
+
+
+def dump_steps_jsonl(steps, f):
+    """Write enumerated `steps` to file `f` as JSON lines.
+
+    Each line is an object with the keys `"source"`,
+    `"target"`, `"source_state"`, and `"target_state"`.
+    For initial nodes, the source keys map to `null`.
+
+    @param steps: as described in `steps_to_graph`
+    @param f: file object opened for writing text
+    @return: number of steps written
+    """
+    n = 0
+    for u, v, source, target in steps:
+        d = dict(
+            source=u, target=v,
+            source_state=source,
+            target_state=target)
+        f.write(json.dumps(d, sort_keys=True))
+        f.write('\n')
+        n += 1
+    return n
+
+
 def print_nodes(
         u, dvars, bdd,
         care_set=None,
@@ -121,6 +267,7 @@ def _print_enumeration(
         care_set,
         care_bits):
     """Print first-order models."""
+    import natsort
     c = _enumerate_bdd(u, bdd, t, care_set, care_bits)
     r = list()
     keys = natsort.natsorted(t)
@@ -192,17 +339,27 @@ def _enumerate_bdd(
     """
     if u == bdd.false:
         return
+    return list(_iter_bdd_models(
+        u, bdd, t, care_set, care_bits))
+
+
+def _iter_bdd_models(
+        u, bdd, t,
+        care_set=None,
+        care_bits=None):
+    """Yield first-order models of BDD `u`.
+
+    Read `_enumerate_bdd`.
+    """
     if care_set is not None:
         u &= care_set
         logging.debug((
             'enumerating BDD node {u}, '
             'with care set = {c}').format(
                 u=u, c=care_set))
-    c = list()
     for dbit in bdd.pick_iter(u, care_bits):
-        dint = _bitfields_to_int_iter(dbit, t)
-        c.extend(dint)
-    return c
+        for model in _bitfields_to_int_iter(dbit, t):
+            yield model
 
 
 def _bitfields_to_int_iter(bits, t):
@@ -214,43 +371,41 @@ def _bitfields_to_int_iter(bits, t):
     @type t: `dict`
     """
     # any bits missing ?
-    t_bits = set()
-    for flatname, d in t.items():
-        dt = d['type']
-        if dt == 'bool':
-            t_bits.add(flatname)
-        elif dt == 'int':
-            t_bits.update(d['bitnames'])
-        else:
-            raise Exception(
-                'unknown type "{dt}"'.format(dt=dt))
-    missing = set(bits).difference(t_bits)
+    bit_to_var = getattr(t, 'bit_to_var', None)
+    if bit_to_var is None:
+        bit_to_var = bv.map_bits_to_integers(t)
+    missing = set(bits).difference(bit_to_var)
     assert not missing, (
         'WARNING: missing bits:\n {b}\n'
         'from concrete table:\n {t}').format(
             b=missing, t=t)
+    # only variables with assigned bits
+    vrs = sorted(set(map(bit_to_var.__getitem__, bits)))
     # init
     bits = dict(bits)
     model = dict()
     # bool first
-    for flatname, d in t.items():
-        if d['type'] != 'bool':
+    for flatname in vrs:
+        if t[flatname]['type'] != 'bool':
             continue
-        if flatname in bits:
-            model[flatname] = bits.pop(flatname)
+        model[flatname] = bits.pop(flatname)
     # integers
     sets = dict()
-    for flatname, d in t.items():
+    for flatname in vrs:
+        d = t[flatname]
         if d['type'] == 'bool':
             continue
         bitnames = d['bitnames']
-        # missing ?
-        if not set(bitnames).intersection(bits):
-            continue
         # partial bitvector valuation
         bitvalues = list(map(bits.get, bitnames))
         bv._append_sign_bit(bitvalues, flatname, d)
         values = _enumerate_int(bitvalues)
+        encoding = d.get('encoding', 'binary')
+        if encoding == 'onehot':
+            # codes with several bits set decode to same values
+            values = sorted(set(bv.decode_int(v, d) for v in values))
+        elif encoding != 'binary':
+            values = (bv.decode_int(v, d) for v in values)
         sets[flatname] = list(values)
     return _take_product_iter(sets, model)
 
@@ -332,6 +487,7 @@ def _find_or_add_model(model, umap, keys):
 
 def _dump_graph_as_figure(g, fname):
     """Create a PDF file showing the graph `g`."""
+    import networkx as nx
     h, _ = _format_nx(g)
     pd = nx.drawing.nx_pydot.to_pydot(h)
     pd.write_pdf(fname)
@@ -350,6 +506,7 @@ def _format_nx(g, keys=None):
         By default all keys are shown.
     @rtype: `pydot.Graph`
     """
+    import networkx as nx
     h = nx.DiGraph()
     umap = dict()
     for u, d in g.nodes(data=True):
@@ -382,6 +539,7 @@ def _square_conj(p, n=None, op=r'&and;'):
     @param n: number of items in `p`
         (useful when `p` is a generator)
     """
+    import natsort
     if n is None:
         n = len(p)
     assert n > 0, n
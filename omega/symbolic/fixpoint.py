@@ -3,13 +3,20 @@
 - attractor computation (least fixpoint)
 - control invariance (greatest fixpoint)
 - controllable preimage
+
+The actions can be BDDs, or `partition.Partition` objects.
 """
 # Copyright 2015 by California Institute of Technology
 # All rights reserved. Licensed under BSD-3.
 #
 import logging
 from dd import bdd as _bdd
+try:
+    from dd import cudd as _cudd
+except ImportError:
+    _cudd = None
 from omega.symbolic.prime import is_state_predicate
+from omega.symbolic import partition as prt
 from omega.symbolic import prime as prm
 
 
@@ -41,6 +48,49 @@ def attractor(env_action, sys_action, target, aut,
     return q
 
 
+def frontier_attractor(env_action, sys_action, target, aut,
+                       inside=None, simplify=False, sizes=None):
+    """Return attractor for `target`, computed from frontiers.
+
+    Returns the same set as `attractor`.
+    After the first iteration, the controllable predecessor is
+    computed only for states that have a successor in the
+    frontier (the states added in the previous iteration).
+
+    @param inside: remain in this set
+    @param simplify: if `True`, then simplify each frontier
+        using the states added before as don't-cares
+        (has effect with `dd.cudd`)
+    @param sizes: if a `list`, then append to it the
+        number of nodes of each frontier
+    """
+    logger.info('++ frontier attractor')
+    assert is_state_predicate(target), aut.support(target)
+    qvars = aut.varlist["env'"] + aut.varlist["sys'"]
+    q = target | step(env_action, sys_action, target, aut)
+    if inside is not None:
+        q &= inside
+    frontier = q
+    while frontier != aut.false:
+        if sizes is not None:
+            sizes.append(len(frontier))
+        # states with some successor in the frontier
+        u = prm.prime(frontier, aut)
+        cand = _and_exist(qvars, sys_action, u, aut) & ~ q
+        if inside is not None:
+            cand &= inside
+        sys_cand = _restrict_action(sys_action, cand)
+        new = step(env_action, sys_cand, q, aut) & cand
+        if simplify:
+            frontier = _simplify(new, q, aut)
+        else:
+            frontier = new
+        q |= new
+    assert is_state_predicate(q), aut.support(q)
+    logger.info('-- frontier attractor')
+    return q
+
+
 def trap(env_action, sys_action, safe, aut,
          unless=None):
     """Return subset of `safe` with contolled exit.
@@ -85,26 +135,53 @@ def step(env_action, sys_action, target, aut):
     # TODO: use efficient substitution
     yp = aut.varlist["sys'"]
     xp = aut.varlist["env'"]
-    u = prm.prime(target, aut)
-    if aut.plus_one:
-        # sys_action /\ (env_action => target')
-        u |= ~ env_action
-        u &= sys_action
-    else:
-        # env_action => (sys_action /\ target')
-        u &= sys_action
-        u |= ~ env_action
-    if aut.moore:
-        # \E y':  \A x'
+    target = prm.prime(target, aut)
+    # the quantifiers are distributed over the connectives,
+    # so that fused operations and early quantification apply
+    if aut.plus_one and aut.moore:
+        # \E y':  \A x':  sys_action /\ (env_action => target')
+        u = _implies_forall(xp, env_action, target, aut)
+        v = _forall(xp, sys_action, aut)
+        u = _and_exist(yp, v, u, aut)
+    elif aut.plus_one:
+        # \A x':  \E y':  sys_action /\ (env_action => target')
+        u = ~ prt.conjoin(env_action) | target
+        u = _and_exist(yp, sys_action, u, aut)
         u = aut.forall(xp, u)
+    elif aut.moore:
+        # \E y':  \A x':  env_action => (sys_action /\ target')
+        u = prt.conjoin(sys_action) & target
+        u = _implies_forall(xp, env_action, u, aut)
         u = aut.exist(yp, u)
     else:
-        # \A x':  \E y'
-        u = aut.exist(yp, u)
-        u = aut.forall(xp, u)
+        # \A x':  \E y':  env_action => (sys_action /\ target')
+        u = _and_exist(yp, sys_action, target, aut)
+        v = ~ prt.conjoin(_forall(yp, env_action, aut))
+        u = aut.or_forall(xp, v, u)
     return u
 
 
+def _and_exist(qvars, action, u, aut):
+    r"""Return `\E qvars:  action /\ u`."""
+    if isinstance(action, prt.Partition):
+        return action.and_exist(qvars, u)
+    return aut.and_exist(qvars, action, u)
+
+
+def _implies_forall(qvars, action, u, aut):
+    r"""Return `\A qvars:  action => u`."""
+    if isinstance(action, prt.Partition):
+        return action.implies_forall(qvars, u)
+    return aut.or_forall(qvars, ~ action, u)
+
+
+def _forall(qvars, action, aut):
+    r"""Return `\A qvars:  action`, partitioned if `action` is."""
+    if isinstance(action, prt.Partition):
+        return action.forall(qvars)
+    return aut.forall(qvars, action)
+
+
 def preimage(trans, target, qvars, automaton, forall):
     """Preimage with non-mixed quantification."""
     return _bdd.preimage(
@@ -127,10 +204,59 @@ def descendants(source, constrain, aut, future=True):
     return q
 
 
+def frontier_descendants(source, constrain, aut, future=True,
+                         simplify=False, sizes=None):
+    """Existential descendants of `source` in `constrain`.
+
+    Returns the same set as `descendants`, by computing
+    in each iteration the image of only the states
+    added in the previous iteration.
+
+    @param simplify: if `True`, then simplify each frontier
+        using the states added before as don't-cares
+        (has effect with `dd.cudd`)
+    @param sizes: if a `list`, then append to it the
+        number of nodes of each frontier
+    """
+    if future:
+        q = ee_image(source, aut)
+    else:
+        q = source
+    q = (q | ee_image(q, aut)) & constrain
+    frontier = q
+    while frontier != aut.false:
+        if sizes is not None:
+            sizes.append(len(frontier))
+        new = ee_image(frontier, aut) & constrain & ~ q
+        if simplify:
+            frontier = _simplify(new, q, aut)
+        else:
+            frontier = new
+        q |= new
+    return q
+
+
+def _restrict_action(action, states):
+    """Return `action` from `states`, if cheap to compute."""
+    if isinstance(action, prt.Partition):
+        return action
+    return action & states
+
+
+def _simplify(new, old, aut):
+    """Return subset of `new | old` that contains `new`.
+
+    Uses `old` as don't-care set, to reduce the size of `new`.
+    """
+    if _cudd is None or not isinstance(aut.bdd, _cudd.BDD):
+        return new
+    return _cudd.restrict(new, ~ old)
+
+
 def ee_image(source, aut):
     """Existential image."""
     u = aut.action[SYS]
     qvars = aut.varlist['env'] + aut.varlist['sys']
-    u = aut.exist(qvars, u & source)
+    u = _and_exist(qvars, u, source, aut)
     u = prm.unprime(u, aut)
     return u
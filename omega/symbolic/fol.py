@@ -23,8 +23,13 @@ Kenneth Kunen
 # examples/interleaving
 # symbolic_transducers
 # simulate
+import collections
+import hashlib
+import json
 import logging
+import os
 import pprint
+import weakref
 
 try:
     from dd import cudd as _bdd
@@ -41,8 +46,10 @@ from omega.symbolic import orthotopes as lat
 
 
 log = logging.getLogger(__name__)
-_parser = lexyacc.Parser()
+_parser = lexyacc.LazyParser()
 TYPE_HINTS = {'int', 'saturating', 'modwrap'}
+COMPILERS = {'slugsin', 'bdd'}
+EXPR_CACHE_SIZE = 1024
 
 
 class Context(object):
@@ -62,10 +69,40 @@ class Context(object):
 
     def __init__(self):
         """Instantiate first-order context."""
-        self.vars = dict()
+        # incremented whenever `vars` or `op` change
+        self._version = 0
+        self._expr_cache = ExprCache(EXPR_CACHE_SIZE)
+        self._qbits = dict()  # `frozenset` of vars -> `set` of bits
+        # operator name -> bdd with primed bits,
+        # referenced with `@` by the 'slugsin' compiler
+        self._op_bdd_primed = dict()
+        self.vars = SymbolTable()
         self.bdd = _bdd.BDD()
         self.op = dict()  # operator name -> `str`
         self.op_bdd = dict()  # operator name -> bdd
+        # how formulas become BDDs:
+        #   - 'slugsin': via bitvector formulas in prefix syntax
+        #   - 'bdd': directly, by bit-blasting to BDD operations
+        self.compiler = 'slugsin'
+        # saved variable orders, see `load_orders`
+        self.orders = dict()  # `order_key` -> `list` of bits
+        self._saved_key = None  # key of applied saved order
+
+    @property
+    def vars(self):
+        """`SymbolTable` of declared variables.
+
+        Setting a `dict` converts it to a `SymbolTable`,
+        and invalidates the cache of `add_expr`.
+        """
+        return self._vars
+
+    @vars.setter
+    def vars(self, table):
+        if not isinstance(table, SymbolTable):
+            table = SymbolTable(table)
+        self._vars = table
+        self._changed_table()
 
     def __str__(self):
         return ((
@@ -83,6 +120,12 @@ class Context(object):
         c.declare(x=(2, 15), y='bool', z=(-3, 4))
         ```
 
+        An encoding of an integer can be given as
+        a third item, for example `w=(100, 103, 'offset')`
+        stores `w - 100` in 2 bits, and `w=(0, 7, 'gray')`
+        stores the Gray code of `w`
+        (see `omega.logic.bitvector.ENCODINGS`).
+
         Wrapper of `self.add_vars` that may replace it.
         """
         d = bv.make_symbol_table(vrs)
@@ -128,6 +171,14 @@ class Context(object):
           - `"bitnames"`: `list`
           - `"signed"`: `True` if signed integer
           - `"width"`: `len(bitnames)`
+
+        An integer with `"encoding": "offset"` is refined
+        by `ceil(log2(max - min + 1))` bits that store
+        the unsigned integer `x - min`.
+        The encoding `"gray"` stores the Gray code of `x - min`
+        in as many bits, and `"onehot"` uses one bit for each
+        value (see `omega.logic.bitvector.encode_int`).
+        The one-hot bits are constrained by the type hints.
         """
         assert dvars, dvars
         self._avoid_redeclaration(dvars)
@@ -140,6 +191,85 @@ class Context(object):
         bits = bv.bit_table(t, t)
         for bit in bits:
             self.bdd.add_var(bit)
+        self._changed_table()
+        self._apply_saved_order()
+
+    def dump_order(self, filename):
+        """Save the current variable order to `filename`.
+
+        The order is stored under the key `order_key`
+        of the declared bits. Orders with other keys
+        already in `filename` are preserved.
+
+        @return: the key
+        """
+        key = order_key(self.bdd.vars)
+        orders = load_orders(filename)
+        orders[key] = [
+            self.bdd.var_at_level(i)
+            for i in range(len(self.bdd.vars))]
+        dump_orders(orders, filename)
+        return key
+
+    def load_orders(self, filename):
+        """Read variable orders from `filename`.
+
+        Whenever the declared bits match a saved order
+        (now, or after declaring more variables),
+        the BDD manager is reordered to the saved order,
+        and `reorder` has no effect.
+        """
+        self.orders.update(load_orders(filename))
+        self._apply_saved_order()
+
+    def _apply_saved_order(self):
+        """Reorder `self.bdd` if a saved order matches."""
+        bits = self.bdd.vars
+        order = saved_order(bits, self.orders)
+        if order is None:
+            return
+        key = order_key(bits)
+        if key == self._saved_key:
+            return
+        dorder = {var: i for i, var in enumerate(order)}
+        _bdd.reorder(self.bdd, dorder)
+        self._saved_key = key
+        log.info('applied saved variable order "{k}"'.format(k=key))
+
+    def _has_saved_order(self):
+        """Return `True` if a saved order has been applied."""
+        return (
+            self._saved_key is not None and
+            self._saved_key == order_key(self.bdd.vars))
+
+    def _changed_table(self):
+        """Invalidate what depends on `vars` and `op`."""
+        self._version += 1
+        self._expr_cache.clear()
+        self._qbits.clear()
+        self._op_bdd_primed.clear()
+
+    def close(self):
+        """Release the BDDs cached in this context.
+
+        Called when the context is deleted, so that the cached
+        BDD nodes are dereferenced before the BDD manager.
+        """
+        self._expr_cache.clear()
+        self._op_bdd_primed.clear()
+
+    def __del__(self):
+        self.close()
+
+    def cache_info(self):
+        """Return statistics of the cache used by `add_expr`.
+
+        @return: `dict` with keys:
+            "hits", "misses", "size", "maxsize", "version"
+        """
+        d = self._expr_cache.statistics()
+        d['version'] = self._version
+        return d
 
     def _avoid_redeclaration(self, dvars):
         # if any `dvars` not fresh, then must be same
@@ -157,7 +287,7 @@ class Context(object):
     def support(self, u):
         """Return FOL variables that `u` depends on."""
         supp = self.bdd.support(u)
-        bit2int = bv.map_bits_to_integers(self.vars)
+        bit2int = self.vars.bit_to_var
         return set(map(bit2int.__getitem__, supp))
 
     def let(self, defs, u):
@@ -195,18 +325,57 @@ class Context(object):
 
     def forall(self, qvars, u):
         """Universally quantify `qvars` in `u`."""
-        r = self.apply('not', u)
-        r = self.exist(qvars, r)
-        r = self.apply('not', r)
-        return r
+        if len(qvars) == 0:
+            return u
+        qbits = self._quantified_bits(qvars)
+        return self.bdd.forall(qbits, u)
 
     def exist(self, qvars, u):
         """Existentially quantify `qvars` in `u`."""
         if len(qvars) == 0:
             return u
-        qbits = bv.bit_table(qvars, self.vars)
+        qbits = self._quantified_bits(qvars)
         return self.bdd.exist(qbits, u)
 
+    def and_exist(self, qvars, u, v):
+        r"""Return `\E qvars:  u /\ v` (relational product).
+
+        Uses the fused operation of the BDD manager,
+        if available, so `u /\ v` is not constructed.
+        """
+        if len(qvars) == 0:
+            return u & v
+        qbits = self._quantified_bits(qvars)
+        if _has_fused_ops(self.bdd):
+            return _bdd.and_exists(u, v, qbits)
+        return self.bdd.exist(qbits, u & v)
+
+    def or_forall(self, qvars, u, v):
+        r"""Return `\A qvars:  u \/ v`.
+
+        Uses the fused operation of the BDD manager,
+        if available, so `u \/ v` is not constructed.
+        """
+        if len(qvars) == 0:
+            return u | v
+        qbits = self._quantified_bits(qvars)
+        if _has_fused_ops(self.bdd):
+            return _bdd.or_forall(u, v, qbits)
+        return self.bdd.forall(qbits, u | v)
+
+    def _quantified_bits(self, qvars):
+        """Return `set` of bits that refine `qvars`.
+
+        The result is cached, because the same variables
+        are quantified repeatedly by fixpoint algorithms.
+        """
+        key = frozenset(qvars)
+        qbits = self._qbits.get(key)
+        if qbits is None:
+            qbits = self.vars.bits_of(key)
+            self._qbits[key] = qbits
+        return qbits
+
     def count(self, u, care_vars=None):
         """Return number of satisfying assignments.
 
@@ -221,7 +390,7 @@ class Context(object):
         if care_vars is None:
             care_vars = support
         assert set(care_vars) >= support, (care_vars, support)
-        bits = _refine_vars(care_vars, self.vars)
+        bits = self.vars.bits_of(care_vars)
         n = len(bits)
         c = self.bdd.count(u, n)
         assert c == int(c), c
@@ -237,7 +406,7 @@ class Context(object):
         if care_vars is None:
             care_bits = None
         elif care_vars:
-            care_bits = bv.bit_table(care_vars, self.vars)
+            care_bits = self.vars.bits_of(care_vars)
         else:
             care_bits = set()
         vrs = self.support(u)
@@ -267,12 +436,20 @@ class Context(object):
         In the future, this method may merge with `add_expr`.
         """
         assert stx.isinstance_str(e), e
-        bv_defs = bv._parser.parse(e)
+        assert self.compiler in COMPILERS, self.compiler
+        if self.compiler == 'bdd':
+            bv_defs = bv._bdd_parser.parse(e)
+        else:
+            bv_defs = bv._parser.parse(e)
         defs = _parser.parse(e)
+        # subterms shared among the definitions
+        table = dict()
+        cse = dict()
         for opdef, bv_opdef in zip(defs, bv_defs):
             assert opdef.operator == '==', opdef
             name_ast, expr_ast = opdef.operands
             _, bv_ast = bv_opdef.operands
+            bv_ast = bv.share_subtrees(bv_ast, table)
             name = name_ast.value
             if name in self.vars:
                 raise ValueError((
@@ -285,16 +462,24 @@ class Context(object):
                     'Attempted to redefine operator "{name}". '
                     'Previous definition as: "{old}"').format(
                         name=name, old=self.op[name]))
-            s = bv_ast.flatten(
-                t=self.vars, defs=self.op_bdd)
-            assert stx.isinstance_str(s), s
+            if self.compiler == 'bdd':
+                u = bv_ast.flatten(
+                    t=self.vars, defs=self.op_bdd, bdd=self.bdd,
+                    cse=cse)
+            else:
+                s = bv_ast.flatten(
+                    t=self.vars, defs=self.op_bdd, cse=cse,
+                    primed=self._op_bdd_primed)
+                assert stx.isinstance_str(s), s
+                u = sym_bdd.add_expr(s, self.bdd)
             # sensitive point:
             #     operator expressions are stored before substitutions
             #     operator BDDs are stored after operator substitutions
             # operator definitions cannot change, so this should
             # not cause problems as currently arranged.
             self.op[name] = expr_ast.flatten()
-            self.op_bdd[name] = sym_bdd.add_expr(s, self.bdd)
+            self.op_bdd[name] = u
+        self._changed_table()
 
     def to_bdd(self, expr):
         """Return BDD for the formula `expr`."""
@@ -308,16 +493,42 @@ class Context(object):
         """Add first-order predicate.
 
         A predicate is a Boolean-valued formula.
+        The attribute `compiler` selects how `e` is
+        translated to a BDD (see `COMPILERS`).
+
+        @param with_ops: if `True`, then replace operators
+            defined with `define` by their BDDs in `op_bdd`,
+            renamed to primed bits where primed
         """
         assert stx.isinstance_str(e), e
-        # optional because current implementation is slow
+        assert self.compiler in COMPILERS, self.compiler
         if with_ops:
-            defs = self.op
+            defs = self.op_bdd
         else:
             defs = None
-        s = bv.bitblast(e, vrs=self.vars, defs=defs)
-        assert stx.isinstance_str(s), s  # was `e` a predicate ?
-        return sym_bdd.add_expr(s, self.bdd)
+        # BDD references `@` can become invalid, so not cached
+        cacheable = '@' not in e
+        key = (e, with_ops, self.compiler, self._version)
+        r = self._expr_cache.get(key) if cacheable else None
+        if self.compiler == 'bdd':
+            # cached BDD from same manager ?
+            if r is not None and r.bdd is self.bdd:
+                return r
+            u = bv.bitblast_to_bdd(
+                e, vrs=self.vars, bdd=self.bdd, defs=defs)
+            assert not isinstance(u, list), u  # was `e` a predicate ?
+            if cacheable:
+                self._expr_cache.add(key, u)
+            return u
+        if r is None:
+            r = bv.bitblast(
+                e, vrs=self.vars, defs=defs,
+                primed=self._op_bdd_primed)
+            assert stx.isinstance_str(r), r  # was `e` a predicate ?
+            # references to operator BDDs ?
+            if cacheable and '@' not in r:
+                self._expr_cache.add(key, r)
+        return sym_bdd.add_expr(r, self.bdd)
 
     def to_expr(self, u, care=None, **kw):
         """Return minimal DNF of integer inequalities.
@@ -364,9 +575,248 @@ class Context(object):
         return self.bdd.true
 
 
+def _has_fused_ops(bdd):
+    """Return `True` if `bdd` has fused quantification."""
+    return (
+        hasattr(_bdd, 'and_exists') and
+        isinstance(bdd, _bdd.BDD))
+
+
+class ExprCache(object):
+    """Bounded cache of least recently used expressions.
+
+    Maps keys to results of bit-blasting:
+    bitvector formulas (`str`) or BDD nodes.
+    Cached BDD nodes remain referenced in the manager,
+    until `Context.close` clears the cache.
+    Counts cache hits and misses.
+    If `maxsize == 0`, then nothing is cached.
+    """
+
+    def __init__(self, maxsize):
+        assert maxsize >= 0, maxsize
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._d = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._d)
+
+    def get(self, key):
+        """Return value for `key`, or `None` if absent."""
+        value = self._d.pop(key, None)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._d[key] = value  # most recently used
+        return value
+
+    def add(self, key, value):
+        """Store `value` for `key`, evicting if full."""
+        if self.maxsize == 0:
+            return
+        self._d.pop(key, None)
+        self._d[key] = value
+        while len(self._d) > self.maxsize:
+            self._d.popitem(last=False)
+
+    def clear(self):
+        """Remove all entries (statistics remain)."""
+        self._d.clear()
+
+    def statistics(self):
+        """Return `dict` of counts."""
+        return dict(
+            hits=self.hits, misses=self.misses,
+            size=len(self._d), maxsize=self.maxsize)
+
+
+class SymbolTable(dict):
+    """Table of variables, with indexes of their bits.
+
+    Maps each variable name to a `VarRecord`.
+    The indexes are updated whenever an item is set
+    or removed, and whenever the `"type"` or `"bitnames"`
+    of a record in the table change.
+    Bit levels are not indexed, because they change
+    with reordering.
+
+    Attributes:
+
+      - `bit_to_var`: `dict` that maps each bit
+        to the variable that it refines
+      - `var_to_bits`: `dict` that maps each variable
+        to a `tuple` of its bits (least significant first)
+    """
+
+    def __init__(self, *arg, **kw):
+        super(SymbolTable, self).__init__()
+        self.bit_to_var = dict()
+        self.var_to_bits = dict()
+        self.update(*arg, **kw)
+
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+    def __setitem__(self, var, d):
+        if var in self:
+            self._remove_bits(var)
+        # a record belongs to one table
+        if not isinstance(d, VarRecord) or d._table is not None:
+            d = VarRecord(d)
+        d._table = weakref.ref(self)
+        d._var = var
+        super(SymbolTable, self).__setitem__(var, d)
+        self._add_bits(var, d)
+
+    def __delitem__(self, var):
+        self._remove_bits(var)
+        super(SymbolTable, self).__delitem__(var)
+
+    def _add_bits(self, var, d):
+        if d.get('type') == 'bool':
+            bits = (var,)
+        else:
+            bits = tuple(d.get('bitnames', ()))
+        self.var_to_bits[var] = bits
+        for bit in bits:
+            self.bit_to_var[bit] = var
+
+    def _remove_bits(self, var):
+        for bit in self.var_to_bits.pop(var):
+            self.bit_to_var.pop(bit, None)
+        d = super(SymbolTable, self).__getitem__(var)
+        d._table = None
+
+    def _reindex(self, var):
+        """Update the indexes for the record of `var`."""
+        d = super(SymbolTable, self).__getitem__(var)
+        for bit in self.var_to_bits.pop(var):
+            self.bit_to_var.pop(bit, None)
+        self._add_bits(var, d)
+
+    def update(self, *arg, **kw):
+        for var, d in dict(*arg, **kw).items():
+            self[var] = d
+
+    def setdefault(self, var, d=None):
+        if var not in self:
+            self[var] = d
+        return self[var]
+
+    def pop(self, var, *arg):
+        if var not in self:
+            return super(SymbolTable, self).pop(var, *arg)
+        d = self[var]
+        del self[var]
+        return d
+
+    def popitem(self):
+        var, d = super(SymbolTable, self).popitem()
+        for bit in self.var_to_bits.pop(var):
+            self.bit_to_var.pop(bit, None)
+        d._table = None
+        return var, d
+
+    def clear(self):
+        for d in self.values():
+            d._table = None
+        super(SymbolTable, self).clear()
+        self.bit_to_var.clear()
+        self.var_to_bits.clear()
+
+    def copy(self):
+        return type(self)(self)
+
+    def bits_of(self, vrs):
+        """Return `set` of bits that refine the variables `vrs`."""
+        bits = set()
+        for var in vrs:
+            bits.update(self.var_to_bits[var])
+        return bits
+
+
+class VarRecord(dict):
+    """Attributes of a variable, as a `dict`.
+
+    Changing the `"type"` or `"bitnames"` updates
+    the indexes of the `SymbolTable` that contains the record.
+    A record is contained in at most one table,
+    so inserting it in another table inserts a copy.
+    """
+
+    __slots__ = ('_table', '_var')
+    _indexed = ('type', 'bitnames')
+
+    def __init__(self, *arg, **kw):
+        super(VarRecord, self).__init__(*arg, **kw)
+        self._table = None  # weak reference to `SymbolTable`
+        self._var = None
+
+    def __setitem__(self, k, v):
+        super(VarRecord, self).__setitem__(k, v)
+        if k in self._indexed:
+            self._changed()
+
+    def __delitem__(self, k):
+        super(VarRecord, self).__delitem__(k)
+        if k in self._indexed:
+            self._changed()
+
+    def update(self, *arg, **kw):
+        super(VarRecord, self).update(*arg, **kw)
+        self._changed()
+
+    def setdefault(self, k, v=None):
+        r = super(VarRecord, self).setdefault(k, v)
+        if k in self._indexed:
+            self._changed()
+        return r
+
+    def pop(self, k, *arg):
+        r = super(VarRecord, self).pop(k, *arg)
+        if k in self._indexed:
+            self._changed()
+        return r
+
+    def popitem(self):
+        r = super(VarRecord, self).popitem()
+        self._changed()
+        return r
+
+    def clear(self):
+        super(VarRecord, self).clear()
+        self._changed()
+
+    def _changed(self):
+        """Update the indexes of the containing table."""
+        if self._table is None:
+            return
+        table = self._table()
+        if table is None:
+            self._table = None
+            return
+        table._reindex(self._var)
+
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+    def copy(self):
+        return type(self)(self)
+
+
 def reorder(dvars, fol):
-    """Shift integers up in the variable order of `fol.bdd`."""
+    """Shift integers up in the variable order of `fol.bdd`.
+
+    No effect if a saved order has been applied
+    (see `Context.load_orders`).
+    """
     assert dvars, dvars
+    if fol._has_saved_order():
+        log.info('saved variable order, so no reordering')
+        return
     bdd = fol.bdd
     for var, d in dvars.items():
         level = d['level']
@@ -399,15 +849,44 @@ def reorder(dvars, fol):
         assert order == new_order, (order, new_order)
 
 
-def _refine_vars(fol_vars, table):
-    """Return bits that represent the `fol_vars`."""
-    if fol_vars:
-        bits = bv.bit_table(fol_vars, table)
-    else:
-        # `bit_table` raises `AssertionError` for
-        # empty `fol_vars`
-        bits = set()
-    return bits
+def order_key(bits):
+    """Return `str` that identifies the set of `bits`."""
+    s = '\n'.join(sorted(bits))
+    return hashlib.sha1(s.encode('utf-8')).hexdigest()
+
+
+def saved_order(bits, orders):
+    """Return saved order of `bits`, or `None`.
+
+    @param orders: `dict` that maps `order_key`
+        to `list` of bits
+    """
+    if not orders:
+        return None
+    order = orders.get(order_key(bits))
+    if order is None:
+        return None
+    if set(order) != set(bits):
+        log.warning('saved order mismatch, ignoring it')
+        return None
+    return list(order)
+
+
+def load_orders(filename):
+    """Return `dict` of variable orders from JSON `filename`.
+
+    @return: empty `dict` if `filename` does not exist
+    """
+    if not os.path.isfile(filename):
+        return dict()
+    with open(filename, 'r') as f:
+        return json.load(f)
+
+
+def dump_orders(orders, filename):
+    """Write `dict` of variable orders to JSON `filename`."""
+    with open(filename, 'w') as f:
+        json.dump(orders, f, indent=4, sort_keys=True)
 
 
 def _refine_assignment(m, table):
@@ -432,7 +911,8 @@ def _int_to_bit_assignment(var, value, table):
     # We could log whether `value` is within the type hints,
     # but there are valid use cases outside the type hints.
     var_bits = bv.var_to_twos_complement(var, table)
-    int_bits = bv.int_to_twos_complement(value)
+    code = bv.encode_int(value, table[var])
+    int_bits = bv.int_to_twos_complement(code)
     p, q = bv.equalize_width(var_bits, int_bits)
     values = dict()
     for u, v in zip(p, q):
@@ -473,6 +953,9 @@ def _refine_renaming(fol_rename, table):
         old_dom = old_d['dom']
         new_dom = new_d['dom']
         assert old_dom == new_dom, (old_dom, new_dom)
+        old_enc = old_d.get('encoding')
+        new_enc = new_d.get('encoding')
+        assert old_enc == new_enc, (old_enc, new_enc)
         old_bits = old_d['bitnames']
         new_bits = new_d['bitnames']
         assert len(old_bits) == len(new_bits), (
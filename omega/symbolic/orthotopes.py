@@ -4,8 +4,6 @@
 #
 import logging
 
-import natsort
-
 from omega.logic import syntax as stx
 from omega.symbolic.prime import support_issubset
 from omega.symbolic.prime import joint_support
@@ -114,7 +112,17 @@ def _implicant_orthotopes(f, prm, fol):
 def embed_as_implicants(f, prm, fol):
     px = prm._px
     ax = {x: d['a'] for x, d in px.items()}
-    u = fol.let(ax, f)
+    # rename bits if same encoding, otherwise substitute values
+    other = {
+        x for x, a in ax.items()
+        if fol.vars[x].get('encoding') != fol.vars[a].get('encoding')}
+    rename = {x: a for x, a in ax.items() if x not in other}
+    u = fol.let(rename, f) if rename else f
+    if other:
+        s = stx.conj(
+            '({x} = {a})'.format(x=x, a=ax[x])
+            for x in other)
+        u = fol.and_exist(other, u, fol.add_expr(s))
     v = _orthotope_singleton(px, fol)
     return u & v
 
@@ -124,7 +132,7 @@ def _embed_as_implicants_naive(f, px, fol):
     x_as_ab = {x: dict(a=x, b=x) for x in px}
     varmap = parameter_varmap(px, x_as_ab)
     r = eq(varmap, fol)
-    return fol.exist(x_as_ab, r & f)
+    return fol.and_exist(x_as_ab, r, f)
 
 
 # slower than `_orthotope_singleton`
@@ -280,6 +288,7 @@ def list_expr(
     @param use_dom: omit conjuncts that contain dom of var
         assumes that `|= care => type_hints`
     """
+    import natsort
     px = prm._px
     xp = _map_parameters_to_vars(px)
     support = fol.support(cover)
@@ -447,6 +456,8 @@ def _parameter_table(x, table, a_name, b_name):
 
     Supports integer-valued variables only.
     Represent Boolean-valued as 0..1-valued variables.
+    Each parameter has the encoding of its variable,
+    except for one-hot variables (see `embed_as_implicants`).
     """
     assert x, x
     d = dict()
@@ -457,6 +468,14 @@ def _parameter_table(x, table, a_name, b_name):
         name = stx._replace_prime(xj)
         aj = '{a}_{v}'.format(a=a_name, v=name)
         bj = '{b}_{v}'.format(b=b_name, v=name)
+        # same encoding, so that bits can be renamed
+        encoding = table[xj].get('encoding')
+        # distinct one-hot bits can decode to the same value,
+        # so store the value `x - min` as unsigned integer
+        if encoding == 'onehot':
+            encoding = 'offset'
+        if encoding is not None:
+            dom = tuple(dom) + (encoding,)
         d[aj] = tuple(dom)
         d[bj] = tuple(dom)
         assert "'" not in aj, aj
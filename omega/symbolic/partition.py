@@ -0,0 +1,203 @@
+"""Conjunctively partitioned transition relations.
+
+An action is represented as a conjunction of clusters,
+and images are computed by early quantification,
+without constructing the conjunction.
+
+Reference
+=========
+
+Ranjan R.K., Aziz A., Brayton R.K., Plessier B., Pixley C.
+    "Efficient BDD algorithms for FSM synthesis and verification"
+    International Workshop on Logic Synthesis (IWLS), 1995
+"""
+# Copyright 2015-2017 by California Institute of Technology
+# All rights reserved. Licensed under 3-clause BSD.
+#
+import logging
+
+from omega.logic import syntax as stx
+
+
+CLUSTER_SIZE = 1000  # max number of nodes in a cluster
+log = logging.getLogger(__name__)
+
+
+class Partition(object):
+    """Conjunction of BDDs, with quantification schedules.
+
+    The conjuncts are clustered, by conjoining them
+    as long as the result has at most `threshold` nodes.
+    For each set of variables to quantify,
+    a schedule is computed once and memoized.
+
+    Attributes:
+
+      - `clusters`: `list` of BDD nodes
+      - `threshold`: max number of nodes of a cluster
+    """
+
+    def __init__(self, conjuncts, context, threshold=None):
+        """Cluster `conjuncts`.
+
+        @param conjuncts: `list` of expressions (`str`)
+            or BDD nodes
+        @param context: `fol.Context` where the
+            expressions are added
+        @param threshold: max number of nodes per cluster,
+            if `None` then use `CLUSTER_SIZE`
+        """
+        if threshold is None:
+            threshold = CLUSTER_SIZE
+        assert threshold > 0, threshold
+        self.context = context
+        self.threshold = threshold
+        us = [context.add_expr(u) if stx.isinstance_str(u) else u
+              for u in conjuncts]
+        self.clusters = _cluster(us, threshold, context)
+        self._supports = [context.support(u) for u in self.clusters]
+        self._schedules = dict()  # `frozenset` of vars -> schedule
+        self._forall = dict()  # `frozenset` of vars -> `Partition`
+        self._conjunction = None
+
+    def __len__(self):
+        return len(self.clusters)
+
+    def __iter__(self):
+        return iter(self.clusters)
+
+    def __str__(self):
+        return 'Partition with {n} clusters of sizes: {s}'.format(
+            n=len(self.clusters),
+            s=[len(u) for u in self.clusters])
+
+    def conjunction(self):
+        """Return the conjunction of all clusters (memoized)."""
+        if self._conjunction is None:
+            r = self.context.true
+            for u in self.clusters:
+                r &= u
+            self._conjunction = r
+        return self._conjunction
+
+    def and_exist(self, qvars, u):
+        r"""Return `\E qvars:  u /\ (conjunction of clusters)`.
+
+        Each variable is quantified right after
+        the last cluster that depends on it.
+        """
+        early, steps = self.schedule(qvars)
+        r = self.context.exist(early, u)
+        for v, qv in steps:
+            r = self.context.and_exist(qv, r, v)
+        return r
+
+    def implies_forall(self, qvars, u):
+        r"""Return `\A qvars:  (conjunction of clusters) => u`."""
+        return ~ self.and_exist(qvars, ~ u)
+
+    def forall(self, qvars):
+        """Return `Partition` of clusters universally quantified.
+
+        Universal quantification distributes over conjunction,
+        so the clusters are quantified individually.
+        """
+        key = frozenset(qvars)
+        other = self._forall.get(key)
+        if other is not None:
+            return other
+        other = Partition.__new__(Partition)
+        other.context = self.context
+        other.threshold = self.threshold
+        other.clusters = [
+            self.context.forall(key, u) for u in self.clusters]
+        other._supports = [
+            self.context.support(u) for u in other.clusters]
+        other._schedules = dict()
+        other._forall = dict()
+        other._conjunction = None
+        self._forall[key] = other
+        return other
+
+    def schedule(self, qvars):
+        """Return quantification schedule for `qvars`.
+
+        @return: `(early, steps)`, where `early` are variables
+            that no cluster depends on, and `steps` a `list` of
+            pairs `(cluster, vars to quantify after conjoining it)`
+        """
+        key = frozenset(qvars)
+        r = self._schedules.get(key)
+        if r is None:
+            r = _schedule(key, self.clusters, self._supports)
+            self._schedules[key] = r
+        return r
+
+
+def conjoin(action):
+    """Return BDD of `action`, if a `Partition`, else `action`."""
+    if isinstance(action, Partition):
+        return action.conjunction()
+    return action
+
+
+def _cluster(us, threshold, context):
+    """Return `list` of clusters from conjuncts `us`.
+
+    Conjuncts are sorted by the level of their top variable,
+    so that conjuncts that depend on nearby variables
+    become adjacent, then conjoined greedily.
+    """
+    us = [u for u in us if u != context.true]
+    if context.false in us:
+        return [context.false]
+    us.sort(key=lambda u: u.level)
+    clusters = list()
+    r = None
+    for u in us:
+        if r is None:
+            r = u
+            continue
+        v = r & u
+        if len(v) <= threshold:
+            r = v
+            continue
+        clusters.append(r)
+        r = u
+    if r is not None:
+        clusters.append(r)
+    log.info('clusters of sizes: {s}'.format(
+        s=[len(u) for u in clusters]))
+    return clusters
+
+
+def _schedule(qvars, clusters, supports):
+    """Return clusters ordered for early quantification.
+
+    Greedy heuristic: next pick the cluster after which
+    the most variables can be quantified, breaking ties
+    in favor of clusters that add few new variables.
+    """
+    remaining = list(range(len(clusters)))
+    early = set(qvars)
+    for s in supports:
+        early.difference_update(s)
+    steps = list()
+    seen = set()
+    while remaining:
+        best = None
+        for i in remaining:
+            others = set()
+            for j in remaining:
+                if j != i:
+                    others.update(supports[j])
+            qv = (supports[i] & qvars) - others
+            new = len(supports[i] - seen)
+            cost = (-len(qv), new)
+            if best is None or cost < best[0]:
+                best = (cost, i, qv)
+        _, i, qv = best
+        remaining.remove(i)
+        seen.update(supports[i])
+        steps.append((clusters[i], qv))
+    return early, steps
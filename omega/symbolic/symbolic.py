@@ -15,8 +15,6 @@ import logging
 import pprint
 import warnings
 
-import natsort
-
 from omega.logic import bitvector as bv
 from omega.logic import syntax as stx
 from omega.symbolic import bdd as sym_bdd
@@ -156,6 +154,8 @@ class Automaton(object):
         # map between primed and unprimed
         self.prime = dict()  # unprimed -> primed
         self.unprime = dict()  # primed -> unprimed
+        # saved variable orders, see `fol.Context.load_orders`
+        self.orders = dict()
         # aux
         # init only to aid static analysis
         self.bdd = _bdd.BDD()
@@ -168,6 +168,7 @@ class Automaton(object):
         a.action = copy.deepcopy(self.action)
         a.win = copy.deepcopy(self.win)
         a.acceptance = self.acceptance
+        a.orders = self.orders
         a.bdd = self.bdd
         return a
 
@@ -432,6 +433,11 @@ def _bitvector_to_bdd(aut):
                 if d['owner'] == 'sys')
     b = _pick_var_order(bits, ubits)
     b = _add_primed_bits(b)
+    # a saved order takes precedence
+    from omega.symbolic import fol as _fol  # avoid circular import
+    order = _fol.saved_order(b, aut.orders)
+    if order is not None:
+        b = order
     bdd = aut.bdd
     # define levels only if no existing vars
     if bdd.vars:
@@ -509,6 +515,7 @@ def _to_bdd(a, b, bdd):
 
 
 def _pick_var_order_eu(bits, ubits):
+    import natsort
     ebits = set(bits).difference(ubits)
     u = natsort.natsorted(ubits)
     e = natsort.natsorted(ebits)
@@ -525,6 +532,7 @@ def _pick_var_order(bits, ubits):
 
     and concatenated in that order.
     """
+    import natsort
     array_bits = {b for b, d in bits.items() if d.get('array')}
     other = set(bits).difference(array_bits)
     top = natsort.natsorted(other)
@@ -598,6 +606,7 @@ def _prime_and_order_table(t):
 
     @rtype: `dict` from `str` to `dict`
     """
+    import natsort
     ordvars = natsort.natsorted(t)
     dvars = dict()
     for i, var in enumerate(ordvars):
@@ -25,6 +25,7 @@ import weakref
 from omega.logic import bitvector as bv
 from omega.logic import syntax as stx
 from omega.symbolic import fol as _fol
+from omega.symbolic import partition as prt
 from omega.symbolic import prime as prm
 from omega.symbolic import symbolic as _sym
 from omega.symbolic import _type_hints as tyh
@@ -66,6 +67,9 @@ class Automaton(_fol.Context):
       - `action`: transition predicate
         `ExprDict` that maps strings to BDD nodes.
         Usually the strings are operator names.
+        Setting a `list` of conjuncts stores a
+        `partition.Partition`, which the functions in
+        `omega.symbolic.fixpoint` use without conjoining.
 
       - `win`: winning condition. In general, it takes the form:
 
@@ -157,6 +161,8 @@ class Automaton(_fol.Context):
         other.players = copy.deepcopy(self.players)
         other.op = copy.deepcopy(self.op)
         other.op_bdd = copy.copy(self.op_bdd)
+        other.compiler = self.compiler
+        other.orders = self.orders
         # BDD nodes
         other.init = ExprDict(other, self.init)
         other.action = ExprDict(other, self.action)
@@ -347,11 +353,17 @@ class Automaton(_fol.Context):
             s = r'({a} <= {var}) /\ ({var}  <= {b})'
             type_inv = s.format(a=a, b=b, var=var)
             r.append(type_inv)
+            enc_inv = bv.encoding_invariant(var, hints)
+            if enc_inv is not None:
+                r.append(enc_inv)
             if not action:
                 continue
             type_inv_primed = s.format(
                 a=a, b=b, var=stx.prime(var))
             r.append(type_inv_primed)
+            enc_inv = bv.encoding_invariant(var, hints, prime=True)
+            if enc_inv is not None:
+                r.append(enc_inv)
         return stx.conj(r)
 
     def _cache_expr(self, expr):
@@ -512,7 +524,10 @@ class ExprDict(dict):
     a BDD first, then storage. To reverse this conversion
     call the method `_fetch_expr` of the associated context.
 
-    This class treats values other than `str` the same
+    Setting a `list` of conjuncts as value stores
+    a `partition.Partition` of them.
+
+    This class treats other values the same
     way that `dict` does.
     """
 
@@ -525,8 +540,13 @@ class ExprDict(dict):
 
         If `v` is a `str`, then convert to BDD,
         then set `k` to the resulting BDD.
+        If `v` is a `list`, then set `k` to a partition.
         Otherwise behave as a `dict`.
         """
+        if isinstance(v, list):
+            u = prt.Partition(v, self._context)
+            super(ExprDict, self).__setitem__(k, u)
+            return
         try:
             v + ''
         except TypeError:
@@ -558,10 +578,13 @@ class ExprDict(dict):
 
 
 def conj_actions_of(players, aut):
-    """Return conjunction of actions from `players`."""
+    """Return conjunction of actions from `players`.
+
+    Actions that are partitions are conjoined.
+    """
     action = aut.true
     for p in players:
-        action &= aut.action[p]
+        action &= prt.conjoin(aut.action[p])
     return action
 
 
@@ -0,0 +1,227 @@
+"""Transfer of automata between BDD managers.
+
+BDDs are represented by tables of nodes that can be pickled,
+for example to send them to another process.
+The methods `dump` and `load` of BDD managers write files,
+using a shelf in the current directory,
+so they are not used by concurrent processes.
+"""
+# Copyright 2015-2017 by California Institute of Technology
+# All rights reserved. Licensed under 3-clause BSD.
+#
+import copy
+import logging
+
+from omega.symbolic import partition as prt
+from omega.symbolic import temporal as trl
+
+
+log = logging.getLogger(__name__)
+ATTRIBUTES = (
+    'moore', 'plus_one', 'qinit', 'acceptance', 'compiler', 'orders')
+
+
+def dumps_automaton(aut, roots=None):
+    """Return `dict` that represents `aut`, and can be pickled.
+
+    Included are the BDDs in `aut.init`, `aut.action`,
+    `aut.win` and `aut.op_bdd`. A `partition.Partition`
+    is represented by its clusters.
+
+    @type aut: `temporal.Automaton`
+    @param roots: `dict` of more BDDs to include,
+        returned by `loads_automaton`
+    @return: `dict` to pass to `loads_automaton`
+    """
+    bdds = dict()
+    init = _dump_dict(aut.init, 'init', bdds)
+    action = _dump_dict(aut.action, 'action', bdds)
+    op_bdd = _dump_dict(aut.op_bdd, 'op_bdd', bdds)
+    win = dict()
+    for k, us in aut.win.items():
+        win[k] = len(us)
+        for i, u in enumerate(us):
+            name = 'win/{k}/{i}'.format(k=k, i=i)
+            bdds[name] = u
+    if roots is None:
+        roots = dict()
+    for k, u in roots.items():
+        bdds['roots/{k}'.format(k=k)] = u
+    levels = {var: aut.bdd.level_of_var(var)
+              for var in aut.bdd.vars}
+    spec = dict(
+        vars=copy.deepcopy(aut.vars),
+        bits=sorted(levels, key=levels.get),
+        varlist=copy.deepcopy(aut.varlist),
+        players=copy.deepcopy(aut.players),
+        op=copy.deepcopy(aut.op),
+        init=init,
+        action=action,
+        op_bdd=op_bdd,
+        win=win,
+        roots=sorted(roots),
+        bdds=dumps_bdds(bdds, aut.bdd))
+    for attr in ATTRIBUTES:
+        if hasattr(aut, attr):
+            spec[attr] = copy.deepcopy(getattr(aut, attr))
+    return spec
+
+
+def loads_automaton(spec, order=None):
+    """Return `temporal.Automaton` and `roots` from `spec`.
+
+    @param spec: as returned by `dumps_automaton`
+    @param order: `list` of all bits, in the order to
+        declare them. If `None`, then the same order as in
+        the BDD manager given to `dumps_automaton`.
+    @return: `(aut, roots)`, where `roots` is a `dict`
+    """
+    if order is None:
+        order = spec['bits']
+    assert set(order) == set(spec['bits']), (order, spec['bits'])
+    aut = trl.Automaton()
+    aut.vars = copy.deepcopy(spec['vars'])
+    aut.bdd.declare(*order)
+    aut.varlist = copy.deepcopy(spec['varlist'])
+    aut.players = copy.deepcopy(spec['players'])
+    aut.op = copy.deepcopy(spec['op'])
+    for attr in ATTRIBUTES:
+        if attr in spec:
+            setattr(aut, attr, copy.deepcopy(spec[attr]))
+    bdds = loads_bdds(spec['bdds'], aut.bdd)
+    for attr in ('init', 'action', 'op_bdd'):
+        d = _load_dict(spec[attr], attr, bdds, aut)
+        getattr(aut, attr).update(d)
+    for k, n in spec['win'].items():
+        aut.win[k] = [
+            bdds['win/{k}/{i}'.format(k=k, i=i)]
+            for i in range(n)]
+    roots = {k: bdds['roots/{k}'.format(k=k)]
+             for k in spec['roots']}
+    return aut, roots
+
+
+def dumps_bdds(roots, bdd):
+    """Return table of nodes of `roots`, which can be pickled.
+
+    Each node is represented by a triple
+    `(var, low, high)`, where `low` and `high` are
+    references: `1` is `TRUE`, `-1` is `FALSE`,
+    `i > 1` the node at index `i - 2` of the table,
+    and `-i` its negation.
+    Nodes appear after their successors.
+
+    @param roots: `dict` that maps names to BDD nodes
+    @return: `dict` with keys:
+        - `"nodes"`: `list` of triples
+        - `"roots"`: `dict` that maps names to references
+    """
+    index = dict()  # regular BDD node -> reference
+    nodes = list()
+    refs = {k: _dump_node(u, bdd, index, nodes)
+            for k, u in roots.items()}
+    log.debug('dumped {n} nodes'.format(n=len(nodes)))
+    return dict(nodes=nodes, roots=refs)
+
+
+def loads_bdds(table, bdd):
+    """Return `dict` of BDDs from `table`.
+
+    @param table: as returned by `dumps_bdds`
+    @param bdd: BDD manager where the variables
+        are already declared, in any order
+    """
+    us = [None, bdd.true]
+    for var, low, high in table['nodes']:
+        u = bdd.ite(
+            bdd.var(var),
+            _load_node(high, us),
+            _load_node(low, us))
+        us.append(u)
+    return {k: _load_node(r, us)
+            for k, r in table['roots'].items()}
+
+
+def _dump_node(u, bdd, index, nodes):
+    """Return reference to `u`, after adding it to `nodes`.
+
+    Uses an explicit stack instead of recursion,
+    so BDDs of any depth can be dumped.
+    """
+    stack = list()
+    if _node_ref(u, bdd, index) is None:
+        stack.append(_regular(u))
+    while stack:
+        v = stack[-1]
+        low = _node_ref(v.low, bdd, index)
+        if low is None:
+            stack.append(_regular(v.low))
+            continue
+        high = _node_ref(v.high, bdd, index)
+        if high is None:
+            stack.append(_regular(v.high))
+            continue
+        stack.pop()
+        nodes.append((v.var, low, high))
+        index[v] = len(nodes) + 1
+    return _node_ref(u, bdd, index)
+
+
+def _node_ref(u, bdd, index):
+    """Return reference to `u`, or `None` if not dumped yet."""
+    if u == bdd.true:
+        return 1
+    if u == bdd.false:
+        return -1
+    if u.negated:
+        r = index.get(~ u)
+        return None if r is None else -r
+    return index.get(u)
+
+
+def _regular(u):
+    """Return the regular node of `u`."""
+    return ~ u if u.negated else u
+
+
+def _load_node(r, us):
+    """Return BDD node from reference `r`."""
+    if r < 0:
+        return ~ us[-r]
+    return us[r]
+
+
+def _dump_dict(d, prefix, bdds):
+    """Add to `bdds` the values of `d`, return their layout.
+
+    @return: `dict` that maps each key of `d` to `None`
+        if the value is a BDD, and to the pair
+        `(number of clusters, threshold)` if it is a
+        `partition.Partition`
+    """
+    layout = dict()
+    for k, v in d.items():
+        if isinstance(v, prt.Partition):
+            us = list(v)
+            layout[k] = (len(us), v.threshold)
+            for i, u in enumerate(us):
+                name = '{p}/{k}/{i}'.format(p=prefix, k=k, i=i)
+                bdds[name] = u
+        else:
+            layout[k] = None
+            bdds['{p}/{k}'.format(p=prefix, k=k)] = v
+    return layout
+
+
+def _load_dict(layout, prefix, bdds, context):
+    """Inverse of `_dump_dict`."""
+    d = dict()
+    for k, v in layout.items():
+        if v is None:
+            d[k] = bdds['{p}/{k}'.format(p=prefix, k=k)]
+            continue
+        n, threshold = v
+        us = [bdds['{p}/{k}/{i}'.format(p=prefix, k=k, i=i)]
+              for i in range(n)]
+        d[k] = prt.Partition(us, context, threshold=threshold)
+    return d
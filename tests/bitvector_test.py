@@ -112,6 +112,76 @@ def test_flatten_arithmetic():
     # TODO: subtraction
 
 
+def test_range_analysis():
+    # a in -2..1, y in -4..3
+    tree = parser.parse('(a + 3) - (y * 2)')
+    assert bv._value_range(tree, t) == (-5, 12)
+    tree = parser.parse('ite(q, a, 7)')
+    assert bv._value_range(tree, t) == (-2, 7)
+    tree = parser.parse('a / y')
+    assert bv._value_range(tree, t) is None
+    assert bv._range_width((-5, 12)) == 5
+    assert bv._range_width((-4, 3)) == 3
+    assert bv._range_width((0, 0)) == 2
+    # constant folding
+    mem = list()
+    res = parser.parse('(2 * 3) - 7').flatten(t=t, mem=mem)
+    assert res == ['1', '1'], res
+    assert not mem, mem
+    res = parser.parse('7 / -2').flatten(t=t, mem=mem)
+    assert bv.twos_complement_to_int(res) == -3, res
+    # truncated widths
+    res = parser.parse('y * 2').flatten(t=t, mem=mem)
+    assert len(res) == 4, res
+    # comparisons decided by ranges
+    assert parser.parse('a + 1 < 3').flatten(t=t) == '1'
+    assert parser.parse('a * a = 5').flatten(t=t) == '0'
+    assert parser.parse('a != 2').flatten(t=t) == '1'
+    # memoized per subtree
+    tree = parser.parse('(a + 3) - (y * 2)')
+    memo = dict()
+    assert bv._value_range(tree, t, memo=memo) == (-5, 12)
+    assert len(memo) == 7, memo
+    assert bv._value_range(tree, t, memo=memo) == (-5, 12)
+    assert len(memo) == 7, memo
+
+
+def test_constant_division():
+    # quotient rounds toward zero, remainder has
+    # the sign of the dividend, as for variables
+    pairs = [
+        ('1 / 7', 0), ('-1 / 7', 0), ('-1 % 7', -1),
+        ('1 % -7', 1), ('-7 / 2', -3), ('-7 % 2', -1)]
+    for e, value in pairs:
+        mem = list()
+        res = parser.parse(e).flatten(t=t, mem=mem)
+        assert bv.twos_complement_to_int(res) == value, (e, res)
+
+
+def test_share_subtrees():
+    tree = parser.parse('(a + b) - (a + b) < (b + a)')
+    tree = bv.share_subtrees(tree)
+    p, q = tree.operands
+    x, y = p.operands
+    assert x is y
+    assert q is not x
+    # shared among trees
+    table = dict()
+    u = bv.share_subtrees(parser.parse('a + b'), table)
+    v = bv.share_subtrees(parser.parse('ite(q, a + b, b)'), table)
+    assert v.operands[1] is u
+    # subterms flattened once in a buffer
+    f = '(a + b) * 2 + (a + b) = 3'
+    r = bv.bitblast(f, t, share=False)
+    r_shared = bv.bitblast(f, t)
+    assert len(r_shared) < len(r), (r_shared, r)
+    mem = list()
+    tree = bv.share_subtrees(parser.parse('(a + b) + (a + b)'))
+    tree.flatten(t=t, mem=mem, cse=dict())
+    # 3-bit adder once, then 4-bit adder
+    assert len(mem) == 2 * (3 + 4), mem
+
+
 def test_flatten_quantifiers():
     # single qvar
     s = '\A a: True'
@@ -134,10 +204,11 @@ def test_flatten_quantifiers():
     h = parser.parse('x - a > 0').flatten(t=t)
     r_ = ' \E & & & a0 a1 x@0.0.3 x@1 {h}'.format(h=h)
     assert r == r_, (r, r_)
+    # quantifier pushed past disjunct without `r`
     s = '\A r: r | ! q'
     r = parser.parse(s).flatten(t=t)
-    h = parser.parse('r | ! q').flatten(t=t)
-    r_ = ' \A r {h}'.format(h=h)
+    h = parser.parse('! q').flatten(t=t)
+    r_ = '| {h}  \A r r'.format(h=h)
     assert r == r_, (r, r_)
 
 
@@ -674,6 +745,59 @@ def test_flatten_memory_nodes():
     assert f == 'reg[1]', f
 
 
+def test_offset_encoding():
+    assert bv.dom_to_width((100, 103), 'offset') == (False, 2)
+    assert bv.dom_to_width((-5, 2), 'offset') == (False, 3)
+    assert bv.dom_to_width((7, 7), 'offset') == (False, 1)
+    assert bv.dom_to_width((100, 103)) == (False, 7)
+    t = bv.make_symbol_table(dict(x=(100, 103, 'offset')))
+    assert t == dict(x=dict(
+        type='int', dom=(100, 103), encoding='offset')), t
+    t = bv.bitblast_table(t)
+    d = t['x']
+    assert d['bitnames'] == ['x_0', 'x_1'], d
+    for value in range(100, 104):
+        code = bv.encode_int(value, d)
+        assert 0 <= code < 4, code
+        assert bv.decode_int(code, d) == value
+    with nt.assert_raises(ValueError):
+        bv.encode_int(104, d)
+    bit_state = dict(x_0=1, x_1=1)
+    assert bv.bitfields_to_ints(bit_state, t) == dict(x=103)
+    bits = bv.decode_bits(['x_0', 'x_1', '0'], d)
+    assert len(bits) == 9, bits
+
+
+def test_gray_onehot_encoding():
+    assert bv.dom_to_width((0, 7), 'gray') == (False, 3)
+    assert bv.dom_to_width((2, 5), 'onehot') == (False, 4)
+    t = bv.bitblast_table(bv.make_symbol_table(
+        dict(x=(1, 8, 'gray'), y=(2, 5, 'onehot'))))
+    d = t['x']
+    codes = [bv.encode_int(v, d) for v in range(1, 9)]
+    assert codes == [0, 1, 3, 2, 6, 7, 5, 4], codes
+    for a, b in zip(codes, codes[1:]):
+        assert bin(a ^ b).count('1') == 1, (a, b)
+    for v, code in zip(range(1, 9), codes):
+        assert bv.decode_int(code, d) == v
+    d = t['y']
+    codes = [bv.encode_int(v, d) for v in range(2, 6)]
+    assert codes == [1, 2, 4, 8], codes
+    for v, code in zip(range(2, 6), codes):
+        assert bv.decode_int(code, d) == v
+    with nt.assert_raises(ValueError):
+        bv.encode_int(6, d)
+    s = bv.encoding_invariant('y', d)
+    assert s == (
+        r'((y_0 \/ y_1) \/ (y_2 \/ y_3)) /\ '
+        r'~ (y_0 /\ y_1) /\ ~ (y_2 /\ y_3) /\ '
+        r'~ ((y_0 \/ y_1) /\ (y_2 \/ y_3))'), s
+    assert bv.encoding_invariant('x', t['x']) is None
+    init, safety = bv.type_invariants(t)
+    assert s in init['y'], init
+    assert s in safety['y'], safety
+
+
 def test_make_table():
     d = dict(x=(0, 2), y='bool', w='bool', z=(-2, 5))
     env_vars = {'x', 'y'}
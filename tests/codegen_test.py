@@ -1,4 +1,8 @@
 #!/usr/bin/env python
+import os
+import shutil
+import tempfile
+
 from omega.symbolic import codegen as dump
 from omega.symbolic import fol as _fol
 from omega.symbolic import functions as fcn
@@ -25,10 +29,18 @@ def test_code_generation():
     u = aut.to_bdd(" y' = (x - y) ")
     out_vars = ["y'"]
     code = dump.dumps_bdds_as_code(u, out_vars, aut)
-    file_name = 'generated_foo.py'
-    with open(file_name, 'w') as f:
-        f.write(code)
-    from generated_foo import step  # load generated code
+    tmpdir = tempfile.mkdtemp()
+    try:
+        file_name = os.path.join(tmpdir, 'generated_foo.py')
+        with open(file_name, 'w') as f:
+            f.write(code)
+        # load generated code
+        state = dict()
+        with open(file_name) as f:
+            exec(f.read(), state)
+        step = state['step']
+    finally:
+        shutil.rmtree(tmpdir)
     state = dict(x=3, y=3)
     out_vars = step(state)
     out_vars_ = {"y'": 0}
@@ -47,6 +59,20 @@ def test_code_generation():
     assert out_vars == out_vars_, out_vars
 
 
+def test_code_generation_encodings():
+    aut = trl.Automaton()
+    aut.declare_variables(
+        x=(3, 9, 'gray'), y=(4, 7, 'onehot'), z=(100, 103, 'offset'))
+    u = aut.to_bdd(r"(y' = x - 2) /\ (z' = 94 + x)")
+    code = dump.dumps_bdds_as_code(u, ["y'", "z'"], aut)
+    state = dict()
+    exec(code, state)
+    step = state['step']
+    for x in range(6, 10):
+        out = step(dict(x=x, y=4, z=100))
+        assert out == {"y'": x - 2, "z'": 94 + x}, (x, out)
+
+
 def test_dump_bdd_as_code():
     bdd = _fol._bdd.BDD()
     bdd.declare('x', 'y')
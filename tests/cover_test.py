@@ -1065,6 +1065,25 @@ def test_check_type_hint():
     tyh._check_type_hint(2, 5, hint, 'y')
 
 
+def test_bitfield_limits():
+    fol = _fol.Context()
+    fol.declare(
+        x=(-4, 5), y=(3, 9), z=(100, 103, 'offset'),
+        g=(1, 5, 'gray'), h=(1, 5, 'onehot'))
+    r = tyh._bitfield_limits(fol.vars['x'])
+    assert r == (-8, 7), r
+    r = tyh._bitfield_limits(fol.vars['y'])
+    assert r == (0, 15), r
+    # `z - 100` stored in 2 bits
+    r = tyh._bitfield_limits(fol.vars['z'])
+    assert r == (100, 103), r
+    r = tyh._bitfield_limits(fol.vars['g'])
+    assert r == (1, 8), r
+    # bitwise "or" of the indices of set bits
+    r = tyh._bitfield_limits(fol.vars['h'])
+    assert r == (1, 8), r
+
+
 def test_care_implies_type_hints():
     fol = _fol.Context()
     fol.declare(x=(-4, 5), y=(-7, 15))
@@ -40,6 +40,52 @@ def test_attractor():
         assert (v == aut.true) == value, v
 
 
+def test_frontier_attractor():
+    aut = symbolic.Automaton()
+    aut.declare_variables(x=(0, 7), y=(0, 7))
+    aut.varlist['env'] = ['x']
+    aut.varlist['sys'] = ['y']
+    aut.prime_varlists()
+    aut.action['env'] = "(x' = x + 1) \\/ (x' = 0)"
+    aut.action['sys'] = "(y' = y + 1) \\/ (y' = y - 1) \\/ (y' = x)"
+    env_action = aut.action['env']
+    sys_action = aut.action['sys']
+    target = aut.add_expr('y = 7')
+    inside = aut.add_expr('y > 0')
+    for moore in (True, False):
+        for plus_one in (True, False):
+            aut.moore = moore
+            aut.plus_one = plus_one
+            for simplify in (False, True):
+                for c in (None, inside):
+                    u = fx.attractor(
+                        env_action, sys_action, target, aut,
+                        inside=c)
+                    sizes = list()
+                    v = fx.frontier_attractor(
+                        env_action, sys_action, target, aut,
+                        inside=c, simplify=simplify, sizes=sizes)
+                    assert u == v, (moore, plus_one, simplify, c)
+                    assert sizes, sizes
+
+
+def test_frontier_descendants():
+    g = TransitionSystem()
+    nx.add_path(g, [0, 1, 2, 3, 4, 5])
+    g.add_edge(5, 2)
+    aut = logicizer.graph_to_logic(g, 'pc', True)
+    source = aut.add_expr('pc = 0')
+    for constrain in (aut.true, aut.add_expr('pc /= 4')):
+        for future in (True, False):
+            u = fx.descendants(source, constrain, aut, future)
+            sizes = list()
+            v = fx.frontier_descendants(
+                source, constrain, aut, future,
+                simplify=True, sizes=sizes)
+            assert u == v, (constrain, future)
+            assert len(sizes) > 1, sizes
+
+
 def test_descendants():
     g = TransitionSystem()
     nx.add_path(g, [0, 1, 2])
@@ -1,9 +1,15 @@
 #!/usr/bin/env python
 """Test `omega.symbolic.fol`."""
+import copy
+import gc
 import logging
+import os
+import pickle
 import pprint
+import sys
 
 from nose import tools as nt
+from omega.logic import bitvector as bv
 from omega.symbolic import fol as _fol
 
 
@@ -192,6 +198,28 @@ def test_quantifiers():
     assert u == bdd.false
 
 
+def test_and_exist_or_forall():
+    from dd import autoref
+    fol = _fol.Context()
+    other = _fol.Context()
+    other.bdd = autoref.BDD()  # without fused operations
+    for c in (fol, other):
+        c.declare(x=(0, 5), y=(0, 3), z='bool')
+        u = c.add_expr('x + y < 4')
+        v = c.add_expr('z => (x = 2)')
+        for qvars in (['x'], ['x', 'z'], list()):
+            r = c.and_exist(qvars, u, v)
+            r_ = c.exist(qvars, u & v)
+            assert r == r_, qvars
+            r = c.or_forall(qvars, u, v)
+            r_ = c.forall(qvars, u | v)
+            assert r == r_, qvars
+        # `forall` as dual of `exist`
+        r = c.forall(['x'], u)
+        r_ = ~ c.exist(['x'], ~ u)
+        assert r == r_, (r, r_)
+
+
 def test_pick():
     fol = _fol.Context()
     fol.declare(x='bool', y=(0, 2))
@@ -275,6 +303,359 @@ def test_add_expr():
     assert u == v, (u, v)
 
 
+def test_add_expr_bdd_compiler():
+    fol = _fol.Context()
+    fol.declare(
+        x=(-4, 7), y=(0, 5), z=(-3, -1), w=(-4, 7),
+        a='bool', b='bool')
+    fol.declare(**{"x'": (-4, 7), "y'": (0, 5), "a'": 'bool'})
+    fol.define('p == x + y > 2')
+    exprs = [
+        'x + y < 3', 'x * y = -2', "x' / 3 = y", 'x % 3 = 1',
+        "x - y >= z", r'x \in -2..5', 'ite(a, x, y) = 2',
+        'ite(a, b, ~ b)', r'\E x: x = y', r'\A x, a: (x > y) \/ a',
+        'LET q == x + 1 IN q < y', '(x <<>> 2) = 1',
+        'a <=> b', 'a => ~ b', 'x != y', "x' = x + 1 /\ a'",
+        r'x > 2 \/ y < 1 \/ b', "p /\ ~ a'", "p'", 'TRUE']
+    for e in exprs:
+        fol.compiler = 'slugsin'
+        u = fol.add_expr(e, with_ops=True)
+        fol.compiler = 'bdd'
+        v = fol.add_expr(e, with_ops=True)
+        assert u == v, e
+    # renaming
+    u = fol.add_expr(r'\S w / x: x = 1')
+    v = fol.add_expr('w = 1')
+    assert u == v, (u, v)
+    # definitions
+    fol.define('r == x + z <= 0')
+    u = fol.op_bdd['r']
+    fol.compiler = 'slugsin'
+    v = fol.add_expr('x + z <= 0')
+    assert u == v, (u, v)
+    # not a predicate
+    fol.compiler = 'bdd'
+    with nt.assert_raises(AssertionError):
+        fol.add_expr('x')
+
+
+def test_add_expr_narrowed_division():
+    # operands narrowed to different widths
+    pairs = [('(y % 2) / z', 0), ('(1 % 3) % z', 1)]
+    for compiler in ('slugsin', 'bdd'):
+        fol = _fol.Context()
+        fol.compiler = compiler
+        fol.declare(y=(-3, 4), z=(0, 5), w=(-8, 7))
+        for e, value in pairs:
+            u = fol.add_expr('z = 5 /\\ w = {e}'.format(e=e))
+            values = {d['w'] for d in fol.pick_iter(u)}
+            assert values == {value}, (compiler, e, values)
+
+
+def test_add_expr_quantifier_pushing():
+    fol = _fol.Context()
+    fol.declare(x=(0, 7), y=(0, 7), z=(0, 7), a='bool')
+    exprs = [
+        (r'\E x, z: x + y = 7 /\ z = y /\ a', ['x', 'z'],
+         r'x + y = 7 /\ z = y /\ a'),
+        (r'\A x: x < y \/ y = 2 \/ x = z', ['x'],
+         r'x < y \/ y = 2 \/ x = z'),
+        (r'\E x: (x < y /\ a) \/ (x > z /\ ~ a)', ['x'],
+         r'(x < y /\ a) \/ (x > z /\ ~ a)'),
+        (r'\A x, y: (x < y \/ a) /\ y != z', ['x', 'y'],
+         r'(x < y \/ a) /\ y != z')]
+    for compiler in ('slugsin', 'bdd'):
+        fol.compiler = compiler
+        for e, qvars, body in exprs:
+            u = fol.add_expr(e)
+            v = fol.add_expr(body)
+            if e.startswith(r'\A'):
+                v = fol.forall(qvars, v)
+            else:
+                v = fol.exist(qvars, v)
+            assert u == v, (compiler, e)
+    # schedule
+    supports = [{'a', 'b'}, {'c'}, {'b', 'd'}, None]
+    free, bound, schedule = bv._quantification_schedule(
+        'pqrs', supports, ['a', 'b', 'c'])
+    assert free == list(), free
+    assert bound == list('pqrs'), bound
+    assert schedule == [list(), list(), list(), ['a', 'b', 'c']], schedule
+    free, bound, schedule = bv._quantification_schedule(
+        'pqr', supports[:3], ['a', 'b'])
+    assert free == ['q'], free
+    assert bound == ['p', 'r'], bound
+    assert schedule == [['a'], ['b']], schedule
+
+
+def test_add_expr_with_ops():
+    fol = _fol.Context()
+    fol.declare(x=(0, 7), y=(0, 7), a='bool')
+    fol.declare(**{"x'": (0, 7), "y'": (0, 7), "a'": 'bool'})
+    fol.define(r'''
+        p == x + y > 2
+        q == p /\ ~ a
+        r == x' = x
+        ''')
+    for compiler in ('slugsin', 'bdd'):
+        fol.compiler = compiler
+        u = fol.add_expr(r'q \/ y = 1', with_ops=True)
+        v = fol.add_expr(r'(x + y > 2 /\ ~ a) \/ y = 1')
+        assert u == v, compiler
+        # primed operators
+        u = fol.add_expr("q'", with_ops=True)
+        v = fol.add_expr(r"x' + y' > 2 /\ ~ a'")
+        assert u == v, compiler
+        u = fol.add_expr(r'X p /\ r', with_ops=True)
+        v = fol.add_expr(r"x' + y' > 2 /\ x' = x")
+        assert u == v, compiler
+        with nt.assert_raises(ValueError):
+            fol.add_expr("r'", with_ops=True)
+        # operator BDDs are not copied
+        u = fol.add_expr('p', with_ops=True)
+        assert u == fol.op_bdd['p'], compiler
+    # primed operator BDDs referenced with `@` need a `dict`
+    with nt.assert_raises(ValueError):
+        bv.bitblast('X p', fol.vars, defs=fol.op_bdd)
+    # no dangling `@` references
+    fol.compiler = 'slugsin'
+    u = fol.add_expr(r'(X p) /\ a', with_ops=True)
+    unraisable = list()
+    hook = sys.unraisablehook
+    sys.unraisablehook = unraisable.append
+    try:
+        del fol, u, v
+        gc.collect()
+    finally:
+        sys.unraisablehook = hook
+    assert not unraisable, [x.exc_value for x in unraisable]
+
+
+def test_offset_encoding():
+    fol = _fol.Context()
+    fol.declare(
+        x=(100, 103, 'offset'), y=(-5, 2, 'offset'),
+        a=(100, 103), b=(-5, 2), c='bool')
+    assert fol.vars['x']['width'] == 2, fol.vars['x']
+    assert fol.vars['x']['signed'] is False, fol.vars['x']
+    assert fol.vars['x']['encoding'] == 'offset', fol.vars['x']
+    assert fol.vars['y']['width'] == 3, fol.vars['y']
+    assert fol.vars['a']['width'] == 7, fol.vars['a']
+    # same models as binary encoding
+    exprs = [
+        'x = 101', 'x + 1 = 103', 'x < 102', 'y <= -1',
+        'x + y > 100', 'x - y = 97', r'y \in -3..0',
+        'x % 3 = 1', 'ite(c, x, y) = 2', r'\E y: x + y = 100']
+    hints = r'(x \in 100..103) /\ (y \in -5..2)'
+    for e in exprs:
+        e = '({e}) /\\ {hints}'.format(e=e, hints=hints)
+        u = fol.add_expr(e)
+        v = fol.add_expr(e.replace('x', 'a').replace('y', 'b'))
+        models = {(d['x'], d['y'], d.get('c'))
+                  for d in fol.pick_iter(u, care_vars=['x', 'y'])}
+        models_ = {(d['a'], d['b'], d.get('c'))
+                   for d in fol.pick_iter(v, care_vars=['a', 'b'])}
+        assert models == models_, e
+        fol.compiler = 'slugsin'
+        w = fol.add_expr(e)
+        fol.compiler = 'bdd'
+        assert u == w, e
+    # assignments
+    u = fol.assign_from(dict(x=102, y=-5))
+    assert u == fol.add_expr(r'x = 102 /\ y = -5')
+    assert list(fol.pick_iter(u)) == [dict(x=102, y=-5)]
+    with nt.assert_raises(ValueError):
+        fol.assign_from(dict(x=99))
+    # type hint
+    u = fol.add_expr(r'x \in 100..103')
+    assert u == fol.true, u
+
+
+def test_to_expr_encodings():
+    for encoding in ('binary', 'offset', 'gray', 'onehot'):
+        fol = _fol.Context()
+        fol.declare(x=(3, 9, encoding), y=(0, 3))
+        exprs = [
+            r'x > 4 /\ y < 2', r'x = 5 \/ x = 8', 'x + y < 7']
+        for e in exprs:
+            u = fol.add_expr(e)
+            s = fol.to_expr(u)
+            assert fol.add_expr(s) == u, (encoding, e, s)
+
+
+def test_gray_onehot_encoding():
+    fol = _fol.Context()
+    fol.declare(
+        x=(0, 7, 'gray'), y=(2, 5, 'onehot'),
+        a=(0, 7), b=(2, 5))
+    assert fol.vars['x']['width'] == 3, fol.vars['x']
+    assert fol.vars['y']['width'] == 4, fol.vars['y']
+    # successive values differ in one bit
+    bits = None
+    for i in range(8):
+        u = fol.assign_from(dict(x=i))
+        assert list(fol.pick_iter(u)) == [dict(x=i)]
+        bits_ = fol.bdd.pick(u)
+        if bits is not None:
+            diff = [b for b in bits if bits[b] != bits_[b]]
+            assert len(diff) == 1, (i, bits, bits_)
+        bits = bits_
+    u = fol.assign_from(dict(y=3))
+    assert u == fol.add_expr(
+        r'~ y_0 /\ y_1 /\ ~ y_2 /\ ~ y_3'), u
+    assert list(fol.pick_iter(u)) == [dict(y=3)]
+    with nt.assert_raises(ValueError):
+        fol.assign_from(dict(y=6))
+    # same models as binary encoding
+    hints = r'(y \in 2..5) /\ {s}'.format(
+        s=bv.encoding_invariant('y', fol.vars['y']))
+    exprs = [
+        'x = 5', 'x + 1 = y', 'x < y', 'y >= 4',
+        'x - y = 1', r'y \in 3..4', 'x % 3 = 1',
+        r'\E x: x + y = 6']
+    for e in exprs:
+        e_ = r'({e}) /\ {hints}'.format(e=e, hints=hints)
+        u = fol.add_expr(e_)
+        v = fol.add_expr(r'({e}) /\ (b \in 2..5)'.format(
+            e=e.replace('x', 'a').replace('y', 'b')))
+        models = {(d.get('x'), d['y'])
+                  for d in fol.pick_iter(u, care_vars=['y'])}
+        models_ = {(d.get('a'), d['b'])
+                   for d in fol.pick_iter(v, care_vars=['b'])}
+        assert models == models_, e
+        fol.compiler = 'slugsin'
+        w = fol.add_expr(e_)
+        fol.compiler = 'bdd'
+        assert u == w, e
+
+
+def test_onehot_invariant():
+    fol = _fol.Context()
+    for n in (1, 2, 3, 8, 13):
+        var = 'x{n}'.format(n=n)
+        fol.declare(**{
+            var: (0, n - 1, 'onehot'),
+            "{var}'".format(var=var): (0, n - 1, 'onehot')})
+        d = fol.vars[var]
+        for prime in (False, True):
+            s = bv.encoding_invariant(var, d, prime=prime)
+            u = bv.encoding_invariant_bdd(var, d, fol.bdd, prime=prime)
+            assert fol.add_expr(s) == u, (n, s)
+            assert len(u) <= 2 * n, len(u)
+        u = bv.encoding_invariant_bdd(var, d, fol.bdd)
+        values = [d_[var] for d_ in fol.pick_iter(u)]
+        assert sorted(values) == list(range(n)), values
+    fol.declare(y=(0, 7))
+    assert bv.encoding_invariant_bdd('y', fol.vars['y'], fol.bdd) is None
+
+
+def test_linear_constraints():
+    fol = _fol.Context()
+    fol.declare(
+        x=(-4, 7), y=(0, 5), z=(-3, -1),
+        w=(100, 103, 'offset'), g=(0, 3, 'gray'), a='bool')
+    fol.declare(**{"x'": (-4, 7), "y'": (0, 5)})
+    exprs = [
+        'x + y < 3', '2 * x - 3 * y <= z + 5', "x' = x + 1",
+        "3 * x' + y' > -7", 'x - x = 0', 'w - 2 * y >= 95',
+        'x + y + z /= 4', '-2 * z = y', '5 = x', 'x * y = 2',
+        'g + x < 2', 'LET q == x + 1 IN q < y', '(x + 2) * 3 <= y',
+        'x % 3 = 1', r'a /\ (x + 1 = w - 100)']
+    for e in exprs:
+        u = bv.bitblast_to_bdd(e, fol.vars, fol.bdd)
+        v = bv.bitblast_to_bdd(e, fol.vars, fol.bdd, linear=False)
+        assert u == v, e
+    # recognized as linear
+    tree = bv._bdd_parser.parse("2 * x - 3 * (y' + 1)")
+    weights, c = bv._linear_form(tree, fol.vars, None)
+    assert c == -3, c
+    assert weights == {
+        'x_0': 2, 'x_1': 4, 'x_2': 8, 'x_3': -16,
+        "y_0'": -3, "y_1'": -6, "y_2'": -12}, weights
+    for e in ['x * y', 'x / 2', 'g + 1', 'ite(a, x, y)']:
+        tree = bv._bdd_parser.parse(e)
+        assert bv._linear_form(tree, fol.vars, None) is None, e
+
+
+def test_linear_constraints_interleaved():
+    fol = _fol.Context()
+    fol.declare(x=(-128, 127), y=(-128, 127), z=(-200, 200))
+    bits = zip(*[fol.vars[var]['bitnames'] for var in 'xyz'])
+    order = [b for level in bits for b in level]
+    fol.bdd.configure(reordering=False)
+    fol.bdd.reorder({b: i for i, b in enumerate(order)})
+    exprs = [
+        '3 * x + 5 * y - 7 * z <= 123', '3 * x + 5 * y - 7 * z < -45',
+        '3 * x + 5 * y = 7 * z', '11 * x - 13 * y /= z + 1',
+        '2 * x + 4 * y >= 3']
+    for e in exprs:
+        u = bv.bitblast_to_bdd(e, fol.vars, fol.bdd)
+        v = bv.bitblast_to_bdd(e, fol.vars, fol.bdd, linear=False)
+        assert u == v, e
+
+
+def test_expr_cache():
+    fol = _fol.Context()
+    fol.declare(x=(0, 10), y='bool')
+    for compiler in ('slugsin', 'bdd'):
+        fol.compiler = compiler
+        u = fol.add_expr('x < 3 /\\ y')
+        d = fol.cache_info()
+        v = fol.add_expr('x < 3 /\\ y')
+        assert u == v, (u, v)
+        d_ = fol.cache_info()
+        assert d_['hits'] == d['hits'] + 1, (d, d_)
+        assert d_['misses'] == d['misses'], (d, d_)
+    # invalidation
+    version = d_['version']
+    fol.declare(z=(0, 3))
+    d = fol.cache_info()
+    assert d['size'] == 0, d
+    assert d['version'] > version, d
+    fol.define('a == z = 1')
+    assert fol.cache_info()['version'] > d['version']
+    u = fol.add_expr('a', with_ops=True)
+    u_ = fol.add_expr('z = 1')
+    assert u == u_, (u, u_)
+    # assignment to `vars`, as in `transfer.loads_automaton`
+    fol.add_expr('z = 1')
+    version = fol.cache_info()['version']
+    fol.vars = dict(fol.vars)
+    d = fol.cache_info()
+    assert d['size'] == 0, d
+    assert d['version'] > version, d
+    # BDD nodes cached, and released by `close`
+    fol.compiler = 'bdd'
+    u = fol.add_expr('x < 3 /\\ y')
+    v = fol.add_expr('x < 3 /\\ y')
+    assert u is v, (u, v)
+    fol.close()
+    assert fol.cache_info()['size'] == 0, fol.cache_info()
+    # released before the BDD manager is freed
+    fol.add_expr('x < 3 /\\ y')
+    unraisable = list()
+    hook = sys.unraisablehook
+    sys.unraisablehook = unraisable.append
+    try:
+        del fol, u, u_, v
+        gc.collect()
+    finally:
+        sys.unraisablehook = hook
+    assert not unraisable, [x.exc_value for x in unraisable]
+    # eviction of least recently used
+    cache = _fol.ExprCache(2)
+    cache.add('a', 1)
+    cache.add('b', 2)
+    assert cache.get('a') == 1
+    cache.add('c', 3)
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert len(cache) == 2, len(cache)
+    d = cache.statistics()
+    assert d['hits'] == 2, d
+    assert d['misses'] == 1, d
+
+
 def test_to_expr():
     fol = _fol.Context()
     fol.bdd.configure(reordering=True)
@@ -331,5 +712,115 @@ def test_reorder():
     assert bit_1.startswith(var), bit_1
 
 
+
+def test_symbol_table():
+    fol = _fol.Context()
+    fol.declare(x=(0, 3), y='bool')
+    t = fol.vars
+    assert isinstance(t, _fol.SymbolTable), t
+    assert t.bit_to_var == dict(x_0='x', x_1='x', y='y'), t.bit_to_var
+    assert t.var_to_bits == dict(x=('x_0', 'x_1'), y=('y',))
+    assert t.bits_of(['x']) == {'x_0', 'x_1'}
+    assert t.bits_of([]) == set()
+    # records behave as `dict`
+    d = t['x']
+    assert isinstance(d, _fol.VarRecord), d
+    assert d['type'] == 'int', d
+    assert d.get('init') is None, d
+    assert 'dom' in d and 'init' not in d, d
+    assert dict(d) == dict(
+        type='int', dom=(0, 3), signed=False, width=2,
+        bitnames=['x_0', 'x_1']), dict(d)
+    d['owner'] = 'env'
+    assert d['owner'] == 'env', d
+    del d['owner']
+    assert 'owner' not in d, d
+    # copies and pickling keep the indexes
+    for u in (copy.deepcopy(t), pickle.loads(pickle.dumps(t)), t.copy()):
+        assert isinstance(u, _fol.SymbolTable), u
+        assert u == t, u
+        assert u.bit_to_var == t.bit_to_var, u.bit_to_var
+    # indexes are updated
+    del t['y']
+    assert 'y' not in t.bit_to_var, t.bit_to_var
+    t.pop('x')
+    assert not t.bit_to_var, t.bit_to_var
+    # setting a `dict`
+    fol.vars = dict(z=dict(type='bool'))
+    assert isinstance(fol.vars, _fol.SymbolTable), fol.vars
+    assert fol.vars.bit_to_var == dict(z='z'), fol.vars.bit_to_var
+
+
+def test_symbol_table_mutate_record():
+    t = _fol.SymbolTable()
+    t['x'] = dict(type='int', bitnames=['x_0', 'x_1'])
+    assert t.var_to_bits == dict(x=('x_0', 'x_1')), t.var_to_bits
+    # mutating a record after insertion updates the indexes
+    t['x']['bitnames'] = ['x_0', 'x_1', 'x_2']
+    assert t.var_to_bits == dict(x=('x_0', 'x_1', 'x_2')), t.var_to_bits
+    assert t.bit_to_var['x_2'] == 'x', t.bit_to_var
+    t['x']['type'] = 'bool'
+    assert t.var_to_bits == dict(x=('x',)), t.var_to_bits
+    assert t.bit_to_var == dict(x='x'), t.bit_to_var
+    t['x'].update(type='int', bitnames=['x_0'])
+    assert t.bit_to_var == dict(x_0='x'), t.bit_to_var
+    del t['x']['bitnames']
+    assert t.var_to_bits == dict(x=tuple()), t.var_to_bits
+    # a record removed from the table no longer updates it
+    d = t.pop('x')
+    d['bitnames'] = ['x_0']
+    assert not t.var_to_bits, t.var_to_bits
+    # a record inserted in two tables is copied
+    t['x'] = d
+    u = _fol.SymbolTable(t)
+    u['x']['bitnames'] = ['x_0', 'x_1']
+    assert t.var_to_bits == dict(x=('x_0',)), t.var_to_bits
+    assert u.var_to_bits == dict(x=('x_0', 'x_1')), u.var_to_bits
+
+
+def test_saved_order():
+    fname = 'test_orders.json'
+    if os.path.isfile(fname):
+        os.remove(fname)
+    fol = _fol.Context()
+    bdd = fol.bdd
+    fol.declare(x=(0, 3), y=(0, 3))
+    order = ['y_1', 'x_0', 'y_0', 'x_1']
+    _bdd_reorder(bdd, order)
+    key = fol.dump_order(fname)
+    assert key == _fol.order_key(['x_0', 'x_1', 'y_0', 'y_1'])
+    # other variables in the same file
+    other = _fol.Context()
+    other.declare(z='bool')
+    other.dump_order(fname)
+    orders = _fol.load_orders(fname)
+    assert len(orders) == 2, orders
+    assert orders[key] == order, orders
+    # applied when declaring
+    fol = _fol.Context()
+    fol.load_orders(fname)
+    fol.declare(x=(0, 3))
+    assert not fol._has_saved_order()
+    fol.declare(y=(0, 3))
+    assert fol._has_saved_order()
+    order_ = [fol.bdd.var_at_level(i) for i in range(4)]
+    assert order_ == order, order_
+    # `reorder` defers to the saved order
+    _fol.reorder(dict(x=dict(level=0)), fol)
+    order_ = [fol.bdd.var_at_level(i) for i in range(4)]
+    assert order_ == order, order_
+    # applied when loading
+    fol = _fol.Context()
+    fol.declare(x=(0, 3), y=(0, 3))
+    fol.load_orders(fname)
+    order_ = [fol.bdd.var_at_level(i) for i in range(4)]
+    assert order_ == order, order_
+    os.remove(fname)
+
+
+def _bdd_reorder(bdd, order):
+    dorder = {var: i for i, var in enumerate(order)}
+    _fol._bdd.reorder(bdd, dorder)
+
 if __name__ == '__main__':
     test_quantifiers()
@@ -57,6 +57,188 @@ def test_enumerate_state_machine():
     assert len(e) == 2, len(e)
 
 
+def test_bfs_same_graph():
+    aut = _counter_automaton()
+    keys = ('x', 'y')
+    graphs = [
+        enum.action_to_steps(
+            aut, env='env', sys='sys', bfs=bfs)
+        for bfs in (False, True)]
+    g, h = map(_states_and_steps, graphs, [keys, keys])
+    assert g == h, (g, h)
+    states, steps = g
+    assert len(states) == 18, states
+    assert len(steps) == 54, steps
+    # state machine
+    init = aut.add_expr('x = 0 /\\ y = 0')
+    action = aut.add_expr('''
+        /\\ x' = (IF x = 2 THEN 0 ELSE x + 1)
+        /\\ ((y' = y) \\/ (y' = 5 - y))
+        /\\ y' \\in 0..5
+        ''')
+    graphs = [
+        enum.enumerate_state_machine(init, action, aut, bfs=bfs)
+        for bfs in (False, True)]
+    g, h = map(_states_and_steps, graphs, [keys, keys])
+    assert g == h, (g, h)
+    states, steps = g
+    assert len(states) == 6, states
+
+
+def test_action_to_steps_workers():
+    aut = _counter_automaton()
+    aut.init['env'] = aut.add_expr('x \\in 0..2')
+    aut.init['sys'] = aut.add_expr('y \\in 0..1')
+    keys = ('x', 'y')
+    g = enum.action_to_steps(aut, env='env', sys='sys')
+    assert len(g.initial_nodes) == 6, g.initial_nodes
+    for bfs in (False, True):
+        h = enum.action_to_steps(
+            aut, env='env', sys='sys', bfs=bfs, workers=2)
+        r = _states_and_steps(h, keys)
+        r_ = _states_and_steps(g, keys)
+        assert r == r_, (r, r_)
+        init = {enum._node_tuple(h.nodes[u], keys)
+                for u in h.initial_nodes}
+        init_ = {enum._node_tuple(g.nodes[u], keys)
+                 for u in g.initial_nodes}
+        assert init == init_, (init, init_)
+
+
+def test_action_to_steps_workers_no_init():
+    aut = _counter_automaton()
+    aut.init['sys'] = aut.false
+    g = enum.action_to_steps(aut, env='env', sys='sys', workers=2)
+    assert len(g) == 0, g.nodes
+    assert g.initial_nodes == set(), g.initial_nodes
+
+
+def test_merge_partial_graphs():
+    keys = ('x', 'y')
+    # two processes respond differently to `x' = 1`
+    results = [
+        (keys, [(0, 0), (1, 0)], [(0, 1)], [0]),
+        (keys, [(0, 0), (1, 1), (0, 1)], [(0, 1), (1, 2)], [0])]
+    g = nx.DiGraph()
+    g.initial_nodes = set()
+    enum._merge_partial_graphs(results, keys, ['x'], g)
+    assert g.initial_nodes == {0}, g.initial_nodes
+    assert set(g.edges()) == {(0, 1)}, g.edges()
+    assert g.nodes[0] == dict(x=0, y=0), g.nodes[0]
+    assert g.nodes[1] == dict(x=1, y=0), g.nodes[1]
+    # distinct env moves are kept
+    results.append((keys, [(0, 0), (2, 1)], [(0, 1)], [0]))
+    g = nx.DiGraph()
+    g.initial_nodes = set()
+    enum._merge_partial_graphs(results, keys, ['x'], g)
+    assert len(g) == 3, g.nodes
+    assert set(g.edges()) == {(0, 1), (0, 2)}, g.edges()
+    assert g.nodes[2] == dict(x=2, y=1), g.nodes[2]
+
+
+def test_iter_action_steps():
+    aut = _counter_automaton()
+    keys = ('x', 'y')
+    for bfs in (False, True):
+        g = enum.action_to_steps(
+            aut, env='env', sys='sys', bfs=bfs)
+        steps = list(enum.iter_action_steps(
+            aut, env='env', sys='sys', bfs=bfs))
+        init = [s for s in steps if s[0] is None]
+        assert len(init) == 1, init
+        _, v, _, d = init[0]
+        assert d == dict(x=0, y=0), d
+        assert g.initial_nodes == {v}, g.initial_nodes
+        edges = {(u, v) for u, v, _, _ in steps if u is not None}
+        assert len(edges) == len(steps) - 1, steps
+        assert edges == set(g.edges()), edges
+        for u, v, du, dv in steps:
+            assert dv == g.nodes[v], (dv, g.nodes[v])
+            if u is not None:
+                assert du == g.nodes[u], (du, g.nodes[u])
+    # state machine
+    init = aut.add_expr('x = 0 /\\ y = 0')
+    action = aut.add_expr("x' = x /\\ y' = 5 - y")
+    steps = list(enum.iter_state_machine_steps(init, action, aut))
+    steps_ = [
+        (None, 0, None, dict(x=0, y=0)),
+        (0, 1, dict(x=0, y=0), dict(x=0, y=5)),
+        (1, 0, dict(x=0, y=5), dict(x=0, y=0))]
+    assert steps == steps_, steps
+
+
+def test_compact_graph():
+    aut = _counter_automaton()
+    keys = ('x', 'y')
+    g = enum.action_to_steps(aut, env='env', sys='sys')
+    g.inputs = ['x']
+    g.outputs = ['y']
+    h = enum.networkx_to_compact(g)
+    assert len(h) == len(g), (len(h), len(g))
+    assert h.number_of_edges() == g.number_of_edges()
+    assert h.keys == ['x', 'y'], h.keys
+    assert h.inputs == ['x'], h.inputs
+    assert h.outputs == ['y'], h.outputs
+    assert set(h.columns) == {'x', 'y'}, h.columns
+    assert len(h.offsets) == len(g) + 1, h.offsets
+    # nodes of `g` are already `0, ..., n - 1`
+    assert set(g) == set(h), (set(g), set(h))
+    assert h.initial_nodes == g.initial_nodes, h.initial_nodes
+    for u in g:
+        assert h.nodes[u] == g.nodes[u], (h.nodes[u], g.nodes[u])
+        r = set(h.successors(u))
+        r_ = set(g.successors(u))
+        assert r == r_, (r, r_)
+    # round trip
+    k = enum.compact_to_networkx(h)
+    assert set(k.edges()) == set(g.edges())
+    assert dict(k.nodes(data=True)) == dict(g.nodes(data=True))
+    assert k.initial_nodes == g.initial_nodes
+    assert k.outputs == ['y'], k.outputs
+    # from streamed steps
+    steps = enum.iter_action_steps(aut, env='env', sys='sys')
+    h = enum.steps_to_compact(steps, keys)
+    r = _states_and_steps(h, keys)
+    r_ = _states_and_steps(g, keys)
+    assert r == r_, (r, r_)
+    # Boolean variables
+    aut = symbolic.Automaton()
+    aut.declare_variables(x='bool')
+    init = aut.add_expr('x')
+    action = aut.add_expr("x' <=> ~ x")
+    g = enum.enumerate_state_machine(init, action, aut)
+    h = enum.networkx_to_compact(g)
+    assert h.columns['x'].typecode == 'b', h.columns['x']
+    values = {h.nodes[u]['x'] for u in h}
+    assert values == {False, True}, values
+    for u in h:
+        assert isinstance(h.nodes[u]['x'], bool), h.nodes[u]
+
+
+def _counter_automaton():
+    aut = symbolic.Automaton()
+    aut.declare_variables(x=(0, 2), y=(0, 5))
+    aut.varlist['env'] = ['x']
+    aut.varlist['sys'] = ['y']
+    aut.init['env'] = aut.add_expr('x = 0')
+    aut.init['sys'] = aut.add_expr('y = 0')
+    aut.action['env'] = aut.add_expr("x' \\in 0..2")
+    aut.action['sys'] = aut.add_expr(
+        "(y < 5 /\\ y' = y + 1) \\/ (y = 5 /\\ y' = 0)")
+    aut.moore = True
+    aut.prime_varlists()
+    return aut
+
+
+def _states_and_steps(g, keys):
+    """Return states and steps of `g`, without node numbers."""
+    def state(u):
+        return enum._node_tuple(g.nodes[u], keys)
+    states = {state(u) for u in g}
+    steps = {(state(u), state(v)) for u, v in g.edges()}
+    return states, steps
+
+
 def test__primed_vars_per_quantifier():
     varlist = dict(env=['x'], sys=['y', 'z'])
     primed_vars = enum._primed_vars_per_quantifier(varlist)
@@ -76,7 +258,7 @@ def test_init_search():
     umap = dict()
     keys = ['x']
     qinit = '\A \E'
-    queue, visited = enum._init_search(
+    queue = enum._init_search(
         g, aut, umap, keys, qinit)
     assert len(queue) == 1, queue
 
@@ -95,7 +277,7 @@ def test_forall_init():
     fol = _init_context(aut)
     umap = dict()
     keys = ('x', 'z', 'y')
-    queue, visited = enum._forall_init(
+    queue = enum._forall_init(
         g, aut, umap, keys)
     assert len(queue) == 1, queue
     (q,) = queue
@@ -111,7 +293,7 @@ def test_forall_init():
     aut.build()
     g = nx.DiGraph()
     umap = dict()
-    queue, visited = enum._forall_init(
+    queue = enum._forall_init(
         g, aut, umap, keys)
     assert len(queue) == 4, queue
     varnames = {'x', 'y', 'z'}
@@ -136,7 +318,7 @@ def test_exist_init():
     fol = _init_context(aut)
     umap = dict()
     keys = ('y', 'x', 'z')
-    queue, visited = enum._exist_init(
+    queue = enum._exist_init(
         g, aut, umap, keys)
     assert len(queue) == 1, queue
     (q,) = queue
@@ -150,7 +332,7 @@ def test_exist_init():
     a = aut.build()
     g = nx.DiGraph()
     umap = dict()
-    queue, visited = enum._exist_init(
+    queue = enum._exist_init(
         g, aut, umap, keys)
     assert len(queue) == 1, queue
     (q,) = queue
@@ -175,7 +357,7 @@ def test_forall_exist_init():
     fol = _init_context(aut)
     umap = dict()
     keys = ('x', 'y')
-    queue, visited = enum._forall_exist_init(
+    queue = enum._forall_exist_init(
         g, aut, umap, keys)
     assert len(queue) == 1, queue
     (q,) = queue
@@ -189,7 +371,7 @@ def test_forall_exist_init():
     aut.build()
     g = nx.DiGraph()
     umap = dict()
-    queue, visited = enum._forall_exist_init(
+    queue = enum._forall_exist_init(
         g, aut, umap, keys)
     assert len(queue) == 2, queue
     q0, q1 = queue
@@ -221,7 +403,7 @@ def test_exist_forall_init():
     fol = _init_context(aut)
     umap = dict()
     keys = ('x', 'y')
-    queue, visited = enum._exist_forall_init(
+    queue = enum._exist_forall_init(
         g, aut, umap, keys)
     assert len(queue) == 1, queue
     (q,) = queue
@@ -235,7 +417,7 @@ def test_exist_forall_init():
     a = aut.build()
     g = nx.DiGraph()
     umap = dict()
-    queue, visited = enum._exist_forall_init(
+    queue = enum._exist_forall_init(
         g, aut, umap, keys)
     assert len(queue) == 2, queue
     q0, q1 = queue
@@ -283,15 +465,37 @@ def test_add_new_node():
 
 
 def test_add_to_visited():
+    visited = dict()
+    env_keys = ('x',)
+    sys_keys = ('y', 'z')
+    d = dict(x=True, y=5, z=False)
+    enum._add_to_visited(d, 3, visited, env_keys, sys_keys)
+    visited_ = {(True,): {(5, False): 3}}
+    assert visited == visited_, visited
+    d = dict(x=True, y=6, z=False)
+    enum._add_to_visited(d, 4, visited, env_keys, sys_keys)
+    visited_ = {(True,): {(5, False): 3, (6, False): 4}}
+    assert visited == visited_, visited
+
+
+def test_find_visited_node():
     c = _fol.Context()
-    c.declare(x='bool', y=(0, 10))
-    bdd = c.bdd
-    values = dict(x=True, y=5)
-    visited = bdd.false
-    new_visited = enum._add_to_visited(values, visited, c)
-    s = 'x /\ (y = 5)'
-    u = c.add_expr(s)
-    assert new_visited == u
+    c.declare(y=(0, 10), z='bool')
+    sys_keys = ('y', 'z')
+    nodes = {(5, False): 3, (6, False): 4}
+    # fewer assignments than visited nodes
+    u = c.add_expr('(y = 6) /\\ ~ z')
+    node = enum._find_visited_node(u, nodes, sys_keys, c)
+    assert node == 4, node
+    # more assignments than visited nodes
+    u = c.add_expr('y > 5')
+    node = enum._find_visited_node(u, nodes, sys_keys, c)
+    assert node == 4, node
+    u = c.add_expr('y < 5')
+    node = enum._find_visited_node(u, nodes, sys_keys, c)
+    assert node is None, node
+    node = enum._find_visited_node(u, dict(), sys_keys, c)
+    assert node is None, node
 
 
 def test_node_tuple():
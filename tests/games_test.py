@@ -467,6 +467,118 @@ def test_streett_2_goals():
     assert action == action_, aut.bdd.to_expr(action)
 
 
+def test_streett_warm():
+    aut = trl.default_streett_automaton()
+    aut.declare_variables(x=(0, 3), y=(0, 7), b='bool')
+    aut.varlist = dict(env=['x', 'b'], sys=['y'])
+    aut.action['env'] = aut.add_expr(
+        "(x' = x + 1) \\/ (x' = 0) \\/ (x' = x)")
+    aut.action['sys'] = aut.add_expr(
+        "((y' = y + 1) \\/ (y' = y - 1) \\/ (b /\\ (y' = x))) "
+        "/\\ (y' /= 5)")
+    aut.win['<>[]'] = aut.bdds_from('~ b', 'x < 3')
+    aut.win['[]<>'] = aut.bdds_from('y = 7', 'y = 0', 'y = 4')
+    cold = dict()
+    z, yij, xijk = gr1.solve_streett_game(aut, stats=cold)
+    warm = dict()
+    z_, yij_, xijk_ = gr1.solve_streett_game(
+        aut, warm=True, stats=warm)
+    assert z == z_, (z, z_)
+    assert yij == yij_
+    assert xijk == xijk_
+    assert cold['saved'] == 0, cold
+    assert cold['warm_starts'] == 0, cold
+    assert warm['warm_starts'] > 0, warm
+    assert warm['saved'] > 0, warm
+    assert warm['steps'] < cold['steps'], (warm, cold)
+
+
+def test_streett_store():
+    actions = list()
+    for store in gr1.STORE:
+        aut = _store_game(trl.default_streett_automaton())
+        stats = dict()
+        z, yij, xijk = gr1.solve_streett_game(
+            aut, stats=stats, store=store)
+        assert stats['retained_nodes'] > 0, stats
+        assert 'peak_nodes' in stats, stats
+        if store == 'lazy':
+            assert yij is None, yij
+            assert xijk is None, xijk
+        gr1.make_streett_transducer(z, yij, xijk, aut, store=store)
+        assert action_refined(aut)
+        actions.append((aut, stats))
+    (a, all_), (b, rings), (c, lazy) = actions
+    assert lazy['retained_nodes'] < all_['retained_nodes'], (
+        lazy, all_)
+    assert lazy['retained_nodes'] < rings['retained_nodes'], (
+        lazy, rings)
+    u = a.action['impl']
+    v = gr1._copy_bdd(b.action['impl'], b.bdd, a.bdd)
+    w = gr1._copy_bdd(c.action['impl'], c.bdd, a.bdd)
+    assert u == w
+    # rings allow more moves to lower basins
+    assert a.apply('=>', u, v) == a.true
+    init = gr1._copy_bdd(b.init['impl'], b.bdd, a.bdd)
+    assert init == a.init['impl']
+
+
+def test_streett_workers():
+    aut = _store_game(trl.default_streett_automaton())
+    aut.action['sys'] = [
+        "(y' = y + 1) \\/ (y' = y - 1) \\/ (b /\\ (y' = x))",
+        "y' /= 6 \\/ b"]
+    serial = dict()
+    z, yij, xijk = gr1.solve_streett_game(aut, stats=serial)
+    parallel = dict()
+    z_, yij_, xijk_ = gr1.solve_streett_game(
+        aut, stats=parallel, workers=2)
+    assert z == z_, (z, z_)
+    assert yij == yij_
+    assert xijk == xijk_
+    assert serial['steps'] == parallel['steps'], (serial, parallel)
+
+
+def test_rabin_store():
+    actions = list()
+    for store in gr1.STORE:
+        aut = _store_game(trl.default_rabin_automaton())
+        aut.win['[]<>'] = aut.bdds_from(
+            'y = 0 \\/ y = 7', 'y = 2 \\/ y = 5')
+        aut.win['<>[]'] = aut.bdds_from('y > 3', 'y < 4')
+        stats = dict()
+        zk, yki, xkijr = gr1.solve_rabin_game(
+            aut, stats=stats, store=store)
+        assert zk[-1] != aut.false
+        if store == 'lazy':
+            assert yki is None, yki
+            assert xkijr is None, xkijr
+        gr1.make_rabin_transducer(zk, yki, xkijr, aut, store=store)
+        assert action_refined(aut)
+        actions.append((aut, stats))
+    (a, all_), (b, rings), (c, lazy) = actions
+    assert lazy['retained_nodes'] < all_['retained_nodes'], (
+        lazy, all_)
+    assert lazy['retained_nodes'] < rings['retained_nodes'], (
+        lazy, rings)
+    u = a.action['impl']
+    for other, _ in actions[1:]:
+        v = gr1._copy_bdd(other.action['impl'], other.bdd, a.bdd)
+        assert u == v
+
+
+def _store_game(aut):
+    aut.declare_variables(x=(0, 3), y=(0, 7), b='bool')
+    aut.varlist = dict(env=['x', 'b'], sys=['y'])
+    aut.action['env'] = aut.add_expr(
+        "(x' = x + 1) \\/ (x' = 0) \\/ (x' = x)")
+    aut.action['sys'] = aut.add_expr(
+        "(y' = y + 1) \\/ (y' = y - 1) \\/ (b /\\ (y' = x))")
+    aut.win['<>[]'] = aut.bdds_from('~ b', 'x < 3')
+    aut.win['[]<>'] = aut.bdds_from('y = 7', 'y = 0', 'y = 4')
+    return aut
+
+
 def test_rabin_goal():
     aut = trl.default_rabin_automaton()
     aut.declare_variables(x='bool')
@@ -570,6 +682,32 @@ def test_is_realizable():
     assert not gr1.is_realizable(z, aut)
 
 
+def test_check_realizable():
+    # realizable
+    aut = trl.default_streett_automaton()
+    aut.declare_variables(x='bool', y=(0, 2))
+    aut.varlist = dict(env=['x'], sys=['y'])
+    aut.init['sys'] = aut.add_expr('y = 0')
+    aut.action['sys'] = aut.add_expr(
+        """
+        /\\ ( ((y = 0) /\\ ~ x) => (y' = 0) )
+        /\\ ((y = 0) => (y' < 2))
+        /\\ ((y = 1) => (y' = 0))
+        /\\ ((y = 2) => FALSE)
+        /\\ y \\in 0..2
+        """)
+    aut.win['<>[]'] = [aut.add_expr(' ~ x')]
+    aut.win['[]<>'] = [aut.add_expr('y = 1')]
+    assert gr1.check_realizable(aut)
+    z, _, _ = gr1.solve_streett_game(aut)
+    assert gr1.is_realizable(z, aut)
+    # unrealizable initial condition
+    aut.init['sys'] = aut.add_expr('y = 2')
+    assert not gr1.check_realizable(aut)
+    z, _, _ = gr1.solve_streett_game(aut)
+    assert not gr1.is_realizable(z, aut)
+
+
 def test_make_init():
     aut = trl.default_streett_automaton()
     aut.declare_variables(x='bool')
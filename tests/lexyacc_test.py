@@ -128,6 +128,18 @@ def test_multiline_tla_comment():
     assert r == r_, r
 
 
+def test_lazy_parser():
+    p = lexyacc.LazyParser()
+    assert p._parser is None, p._parser
+    t = p.parse('x + 1 < y')
+    assert t.type == 'operator', t.type
+    assert t.operator == '<', t.operator
+    q = p.parser
+    assert isinstance(q, lexyacc.Parser), q
+    p.parse('y')
+    assert p.parser is q
+
+
 def _assert_is_var_node(x, var):
     assert hasattr(x, 'type'), x
     assert x.type == 'var', x.type
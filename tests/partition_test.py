@@ -0,0 +1,128 @@
+"""Test `omega.symbolic.partition`."""
+import logging
+
+import networkx as nx
+from omega.games import enumeration as enum
+from omega.symbolic import fixpoint as fx
+from omega.symbolic import partition as prt
+from omega.symbolic import temporal as trl
+
+
+logging.getLogger('omega').setLevel(logging.WARNING)
+
+
+def test_partition():
+    aut = trl.Automaton()
+    aut.declare_variables(x=(0, 3), y=(0, 3), z='bool')
+    conjuncts = ["x' = y", "y' = x + 1", "z' <=> ~ z", 'TRUE']
+    p = prt.Partition(conjuncts, aut, threshold=1)
+    assert len(p) == 3, len(p)
+    u = aut.add_expr(_conj(conjuncts))
+    assert p.conjunction() == u
+    # one cluster
+    q = prt.Partition(conjuncts, aut)
+    assert len(q) == 1, len(q)
+    assert prt.conjoin(q) == u
+    assert prt.conjoin(u) == u
+    # unsatisfiable
+    q = prt.Partition(['x = 1', 'FALSE'], aut)
+    assert q.clusters == [aut.false], q.clusters
+    # quantification
+    target = aut.add_expr("(x' < 2) /\\ z")
+    for qvars in (["x'"], ["x'", "y'"], ["x'", "y'", "z'"], ['z']):
+        r = p.and_exist(qvars, target)
+        r_ = aut.exist(qvars, u & target)
+        assert r == r_, qvars
+        r = p.implies_forall(qvars, target)
+        r_ = aut.forall(qvars, ~ u | target)
+        assert r == r_, qvars
+        r = p.forall(qvars).conjunction()
+        r_ = aut.forall(qvars, u)
+        assert r == r_, qvars
+    # schedules are memoized
+    s = p.schedule(["x'"])
+    assert s is p.schedule(["x'"])
+
+
+def test_schedule():
+    aut = trl.Automaton()
+    aut.declare_variables(x=(0, 3), y=(0, 3), z='bool')
+    conjuncts = ["x' = y", "y' = x + 1", "z' <=> ~ z"]
+    p = prt.Partition(conjuncts, aut, threshold=1)
+    early, steps = p.schedule(["x'", "y'", 'w'])
+    assert early == {'w'}, early
+    assert len(steps) == 3, steps
+    quantified = set()
+    for u, qvars in steps:
+        quantified.update(qvars)
+    assert quantified == {"x'", "y'"}, quantified
+
+
+def test_step():
+    aut = trl.Automaton()
+    aut.declare_variables(x=(0, 3), y=(0, 3), z='bool')
+    aut.varlist['env'] = ['x']
+    aut.varlist['sys'] = ['y', 'z']
+    aut.prime_varlists()
+    env = ["x' = x + 1 \\/ x' = 0", "x' /= 3"]
+    sys = ["y' = x", "z' <=> (x' = 1)", "y' /= 2"]
+    env_action = aut.add_expr(_conj(env))
+    sys_action = aut.add_expr(_conj(sys))
+    env_p = prt.Partition(env, aut, threshold=1)
+    sys_p = prt.Partition(sys, aut, threshold=1)
+    target = aut.add_expr('y = 1 \\/ z')
+    for moore in (True, False):
+        for plus_one in (True, False):
+            aut.moore = moore
+            aut.plus_one = plus_one
+            u = fx.step(env_action, sys_action, target, aut)
+            v = fx.step(env_p, sys_p, target, aut)
+            assert u == v, (moore, plus_one)
+            u = fx.attractor(env_action, sys_action, target, aut)
+            v = fx.attractor(env_p, sys_p, target, aut)
+            assert u == v, (moore, plus_one)
+            u = fx.trap(env_action, sys_action, target, aut)
+            v = fx.trap(env_p, sys_p, target, aut)
+            assert u == v, (moore, plus_one)
+    # `ExprDict` stores lists as partitions
+    source = aut.add_expr('x = 0 /\\ y = 0')
+    aut.action['sys'] = sys_action
+    u = fx.ee_image(source, aut)
+    aut.action['sys'] = sys
+    assert isinstance(aut.action['sys'], prt.Partition)
+    v = fx.ee_image(source, aut)
+    assert u == v, (u, v)
+
+
+def test_conjoined_uses():
+    aut = trl.Automaton()
+    aut.declare_variables(x=(0, 3), y=(0, 3))
+    aut.varlist['env'] = ['x']
+    aut.varlist['sys'] = ['y']
+    aut.moore = True
+    aut.prime_varlists()
+    env = ["x' = x + 1 \\/ x' = 0", "x' /= 3"]
+    sys = ["y' = x \\/ y' = 3", "y' /= 3"]
+    aut.init['env'] = aut.add_expr('x = 0')
+    aut.init['sys'] = aut.add_expr('y = 0')
+    aut.action['env'] = aut.add_expr(_conj(env))
+    aut.action['sys'] = aut.add_expr(_conj(sys))
+    u = trl.conj_actions_of(['env', 'sys'], aut)
+    g = enum.action_to_steps(aut, 'env', 'sys')
+    h = enum.enumerate_state_machine(aut.init['env'], u, aut)
+    aut.action['env'] = env
+    aut.action['sys'] = sys
+    assert isinstance(aut.action['sys'], prt.Partition)
+    v = trl.conj_actions_of(['env', 'sys'], aut)
+    assert u == v, (u, v)
+    for bfs in (False, True):
+        g_ = enum.action_to_steps(aut, 'env', 'sys', bfs=bfs)
+        assert nx.is_isomorphic(g, g_), bfs
+        p = prt.Partition(env + sys, aut, threshold=1)
+        h_ = enum.enumerate_state_machine(
+            aut.init['env'], p, aut, bfs=bfs)
+        assert nx.is_isomorphic(h, h_), bfs
+
+
+def _conj(conjuncts):
+    return ' /\\ '.join('({e})'.format(e=e) for e in conjuncts)
@@ -0,0 +1,84 @@
+"""Test `omega.games.portfolio`."""
+import logging
+
+from nose.tools import assert_raises
+
+from omega.games import gr1
+from omega.games import portfolio
+from omega.symbolic import temporal as trl
+from omega.symbolic import transfer
+
+
+logging.getLogger('omega').setLevel(logging.ERROR)
+
+
+def test_solve():
+    aut = _game(trl.default_streett_automaton())
+    z, yij, xijk = gr1.solve_streett_game(aut)
+    configs = [
+        dict(order='natural', reordering=True),
+        dict(order='random', seed=2, reordering=False)]
+    result, winner = portfolio.solve(aut, configs=configs)
+    z_, yij_, xijk_ = result
+    assert z == z_, (z, z_)
+    assert yij == yij_
+    assert xijk == xijk_
+    assert winner['config'] is configs[winner['index']], winner
+    assert sorted(winner['order']) == sorted(aut.bdd.vars), winner
+    assert winner['time'] >= 0, winner
+    # reuse the winning order
+    configs = [dict(order=winner['order'])]
+    (z_, _, _), winner = portfolio.solve(aut, configs=configs)
+    assert z == z_
+    assert winner['index'] == 0, winner
+    # Rabin
+    aut = _game(trl.default_rabin_automaton())
+    aut.win['<>[]'] = aut.bdds_from('y > 3')
+    aut.win['[]<>'] = aut.bdds_from('y = 7')
+    zk, _, _ = gr1.solve_rabin_game(aut)
+    (zk_, _, _), _ = portfolio.solve(
+        aut, game='rabin', configs=configs[:1], workers=1)
+    assert zk == zk_, (zk, zk_)
+
+
+def test_solve_failures():
+    aut = _game(trl.default_streett_automaton())
+    configs = [
+        dict(order='unknown'),
+        dict(order=['x_0'])]
+    with assert_raises(Exception) as cm:
+        portfolio.solve(aut, configs=configs, workers=1)
+    msg = str(cm.exception)
+    assert 'all configurations failed' in msg, msg
+    assert "configuration 0 {'order': 'unknown'}: " in msg, msg
+    assert 'configuration 1 ' in msg, msg
+    assert 'AssertionError' in msg, msg
+
+
+def test_pick_order():
+    aut = trl.Automaton()
+    aut.declare_variables(x=(0, 3), b='bool', a=(0, 1))
+    aut.varlist = dict(env=['x'], sys=['b', 'a'])
+    spec = transfer.dumps_automaton(aut)
+    order = portfolio.pick_order(dict(order='natural'), spec)
+    order_ = ['a_0', "a_0'", 'b', "b'",
+              'x_0', "x_0'", 'x_1', "x_1'"]
+    assert order == order_, order
+    order = portfolio.pick_order(dict(order='env_first'), spec)
+    assert order[:4] == order_[4:], order
+    order = portfolio.pick_order(dict(order='given'), spec)
+    assert order == spec['bits'], order
+    order = portfolio.pick_order(dict(order='random', seed=0), spec)
+    assert sorted(order) == sorted(order_), order
+
+
+def _game(aut):
+    aut.declare_variables(x=(0, 3), y=(0, 7), b='bool')
+    aut.varlist = dict(env=['x', 'b'], sys=['y'])
+    aut.action['env'] = aut.add_expr(
+        "(x' = x + 1) \\/ (x' = 0) \\/ (x' = x)")
+    aut.action['sys'] = aut.add_expr(
+        "(y' = y + 1) \\/ (y' = y - 1) \\/ (b /\\ (y' = x))")
+    aut.win['<>[]'] = aut.bdds_from('~ b', 'x < 3')
+    aut.win['[]<>'] = aut.bdds_from('y = 7', 'y = 0', 'y = 4')
+    return aut
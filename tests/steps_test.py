@@ -1,6 +1,8 @@
 """Test the module `omega.steps`."""
+import networkx as nx
 from nose import tools as nt
 from omega import steps
+from omega.games import enumeration as enum
 from omega.symbolic import temporal as trl
 
 
@@ -24,6 +26,28 @@ def test_step():
         stepper.step(state)
 
 
+def test_enum_strategy_stepper():
+    g = nx.DiGraph()
+    g.add_node(0, x=False, y=1)
+    g.add_node(1, x=True, y=2)
+    g.add_node(2, x=False, y=3)
+    g.add_edges_from([(0, 1), (1, 2), (2, 0)])
+    g.initial_nodes = {0}
+    g.inputs = ['x']
+    g.outputs = ['y']
+    h = enum.networkx_to_compact(g)
+    for graph in (g, h):
+        stepper = steps.EnumStrategyStepper(graph)
+        r = stepper.init()
+        assert r == dict(y=1), r
+        r = stepper.step(dict(x=True, y=2))
+        assert r == dict(y=3), r
+        r = stepper.step(dict(x=False, y=3))
+        assert r == dict(y=1), r
+        with nt.assert_raises(ValueError):
+            stepper.step(dict(x=True, y=3))
+
+
 def test_omit_prefix():
     d = {'a': 1, 'foo_mem': 3}
     prefix = 'foo'
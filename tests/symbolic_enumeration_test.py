@@ -1,4 +1,6 @@
 """Test `omega.symbolic.enumeration."""
+import io
+import json
 import logging
 
 import networkx as nx
@@ -28,6 +30,65 @@ def test_relation_to_graph():
     assert r == r_, r
 
 
+def test_iter_relation_edges():
+    a = symbolic.Automaton()
+    a.vars['x'] = dict(type='int', dom=(0, 5), owner='sys')
+    a.vars['y'] = dict(type='bool', owner='sys')
+    aut = a.build()
+    u = aut.add_expr("(x = 4) & y & (x' = 0)")
+    care_bits = aut.bdd.vars
+    edges = list(enum.iter_relation_edges(
+        u, aut, care_bits=care_bits))
+    assert len(edges) == 2, edges
+    g = enum.relation_to_graph(
+        u, aut, care_bits=care_bits)
+    for u, v, du, dv in edges:
+        assert g.has_edge(u, v), (u, v)
+        assert du == g.nodes[u], du
+        assert dv == g.nodes[v], dv
+
+
+def test_dump_steps():
+    steps = [
+        (None, 0, None, dict(x=1, y=True)),
+        (0, 1, dict(x=1, y=True), dict(x=2, y=False)),
+        (1, 0, dict(x=2, y=False), dict(x=1, y=True))]
+    keys = ['x', 'y']
+    # CSV
+    f = io.StringIO()
+    n = enum.dump_steps_csv(steps, f, keys)
+    assert n == 3, n
+    lines = f.getvalue().splitlines()
+    lines_ = [
+        "source,target,x,y,x',y'",
+        ',0,,,1,True',
+        '0,1,1,True,2,False',
+        '1,0,2,False,1,True']
+    assert lines == lines_, lines
+    # JSON lines
+    f = io.StringIO()
+    n = enum.dump_steps_jsonl(steps, f)
+    assert n == 3, n
+    r = [json.loads(line) for line in f.getvalue().splitlines()]
+    r_ = [
+        dict(source=u, target=v, source_state=du, target_state=dv)
+        for u, v, du, dv in steps]
+    assert r == r_, r
+    # graph
+    g = enum.steps_to_graph(steps)
+    assert g.initial_nodes == {0}, g.initial_nodes
+    assert set(g.edges()) == {(0, 1), (1, 0)}, g.edges()
+    assert g.nodes[1] == dict(x=2, y=False), g.nodes[1]
+    # arrays
+    states, sources, targets, init = enum.steps_to_arrays(
+        steps, keys)
+    assert states == [(1, True), (2, False)], states
+    assert list(sources) == [0, 1], sources
+    assert list(targets) == [1, 0], targets
+    assert sources.typecode == enum.INT_TYPECODE, sources.typecode
+    assert init == {0}, init
+
+
 def test_enumerate_int():
     b = [0, 0, 0]
     k = _enum_int(b)
@@ -0,0 +1,86 @@
+"""Test `omega.symbolic.transfer`."""
+import pickle
+import sys
+
+from dd import autoref
+
+from omega.symbolic import partition as prt
+from omega.symbolic import temporal as trl
+from omega.symbolic import transfer
+
+
+def test_dumps_bdds():
+    bdd = autoref.BDD()
+    bdd.declare('x', 'y', 'z')
+    exprs = dict(
+        a=r'(x /\ ~ y) \/ z',
+        b=r'~ ((x /\ ~ y) \/ z)',
+        c='~ x', d='TRUE', e='FALSE')
+    roots = {k: bdd.add_expr(e) for k, e in exprs.items()}
+    table = transfer.dumps_bdds(roots, bdd)
+    table = pickle.loads(pickle.dumps(table))
+    # shared nodes appear once
+    assert len(table['nodes']) == 4, table
+    # other variable order
+    other = autoref.BDD()
+    other.declare('z', 'y', 'x')
+    d = transfer.loads_bdds(table, other)
+    assert set(d) == set(exprs), d
+    for k, e in exprs.items():
+        assert d[k] == other.add_expr(e), k
+
+
+def test_dumps_bdds_deep():
+    # deeper than the recursion limit
+    n = 3 * sys.getrecursionlimit()
+    bits = ['x{i}'.format(i=i) for i in range(n)]
+    bdd = autoref.BDD()
+    bdd.declare(*bits)
+    other = autoref.BDD()
+    other.declare(*bits)
+    u = _chain(bits, bdd)
+    table = transfer.dumps_bdds(dict(u=u), bdd)
+    assert len(table['nodes']) == n, len(table['nodes'])
+    d = transfer.loads_bdds(table, other)
+    assert d['u'] == _chain(bits, other)
+
+
+def _chain(bits, bdd):
+    """Return BDD with one node per bit, and negated edges."""
+    u = bdd.true
+    for i, bit in reversed(list(enumerate(bits))):
+        v = bdd.var(bit)
+        u = (v & u) if i % 2 else (v | ~ u)
+    return u
+
+
+def test_dumps_automaton():
+    aut = trl.default_streett_automaton()
+    aut.declare_variables(x=(0, 3), y='bool')
+    aut.varlist = dict(env=['x'], sys=['y'])
+    aut.moore = False
+    aut.compiler = 'bdd'
+    aut.orders = dict(k=['x_0', 'x_1', 'y'])
+    aut.action['sys'] = ["x' = x + 1", "y' <=> ~ y"]
+    aut.win['[]<>'] = aut.bdds_from('x = 2')
+    u = aut.add_expr('x < 2')
+    spec = transfer.dumps_automaton(aut, roots=dict(u=u))
+    spec = pickle.loads(pickle.dumps(spec))
+    other, roots = transfer.loads_automaton(spec)
+    assert other.bdd is not aut.bdd
+    assert other.vars == aut.vars, other.vars
+    assert other.varlist == aut.varlist, other.varlist
+    assert other.moore is False, other.moore
+    assert other.plus_one is True, other.plus_one
+    assert other.compiler == 'bdd', other.compiler
+    assert other.orders == aut.orders, other.orders
+    assert other.orders is not aut.orders
+    assert set(roots) == {'u'}, roots
+    assert roots['u'] == other.add_expr('x < 2')
+    assert other.action['env'] == other.true
+    action = other.action['sys']
+    assert isinstance(action, prt.Partition), action
+    v = other.add_expr(r"(x' = x + 1) /\ (y' <=> ~ y)")
+    assert action.conjunction() == v
+    assert other.win['[]<>'] == [other.add_expr('x = 2')]
+    assert other.win['<>[]'] == [other.false]